@@ -53,7 +53,17 @@ Classes Description:
 """
 
 import argparse
+import sys
+from executors.closure_executor import ClosureExecutor
+from executors.executor import Executor
+from executors.instruction_profiler import InstructionProfiler
+from executors.output_writer import DEFAULT_BUFFER_SIZE, OutputWriter
+from optimizers.constant_folder import ConstantFolder
+from optimizers.dead_code_eliminator import DeadCodeEliminator
 from runners.asl_runner import AslRunner
+from runners.batch_runner import BatchRunner, find_scripts, write_summary
+from runners.bytecode_cache import BytecodeCache
+from runners.stage_timings import StageTimings
 from exceptions.language_exception import SyntaxError, UnknownVariable
 
 def main():
@@ -76,21 +86,189 @@ def main():
                         nargs=argparse.OPTIONAL,
                         )
 
+    # Argument identifier: --cache
+    # Load compiled program from cache and store it there, source code is always
+    # compiled if not set.
+    args_parser.add_argument('--cache',
+                        action='store_true',
+                        help='use compiled programs cache',
+                        )
+
+    # Argument identifier: --cache-dir
+    # Folder to store compiled programs in, enables --cache, default is ~/.cache/asl.
+    args_parser.add_argument('--cache-dir',
+                        default=None,
+                        help='compiled programs cache folder',
+                        )
+
+    # Argument identifier: --transpile
+    # Run program as a python function instead of executing instructions.
+    args_parser.add_argument('--transpile',
+                        action='store_true',
+                        help='transpile program into python function',
+                        )
+
+    # Argument identifier: --engine
+    # Execute instructions list, or execution tree statements as closures.
+    args_parser.add_argument('--engine',
+                        default='instructions',
+                        choices=['instructions', 'closures'],
+                        help='program execution engine',
+                        )
+
+    # Argument identifier: --fold-constants
+    # Fold constant expressions and conditions of execution tree before running it.
+    args_parser.add_argument('--fold-constants',
+                        action='store_true',
+                        help='fold constant expressions and conditions',
+                        )
+
+    # Argument identifier: --eliminate-dead-code
+    # Fold constants, then remove statements that never run and unused variables.
+    args_parser.add_argument('--eliminate-dead-code',
+                        action='store_true',
+                        help='fold constants and remove dead code',
+                        )
+
+    # Argument identifier: --profile
+    # Count and time executed instructions, report slowest source lines after program ends.
+    args_parser.add_argument('--profile',
+                        action='store_true',
+                        help='report execution count and time of source lines',
+                        )
+
+    # Argument identifier: --output-buffer-size
+    # Number of echoed characters written at once, 0 writes each line when it is echoed.
+    args_parser.add_argument('--output-buffer-size',
+                        type=int,
+                        default=DEFAULT_BUFFER_SIZE,
+                        help='number of buffered output characters, 0 to write each line',
+                        )
+
+    # Argument identifier: --timings
+    # Report time, memory and result size of each stage after program ends, as text or json.
+    args_parser.add_argument('--timings',
+                        default=None,
+                        const='text',
+                        nargs=argparse.OPTIONAL,
+                        choices=['text', 'json'],
+                        help='report time and memory of lexer, parser, compiler, generator and executor',
+                        )
+
+    # Argument identifier: --no-trace-memory
+    # Measure stage timings without tracing memory, tracing slows stages down.
+    args_parser.add_argument('--no-trace-memory',
+                        action='store_true',
+                        help='do not trace peak memory of --timings stages',
+                        )
+
+    # Argument identifier: --batch
+    # Run many source files, glob patterns or folders in parallel instead of --filename.
+    args_parser.add_argument('--batch',
+                        default=None,
+                        nargs='+',
+                        metavar='PATTERN',
+                        help='source files, glob patterns or folders to run in parallel',
+                        )
+
+    # Argument identifier: --workers
+    # Number of --batch worker processes, default is number of CPUs.
+    args_parser.add_argument('--workers',
+                        type=int,
+                        default=None,
+                        help='number of batch worker processes',
+                        )
+
+    # Argument identifier: --summary
+    # JSON file to write --batch summary to, summary is printed if not set.
+    args_parser.add_argument('--summary',
+                        default=None,
+                        help='batch JSON summary file',
+                        )
+
+    # Argument identifier: --output-dir
+    # Folder to write output of each --batch script to, output is in summary if not set.
+    args_parser.add_argument('--output-dir',
+                        default=None,
+                        help='folder to write output of each batch script to',
+                        )
+
     args = args_parser.parse_args()
 
+    if args.batch:
+        if args.profile or args.timings:
+            args_parser.error("--profile and --timings can't be used with --batch")
+        sys.exit(run_batch(args))
+
+    if args.profile and (args.transpile or args.engine == 'closures'):
+        args_parser.error("--profile profiles instructions, it can't be used with "
+                          "--transpile or closures engine")
+
     filename = args.filename
 
     # if file name not provided, raise exception
     if not filename:
         raise Exception(f"file {filename} does not exist")
 
-    # Read Text File and store in text string
-    code = ""
-    with open(filename) as file:
-        for line in file:
-            code += line
+    cache = None
+    if args.cache or args.cache_dir:
+        cache = BytecodeCache(args.cache_dir)
+
+    output = OutputWriter(buffer_size=args.output_buffer_size)
+    profiler = InstructionProfiler() if args.profile else None
+    if args.engine == 'closures':
+        executor = ClosureExecutor(output=output)
+    else:
+        executor = Executor(profiler=profiler, output=output)
+
+    tree_optimizers = []
+    if args.fold_constants or args.eliminate_dead_code:
+        tree_optimizers.append(ConstantFolder())
+    if args.eliminate_dead_code:
+        tree_optimizers.append(DeadCodeEliminator())
+
+    timings = None
+    if args.timings:
+        timings = StageTimings(trace_memory=not args.no_trace_memory)
+
+    # Source file is read in chunks while it is tokenized and parsed
+    AslRunner(executor=executor,
+              tree_optimizers=tree_optimizers,
+              cache=cache,
+              transpile=args.transpile,
+              timings=timings).run_file(filename)
+
+    if timings:
+        # Report is written to stderr, it is not part of program output
+        print(timings.to_json() if args.timings == 'json' else timings.report(),
+              file=sys.stderr)
+
+    if profiler:
+        # Report is written to stderr, it is not part of program output
+        print(profiler.report(source_file=filename), file=sys.stderr)
+
+
+def run_batch(args):
+    """ Runs source files of --batch patterns in parallel and writes JSON summary
+    Args:
+        args: parsed command line arguments
+    Returns:
+        exit code, 1 if a script failed, 0 otherwise
+    """
+
+    batch_runner = BatchRunner(args.workers,
+                               engine=args.engine,
+                               transpile=args.transpile,
+                               fold_constants=args.fold_constants,
+                               eliminate_dead_code=args.eliminate_dead_code,
+                               cache=bool(args.cache or args.cache_dir),
+                               cache_dir=args.cache_dir,
+                               output_buffer_size=args.output_buffer_size)
+
+    summary = batch_runner.run(find_scripts(args.batch), args.output_dir)
+    write_summary(summary, args.summary)
 
-    AslRunner().run(code)
+    return 1 if summary['failed'] else 0
 
 
 if __name__ == "__main__":
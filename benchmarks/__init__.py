@@ -0,0 +1,10 @@
+"""
+
+Benchmarks Library
+
+Contains scripts that measure the performance of the language stages,
+run them from the repository root, for example:
+
+    python3 -m benchmarks.lexer_benchmark
+
+"""
@@ -0,0 +1,56 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Benchmark Utilities
+
+Contains helpers shared by benchmark scripts
+
+"""
+
+import glob
+import time
+
+CORPUS_FOLDER = "asl_files"
+
+
+def build_corpus(target_size: int, folder=CORPUS_FOLDER) -> str:
+    """ Builds a source text out of the sample asl files, repeated until
+        the text is at least target_size characters long
+    Args:
+        target_size: minimum size of the corpus in characters
+        folder: folder that contains .asl sample files
+    Returns:
+        corpus text
+    """
+
+    sample = ""
+    for filename in sorted(glob.glob(f"{folder}/*.asl")):
+        with open(filename) as file:
+            # make sure files don't merge into each other's last line
+            sample += file.read() + "\n"
+
+    if not sample:
+        raise Exception(f"no .asl files found in {folder}")
+
+    repeat = target_size // len(sample) + 1
+    return sample * repeat
+
+
+def time_call(function, repeat=3):
+    """ Measures the best wall time of calling function
+    Args:
+        function: function without arguments to be timed
+        repeat: number of times to call function
+    Returns:
+        best wall time in seconds
+    """
+
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
@@ -0,0 +1,138 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Compiler Benchmark
+
+Compiles generated programs with many statements and deeply nested if, while
+and for statements. Statements are parsed before timing, only the compiler is
+timed, it builds the execution tree, its scopes and symbols tables and
+resolves variables to symbol slots.
+
+Usage:
+    python3 -m benchmarks.compiler_benchmark --statements 100000 --depths 4 16 64
+
+"""
+
+import argparse
+
+from benchmarks.benchmark_utils import time_call
+from compiler.compiler import Compiler
+from lexer.enhanced_lexer import EnhancedLexer
+from parser.enhanced_parser import EnhancedParser
+
+
+def nested_block(depth: int, level: int, lines: list):
+    """ Generates statements nested depth levels, each level is an if, while or
+        for statement that assigns variables of its own and of outer levels
+        (Recursive Method)
+    Args:
+        depth: number of nested levels
+        level: current level
+        lines: list to add code lines to
+    Returns:
+        None
+    """
+
+    indent = "    " * level
+
+    if level == depth:
+        lines.append(f"{indent}total += v{level - 1}")
+        return
+
+    variable = f"v{level}"
+    kind = level % 3
+
+    if kind == 0:
+        lines.append(f"{indent}if (total < {level})")
+    elif kind == 1:
+        lines.append(f"{indent}while (total < {level})")
+    else:
+        lines.append(f"{indent}for (i{level} = 0; i{level} < {level}; i{level} += 1)")
+
+    lines.append(f"{indent}    {variable} = {level} * 2")
+    lines.append(f"{indent}    total = total + {variable}")
+    nested_block(depth, level + 1, lines)
+    lines.append(f'{indent}    echo "{{{variable}}}"')
+
+    if kind == 0:
+        lines.append(f"{indent}else")
+        lines.append(f"{indent}    {variable} = 0")
+        lines.append(f"{indent}fi")
+    elif kind == 1:
+        lines.append(f"{indent}endwhile")
+    else:
+        lines.append(f"{indent}endfor")
+
+
+def nested_program(statements: int, depth: int) -> str:
+    """ Generates program of nested blocks repeated until it has the number of
+        statements
+    Args:
+        statements: minimum number of statements
+        depth: number of nested levels of each block
+    Returns:
+        program code
+    """
+
+    lines = ["total = 0"]
+
+    while len(lines) < statements:
+        nested_block(depth, 0, lines)
+
+    return "\n".join(lines) + "\n"
+
+
+def benchmark_compiler(statements: int, depths: list, repeat: int):
+    """ Runs compiler benchmark and prints one row per nesting depth
+    Args:
+        statements: minimum number of statements of generated programs
+        depths: list of nesting depths
+        repeat: number of runs per measurement, best run is reported
+    Returns:
+        list of result dictionaries
+    """
+
+    results = []
+    print(f"{'depth':>6} {'statements':>11} {'compile (s)':>12} {'statements/s':>13}")
+
+    for depth in depths:
+        code = nested_program(statements, depth)
+
+        # compiler changes statements, each run compiles statements parsed again
+        parsed_programs = [EnhancedParser().parse(EnhancedLexer().tokenize_text(code))
+                           for _ in range(repeat + 1)]
+        statements_count = len(parsed_programs[0])
+
+        Compiler().compile(parsed_programs.pop())
+        compile_time = time_call(lambda: Compiler().compile(parsed_programs.pop()), repeat)
+
+        result = {
+            'depth': depth,
+            'statements': statements_count,
+            'compile': compile_time,
+        }
+        results.append(result)
+        print(f"{depth:>6} {statements_count:>11} {compile_time:>12.3f} "
+              f"{statements_count / compile_time:>13.0f}")
+
+    return results
+
+
+def main():
+    """ Compiler Benchmark main function """
+
+    args_parser = argparse.ArgumentParser("Asl Compiler Benchmark")
+    args_parser.add_argument('--statements', type=int, default=100000,
+                             help='minimum number of statements of generated programs')
+    args_parser.add_argument('--depths', type=int, nargs='+', default=[4, 16, 64],
+                             help='nesting depths of generated programs')
+    args_parser.add_argument('--repeat', type=int, default=3,
+                             help='runs per measurement, best run is reported')
+    args = args_parser.parse_args()
+
+    benchmark_compiler(args.statements, args.depths, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
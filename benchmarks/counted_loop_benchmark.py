@@ -0,0 +1,78 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Counted Loop Benchmark
+
+Compares executing for loops as counted loops, by one counted loop instruction
+per iteration, to executing loop increment, goto and loop condition jump
+instructions. Programs are compiled before timing.
+
+Usage:
+    python3 -m benchmarks.counted_loop_benchmark --iterations 50000
+    python3 -m benchmarks.counted_loop_benchmark --files prime fibonacci
+
+"""
+
+import argparse
+
+from benchmarks.benchmark_utils import CORPUS_FOLDER
+from benchmarks.engine_benchmark import loop_programs
+from benchmarks.executor_benchmark import CountingExecutor, execute_program
+
+
+def benchmark_counted_loops(programs: dict, repeat: int, program_input: str, optimize: bool):
+    """ Runs counted loop benchmark and prints one row per program
+    Args:
+        programs: dictionary of program name to code
+        repeat: number of runs per program, best run is reported
+        program_input: text used as keyboard input
+        optimize: if True, instructions are optimized before executing
+    Returns:
+        None
+    """
+
+    print(f"{'program':>14} {'loops':>8} {'instructions':>13} {'time (ms)':>10} {'speedup':>8}")
+
+    for name, code in programs.items():
+        base_time = None
+
+        for mode, counted_loops in (("for", False), ("counted", True)):
+            counting_executor = CountingExecutor()
+            execute_program(code, counting_executor, program_input, optimize, counted_loops)
+
+            best = min(execute_program(code, CountingExecutor(), program_input, optimize, counted_loops)
+                       for _ in range(repeat))
+            if base_time is None:
+                base_time = best
+
+            print(f"{name:>14} {mode:>8} {counting_executor.executed_instructions:>13} "
+                  f"{best * 1000:>10.2f} {base_time / best:>7.1f}x")
+
+
+def main():
+    """ Counted Loop Benchmark main function """
+
+    args_parser = argparse.ArgumentParser("Asl Counted Loop Benchmark")
+    args_parser.add_argument('--iterations', type=int, default=20000,
+                             help='iterations of generated loop programs')
+    args_parser.add_argument('--files', nargs='*', default=[],
+                             help='sample programs names in asl_files folder')
+    args_parser.add_argument('--repeat', type=int, default=3,
+                             help='runs per program, best run is reported')
+    args_parser.add_argument('--input', default="5\n3\n1\n8\n2\n4\n",
+                             help='keyboard input of programs')
+    args_parser.add_argument('--optimize', action='store_true',
+                             help='optimize instructions by peephole optimizer')
+    args = args_parser.parse_args()
+
+    programs = loop_programs(args.iterations)
+    for name in args.files:
+        with open(f"{CORPUS_FOLDER}/{name}.asl") as file:
+            programs[name] = file.read()
+
+    benchmark_counted_loops(programs, args.repeat, args.input, args.optimize)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Echo Benchmark
+
+Measures how many echoed lines per second the executor writes, when each line
+is printed like the executor printed lines before output was buffered, and
+when lines are buffered by OutputWriter with different buffer sizes. Lines are
+written to an in memory io.StringIO, to a file, and to a line buffered file
+that writes each line like a terminal does.
+
+Usage:
+    python3 -m benchmarks.echo_benchmark --lines 200000 --buffer-sizes 0 4096 65536
+
+"""
+
+import argparse
+import io
+import os
+
+from benchmarks.benchmark_utils import time_call
+from benchmarks.executor_benchmark import compile_program
+from executors.executor import Executor
+from executors.output_writer import OutputWriter
+
+
+class PrintOutputWriter(OutputWriter):
+    """ Output writer that prints each line, like echo before output was buffered """
+
+    def write_line(self, line: str):
+        """ Print line to sink
+        Args:
+            line: line text
+        Returns:
+            None
+        """
+
+        print(line, file=self.sink)
+
+
+def echo_program(lines: int) -> str:
+    """ Generates program that echoes lines with a variable
+    Args:
+        lines: number of echoed lines
+    Returns:
+        program code
+    """
+
+    return f"""
+for (i = 0; i < {lines}; i += 1)
+    echo "line {{i}} of echo benchmark output"
+endfor
+"""
+
+
+def open_sink(name: str):
+    """ Opens output sink
+    Args:
+        name: stringio, file or terminal
+    Returns:
+        file like object
+    """
+
+    if name == "stringio":
+        return io.StringIO()
+    if name == "file":
+        return open(os.devnull, "w")
+    return open(os.devnull, "w", buffering=1)
+
+
+def benchmark_echo(lines: int, buffer_sizes: list, sinks: list, repeat: int):
+    """ Runs echo benchmark and prints one row per sink and writer
+    Args:
+        lines: number of echoed lines
+        buffer_sizes: list of OutputWriter buffer sizes
+        sinks: list of sink names
+        repeat: number of runs per measurement, best run is reported
+    Returns:
+        list of result dictionaries
+    """
+
+    instructions, execution_tree = compile_program(echo_program(lines))
+
+    writers = [("print", lambda sink: PrintOutputWriter(sink))]
+    writers += [(f"buffer {buffer_size}",
+                 lambda sink, buffer_size=buffer_size: OutputWriter(sink, buffer_size))
+                for buffer_size in buffer_sizes]
+
+    results = []
+    print(f"{'sink':>9} {'writer':>13} {'time (ms)':>10} {'lines/s':>10} {'speedup':>8}")
+
+    for sink_name in sinks:
+        print_time = None
+
+        for writer_name, writer in writers:
+
+            def run():
+                sink = open_sink(sink_name)
+                try:
+                    Executor(output=writer(sink)).execute(instructions, execution_tree)
+                finally:
+                    if sink_name != "stringio":
+                        sink.close()
+
+            elapsed = time_call(run, repeat)
+            print_time = print_time or elapsed
+
+            results.append({'sink': sink_name, 'writer': writer_name, 'time': elapsed})
+            print(f"{sink_name:>9} {writer_name:>13} {elapsed * 1000:>10.1f} "
+                  f"{lines / elapsed:>10.0f} {print_time / elapsed:>7.2f}x")
+
+    return results
+
+
+def main():
+    """ Echo Benchmark main function """
+
+    args_parser = argparse.ArgumentParser("Asl Echo Benchmark")
+    args_parser.add_argument('--lines', type=int, default=200000,
+                             help='number of echoed lines')
+    args_parser.add_argument('--buffer-sizes', type=int, nargs='+', default=[0, 4096, 65536],
+                             help='output writer buffer sizes')
+    args_parser.add_argument('--sinks', nargs='+', default=['stringio', 'file', 'terminal'],
+                             choices=['stringio', 'file', 'terminal'],
+                             help='output sinks')
+    args_parser.add_argument('--repeat', type=int, default=3,
+                             help='runs per measurement, best run is reported')
+    args = args_parser.parse_args()
+
+    benchmark_echo(args.lines, args.buffer_sizes, args.sinks, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
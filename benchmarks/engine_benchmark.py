@@ -0,0 +1,136 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Engine Benchmark
+
+Compares execution time of the instructions Executor and the ClosureExecutor
+on loop heavy programs. Programs are compiled before timing, closures executor
+time includes building closures.
+
+Usage:
+    python3 -m benchmarks.engine_benchmark --iterations 50000
+    python3 -m benchmarks.engine_benchmark --files prime fibonacci
+
+"""
+
+import argparse
+
+from benchmarks.benchmark_utils import CORPUS_FOLDER
+from benchmarks.executor_benchmark import execute_program
+from executors.closure_executor import ClosureExecutor
+from executors.executor import Executor
+
+ENGINES = {
+    "executor": Executor,
+    "closures": ClosureExecutor,
+}
+
+
+def loop_programs(iterations: int) -> dict:
+    """ Builds loop heavy programs
+    Args:
+        iterations: number of iterations of outer loops
+    Returns:
+        dictionary of program name to code
+    """
+
+    counting_loop = (
+        "sum = 0\n"
+        "count = 0\n"
+        f"for (i = 0; i < {iterations}; i += 1)\n"
+        "    sum += i * 2\n"
+        "    if ((i % 3) == 0)\n"
+        "        count += 1\n"
+        "    endif\n"
+        "endfor\n"
+        'echo "{sum} {count}"\n'
+    )
+
+    nested_loops = (
+        "total = 0\n"
+        f"for (i = 0; i < {max(iterations // 100, 1)}; i += 1)\n"
+        "    for (j = 0; j < 100; j += 1)\n"
+        "        if (j == 50)\n"
+        "            continue\n"
+        "        endif\n"
+        "        total += j\n"
+        "    endfor\n"
+        "endfor\n"
+        'echo "{total}"\n'
+    )
+
+    while_loop = (
+        "n = 0\n"
+        "even = 0\n"
+        f"while (n < {iterations})\n"
+        "    n += 1\n"
+        "    if ((n % 2) == 0)\n"
+        "        even += 1\n"
+        "    elif (n > 1000000)\n"
+        "        break\n"
+        "    else\n"
+        "        even = even\n"
+        "    endif\n"
+        "endwhile\n"
+        'echo "{n} {even}"\n'
+    )
+
+    return {
+        "counting_loop": counting_loop,
+        "nested_loops": nested_loops,
+        "while_loop": while_loop,
+    }
+
+
+def benchmark_engines(programs: dict, repeat: int, program_input: str):
+    """ Runs engines benchmark and prints one row per program
+    Args:
+        programs: dictionary of program name to code
+        repeat: number of runs per program and engine, best run is reported
+        program_input: text used as keyboard input
+    Returns:
+        None
+    """
+
+    header = f"{'program':>14}"
+    for engine in ENGINES:
+        header += f" {engine + ' (ms)':>15}"
+    print(header + f" {'speedup':>8}")
+
+    for name, code in programs.items():
+        times = []
+        for engine_class in ENGINES.values():
+            times.append(min(execute_program(code, engine_class(), program_input)
+                             for _ in range(repeat)))
+
+        row = f"{name:>14}"
+        for engine_time in times:
+            row += f" {engine_time * 1000:>15.2f}"
+        print(row + f" {times[0] / times[-1]:>7.1f}x")
+
+
+def main():
+    """ Engine Benchmark main function """
+
+    args_parser = argparse.ArgumentParser("Asl Engine Benchmark")
+    args_parser.add_argument('--iterations', type=int, default=20000,
+                             help='iterations of generated loop programs')
+    args_parser.add_argument('--files', nargs='*', default=[],
+                             help='sample programs names in asl_files folder')
+    args_parser.add_argument('--repeat', type=int, default=3,
+                             help='runs per program, best run is reported')
+    args_parser.add_argument('--input', default="5\n3\n1\n8\n2\n4\n",
+                             help='keyboard input of programs')
+    args = args_parser.parse_args()
+
+    programs = loop_programs(args.iterations)
+    for name in args.files:
+        with open(f"{CORPUS_FOLDER}/{name}.asl") as file:
+            programs[name] = file.read()
+
+    benchmark_engines(programs, args.repeat, args.input)
+
+
+if __name__ == "__main__":
+    main()
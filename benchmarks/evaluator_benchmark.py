@@ -0,0 +1,96 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Evaluator Benchmark
+
+Measures evaluating conditions in a tight loop by the evaluator with its LRU
+caches of RPN programs and compiled texts, and with caches of size 0:
+
+    same text: the same condition text with variables values passed as parameters
+    substituted: variables values substituted in the condition text, every
+                 iteration has a different text with the same shape
+
+Usage:
+    python3 -m benchmarks.evaluator_benchmark --iterations 20000
+
+"""
+
+import argparse
+
+from benchmarks.benchmark_utils import time_call
+from expression_evaluators.expression_evaluator import DEFAULT_RPN_CACHE_SIZE, Evaluator
+
+CONDITION = "(i < n) & ((i % 3) == 0) | (i * 2 > n - 10)"
+
+
+def evaluate_same_text(evaluator, iterations):
+    """ Evaluates condition text with variables values as parameters
+    Args:
+        evaluator: expression evaluator
+        iterations: number of evaluations
+    Returns:
+        None
+    """
+
+    variables = {"n": iterations}
+    for i in range(iterations):
+        variables["i"] = i
+        evaluator.evaluate(CONDITION, variables)
+
+
+def evaluate_substituted(evaluator, iterations):
+    """ Evaluates condition text with variables values substituted in the text
+    Args:
+        evaluator: expression evaluator
+        iterations: number of evaluations
+    Returns:
+        None
+    """
+
+    for i in range(iterations):
+        evaluator.evaluate(CONDITION.replace("i", str(i)).replace("n", str(iterations)))
+
+
+def benchmark_evaluator(iterations, repeat):
+    """ Runs evaluator benchmark and prints one row per loop and cache size
+    Args:
+        iterations: number of evaluations per loop
+        repeat: number of runs, best run is reported
+    Returns:
+        None
+    """
+
+    print(f"{'loop':>12} {'cache':>6} {'time (ms)':>10} {'evaluations/s':>14} "
+          f"{'text hits':>10} {'misses':>7} {'program hits':>13} {'misses':>7}")
+
+    loops = {
+        "same text": evaluate_same_text,
+        "substituted": evaluate_substituted,
+    }
+
+    for loop_name, loop in loops.items():
+        for mode, cache_size in (("none", 0), ("lru", DEFAULT_RPN_CACHE_SIZE)):
+            evaluator = Evaluator(rpn_cache_size=cache_size)
+            best = time_call(lambda: loop(evaluator, iterations), repeat)
+            info = evaluator.rpn_cache_info()
+            print(f"{loop_name:>12} {mode:>6} {best * 1000:>10.2f} {iterations / best:>14.0f} "
+                  f"{info['text_hits']:>10} {info['text_misses']:>7} "
+                  f"{info['program_hits']:>13} {info['program_misses']:>7}")
+
+
+def main():
+    """ Evaluator Benchmark main function """
+
+    args_parser = argparse.ArgumentParser("Asl Evaluator Benchmark")
+    args_parser.add_argument('--iterations', type=int, default=20000,
+                             help='evaluations per loop')
+    args_parser.add_argument('--repeat', type=int, default=3,
+                             help='runs per loop, best run is reported')
+    args = args_parser.parse_args()
+
+    benchmark_evaluator(args.iterations, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
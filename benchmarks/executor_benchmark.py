@@ -0,0 +1,148 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Executor Benchmark
+
+Measures how many instructions per second the executor runs on the sample
+programs. Programs are compiled before timing, only executing instructions
+is timed.
+
+Usage:
+    python3 -m benchmarks.executor_benchmark --files prime grades fibonacci
+    python3 -m benchmarks.executor_benchmark --optimize
+
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+
+from benchmarks.benchmark_utils import CORPUS_FOLDER, time_call
+from compiler.compiler import Compiler
+from executors.executor import Executor
+from instruction_generators.instructions_generator import InstructionsGenerator
+from lexer.enhanced_lexer import EnhancedLexer
+from optimizers.peephole_optimizer import PeepholeOptimizer
+from parser.enhanced_parser import EnhancedParser
+
+
+class CountingExecutor(Executor):
+    """ Executor that counts executed instructions """
+
+    def __init__(self) -> None:
+        """ Counting Executor Class Constructor """
+
+        self.executed_instructions = 0
+        super().__init__()
+
+    def build_dispatch_table(self):
+        """ Wraps every handler to count executed instructions
+        Args:
+            None
+        Returns:
+            dispatch table dictionary
+        """
+
+        def counted(handler):
+            def handle(instruction):
+                self.executed_instructions += 1
+                return handler(instruction)
+            return handle
+
+        dispatch_table = super().build_dispatch_table()
+        return {instruction_type: counted(handler)
+                for instruction_type, handler in dispatch_table.items()}
+
+
+def compile_program(code, optimize=False, counted_loops=True):
+    """ Compiles code into instructions
+    Args:
+        code: asl code
+        optimize: Optional, if True, instructions are optimized by PeepholeOptimizer
+        counted_loops: Optional, if False, counted loop instruction is not generated
+    Returns:
+        (instructions, execution tree)
+    """
+
+    tokens = EnhancedLexer().tokenize_text(code)
+    statements = EnhancedParser().parse(tokens)
+    execution_tree = Compiler().compile(statements)
+    instructions = InstructionsGenerator(counted_loops).generate_instructions(execution_tree)
+    if optimize:
+        instructions = PeepholeOptimizer().optimize(instructions)
+    return instructions, execution_tree
+
+
+def execute_program(code, executor, program_input, optimize=False, counted_loops=True):
+    """ Compiles and executes code, program output is discarded
+    Args:
+        code: asl code
+        executor: executor to run instructions
+        program_input: text used as keyboard input
+        optimize: Optional, if True, instructions are optimized before executing
+        counted_loops: Optional, if False, counted loop instruction is not generated
+    Returns:
+        execution time in seconds
+    """
+
+    instructions, execution_tree = compile_program(code, optimize, counted_loops)
+
+    old_stdin = sys.stdin
+    sys.stdin = io.StringIO(program_input)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return time_call(lambda: executor.execute(instructions, execution_tree), 1)
+    finally:
+        sys.stdin = old_stdin
+
+
+def benchmark_executor(files, repeat, program_input, optimize=False):
+    """ Runs executor benchmark and prints one row per program
+    Args:
+        files: sample programs names in asl_files folder
+        repeat: number of runs per program, best run is reported
+        program_input: text used as keyboard input
+        optimize: Optional, if True, instructions are optimized before executing
+    Returns:
+        None
+    """
+
+    print(f"{'program':>12} {'instructions':>13} {'time (ms)':>10} {'instructions/s':>15}")
+
+    for name in files:
+        with open(f"{CORPUS_FOLDER}/{name}.asl") as file:
+            code = file.read()
+
+        counting_executor = CountingExecutor()
+        execute_program(code, counting_executor, program_input, optimize)
+        executed_instructions = counting_executor.executed_instructions
+
+        best = min(execute_program(code, Executor(), program_input, optimize)
+                   for _ in range(repeat))
+
+        print(f"{name:>12} {executed_instructions:>13} {best * 1000:>10.2f} "
+              f"{executed_instructions / best:>15.0f}")
+
+
+def main():
+    """ Executor Benchmark main function """
+
+    args_parser = argparse.ArgumentParser("Asl Executor Benchmark")
+    args_parser.add_argument('--files', nargs='+',
+                             default=['prime', 'grades', 'fibonacci', 'odd_even', 'while_for'],
+                             help='sample programs names in asl_files folder')
+    args_parser.add_argument('--repeat', type=int, default=5,
+                             help='runs per program, best run is reported')
+    args_parser.add_argument('--input', default="5\n3\n1\n8\n2\n4\n",
+                             help='keyboard input of programs')
+    args_parser.add_argument('--optimize', action='store_true',
+                             help='optimize instructions with peephole optimizer')
+    args = args_parser.parse_args()
+
+    benchmark_executor(args.files, args.repeat, args.input, args.optimize)
+
+
+if __name__ == "__main__":
+    main()
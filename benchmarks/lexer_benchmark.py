@@ -0,0 +1,71 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Lexer Benchmark
+
+Tokenizes the asl_files corpus scaled up to multi-megabyte inputs, and compares
+EnhancedLexer against ElifChainLexer, the EnhancedLexer that checked each
+character with a chain of elif statements before it used a dispatch table.
+
+Usage:
+    python3 -m benchmarks.lexer_benchmark --sizes 1 2 4 --repeat 3
+
+"""
+
+import argparse
+
+from benchmarks.benchmark_utils import build_corpus, time_call
+from benchmarks.elif_chain_lexer import ElifChainLexer
+from lexer.enhanced_lexer import EnhancedLexer
+
+MEGABYTE = 1024 * 1024
+
+
+def benchmark_lexers(sizes, repeat):
+    """ Runs lexers benchmark and prints one row per corpus size
+    Args:
+        sizes: list of corpus sizes in megabytes
+        repeat: number of runs per measurement, best run is reported
+    Returns:
+        list of result dictionaries
+    """
+
+    results = []
+    print(f"{'size (MB)':>10} {'tokens':>10} {'enhanced (s)':>13} {'elif chain (s)':>15} {'speedup':>8}")
+
+    for size in sizes:
+        code = build_corpus(int(size * MEGABYTE))
+
+        tokens_count = len(EnhancedLexer().tokenize_text(code))
+        enhanced_time = time_call(lambda: EnhancedLexer().tokenize_text(code), repeat)
+        elif_chain_time = time_call(lambda: ElifChainLexer().tokenize_text(code), repeat)
+
+        result = {
+            'size': len(code),
+            'tokens': tokens_count,
+            'enhanced_lexer': enhanced_time,
+            'elif_chain_lexer': elif_chain_time,
+        }
+        results.append(result)
+        print(f"{len(code) / MEGABYTE:>10.2f} {tokens_count:>10} {enhanced_time:>13.3f} "
+              f"{elif_chain_time:>15.3f} {elif_chain_time / enhanced_time:>7.1f}x")
+
+    return results
+
+
+def main():
+    """ Lexer Benchmark main function """
+
+    args_parser = argparse.ArgumentParser("Asl Lexer Benchmark")
+    args_parser.add_argument('--sizes', type=float, nargs='+', default=[1, 2, 4],
+                             help='corpus sizes in megabytes')
+    args_parser.add_argument('--repeat', type=int, default=3,
+                             help='runs per measurement, best run is reported')
+    args = args_parser.parse_args()
+
+    benchmark_lexers(args.sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Reuse Benchmark
+
+Measures cost per run of running the same program many times, by building a
+new AslRunner and compiling the code for each run, by running the code with
+the same AslRunner, which compiles it again, and by compiling the code once
+and executing the compiled program with fresh variables for each run.
+
+Usage:
+    python3 -m benchmarks.reuse_benchmark --files prime fibonacci --runs 200
+
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+
+from benchmarks.benchmark_utils import CORPUS_FOLDER
+from runners.asl_runner import AslRunner
+
+
+def time_runs(function, runs: int, program_input: str) -> float:
+    """ Measures average wall time of calling function, program output is
+        discarded
+    Args:
+        function: function without arguments that runs program once
+        runs: number of runs
+        program_input: text used as keyboard input
+    Returns:
+        average wall time per run in seconds
+    """
+
+    old_stdin = sys.stdin
+    sys.stdin = io.StringIO(program_input * runs)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            for _ in range(runs):
+                function()
+            return (time.perf_counter() - start) / runs
+    finally:
+        sys.stdin = old_stdin
+
+
+def benchmark_reuse(files, runs: int, program_input: str):
+    """ Runs reuse benchmark and prints one row per program
+    Args:
+        files: sample programs names in asl_files folder
+        runs: number of runs of each program
+        program_input: text used as keyboard input
+    Returns:
+        list of result dictionaries
+    """
+
+    results = []
+    print(f"{'program':>12} {'rebuild (ms)':>13} {'rerun (ms)':>11} {'compiled (ms)':>14} {'speedup':>8}")
+
+    for name in files:
+        with open(f"{CORPUS_FOLDER}/{name}.asl") as file:
+            code = file.read()
+
+        runner = AslRunner()
+        program = runner.compile(code)
+
+        rebuild = time_runs(lambda: AslRunner().run(code), runs, program_input)
+        rerun = time_runs(lambda: runner.run(code), runs, program_input)
+        compiled = time_runs(lambda: runner.execute(program), runs, program_input)
+
+        results.append({'program': name, 'rebuild': rebuild, 'rerun': rerun, 'compiled': compiled})
+        print(f"{name:>12} {rebuild * 1000:>13.3f} {rerun * 1000:>11.3f} {compiled * 1000:>14.3f} "
+              f"{rebuild / compiled:>7.2f}x")
+
+    return results
+
+
+def main():
+    """ Reuse Benchmark main function """
+
+    args_parser = argparse.ArgumentParser("Asl Reuse Benchmark")
+    args_parser.add_argument('--files', nargs='+',
+                             default=['variable', 'strings', 'grades', 'fibonacci', 'prime'],
+                             help='sample programs names in asl_files folder')
+    args_parser.add_argument('--runs', type=int, default=200,
+                             help='runs of each program')
+    args_parser.add_argument('--input', default="5\n3\n1\n8\n2\n4\n",
+                             help='keyboard input of each run')
+    args = args_parser.parse_args()
+
+    benchmark_reuse(args.files, args.runs, args.input)
+
+
+if __name__ == "__main__":
+    main()
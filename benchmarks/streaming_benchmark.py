@@ -0,0 +1,132 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Streaming Benchmark
+
+Compiles large generated source files with nested statements, by reading the
+whole file and tokenizing it before parsing, and by reading the file in chunks
+that are tokenized and parsed while they are read. Peak memory is measured by
+tracemalloc, compiled programs are kept in memory by both front ends.
+
+Usage:
+    python3 -m benchmarks.streaming_benchmark --statements 100000 400000 --chunk-size 65536
+
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.compiler_benchmark import nested_program
+from compiler.compiler import Compiler
+from lexer.enhanced_lexer import EnhancedLexer
+from parser.enhanced_parser import EnhancedParser
+from runners.source_reader import DEFAULT_CHUNK_SIZE, read_source_chunks
+
+MEGABYTE = 1024 * 1024
+
+
+def compile_text(filename: str, chunk_size: int):
+    """ Reads whole source file, tokenizes it, then parses and compiles tokens
+    Args:
+        filename: source file name
+        chunk_size: not used
+    Returns:
+        execution tree
+    """
+
+    with open(filename) as file:
+        code = file.read()
+
+    tokens = EnhancedLexer().tokenize_text(code)
+    return Compiler().compile(EnhancedParser().parse(tokens))
+
+
+def compile_stream(filename: str, chunk_size: int):
+    """ Reads source file in chunks that are tokenized, parsed and compiled
+        while they are read
+    Args:
+        filename: source file name
+        chunk_size: number of characters read at once
+    Returns:
+        execution tree
+    """
+
+    tokens = EnhancedLexer().tokenize_stream(read_source_chunks(filename, chunk_size))
+    return Compiler().compile(EnhancedParser().parse_statements(tokens))
+
+
+def measure(front_end, filename: str, chunk_size: int):
+    """ Measures wall time and peak memory of compiling source file, time is
+        measured without tracing memory allocations
+    Args:
+        front_end: compile_text or compile_stream
+        filename: source file name
+        chunk_size: number of characters read at once
+    Returns:
+        wall time in seconds, peak memory in bytes
+    """
+
+    start = time.perf_counter()
+    front_end(filename, chunk_size)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    front_end(filename, chunk_size)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def benchmark_streaming(statements: list, chunk_size: int):
+    """ Runs streaming benchmark and prints one row per front end and file size
+    Args:
+        statements: list of minimum number of statements of generated files
+        chunk_size: number of characters read at once
+    Returns:
+        list of result dictionaries
+    """
+
+    results = []
+    print(f"{'statements':>11} {'size (MB)':>10} {'front end':>10} {'time (s)':>9} {'peak (MB)':>10}")
+
+    for statements_count in statements:
+        code = nested_program(statements_count, 8)
+        size = len(code) / MEGABYTE
+
+        with tempfile.NamedTemporaryFile("w", suffix=".asl", delete=False) as file:
+            file.write(code)
+            filename = file.name
+        del code
+
+        try:
+            for name, front_end in (("text", compile_text), ("stream", compile_stream)):
+                elapsed, peak = measure(front_end, filename, chunk_size)
+                results.append({'statements': statements_count, 'size': size,
+                                'front_end': name, 'time': elapsed, 'peak': peak})
+                print(f"{statements_count:>11} {size:>10.2f} {name:>10} {elapsed:>9.2f} "
+                      f"{peak / MEGABYTE:>10.1f}")
+        finally:
+            os.remove(filename)
+
+    return results
+
+
+def main():
+    """ Streaming Benchmark main function """
+
+    args_parser = argparse.ArgumentParser("Asl Streaming Benchmark")
+    args_parser.add_argument('--statements', type=int, nargs='+', default=[25000, 100000],
+                             help='minimum number of statements of generated files')
+    args_parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                             help='number of characters read at once')
+    args = args_parser.parse_args()
+
+    benchmark_streaming(args.statements, args.chunk_size)
+
+
+if __name__ == "__main__":
+    main()
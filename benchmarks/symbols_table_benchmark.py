@@ -0,0 +1,123 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Symbols Table Benchmark
+
+Measures adding, modifying and reading entries of scopes with thousands of
+variables, and memory used by default and array backed symbols tables.
+
+Usage:
+    python3 -m benchmarks.symbols_table_benchmark --sizes 1000 5000 20000
+
+"""
+
+import argparse
+import tracemalloc
+
+from benchmarks.benchmark_utils import time_call
+from symbols.symbols_table import SymbolTable, SymbolsType
+
+
+def build_table(names, array_backed):
+    """ Builds symbols table that contains names
+    Args:
+        names: list of variable names
+        array_backed: symbols table storage mode
+    Returns:
+        symbols table
+    """
+
+    table = SymbolTable(array_backed=array_backed)
+    for name in names:
+        table.add_entry(name, "", SymbolsType.NUMBER)
+    return table
+
+
+def modify_all(table, names):
+    """ Modifies every entry of table
+    Args:
+        table: symbols table
+        names: list of variable names
+    Returns:
+        None
+    """
+
+    for index, name in enumerate(names):
+        table.modify_entry(name, index)
+
+
+def read_all(table, names):
+    """ Reads every entry value of table
+    Args:
+        table: symbols table
+        names: list of variable names
+    Returns:
+        None
+    """
+
+    for name in names:
+        table.get_entry_value(name).value
+
+
+def table_memory(names, array_backed):
+    """ Measures memory allocated by building a symbols table
+    Args:
+        names: list of variable names
+        array_backed: symbols table storage mode
+    Returns:
+        allocated memory in bytes
+    """
+
+    tracemalloc.start()
+    table = build_table(names, array_backed)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del table
+    return memory
+
+
+def benchmark_symbols_table(sizes, repeat):
+    """ Runs symbols table benchmark and prints one row per scope size and mode
+    Args:
+        sizes: list of number of variables in scope
+        repeat: number of runs per measurement, best run is reported
+    Returns:
+        None
+    """
+
+    print(f"{'variables':>10} {'mode':>8} {'add (ns/op)':>12} {'modify (ns/op)':>15} "
+          f"{'read (ns/op)':>13} {'memory (B/var)':>15}")
+
+    for size in sizes:
+        names = [f"var_{index}" for index in range(size)]
+
+        for array_backed in (False, True):
+            table = build_table(names, array_backed)
+
+            add_time = time_call(lambda: build_table(names, array_backed), repeat)
+            modify_time = time_call(lambda: modify_all(table, names), repeat)
+            read_time = time_call(lambda: read_all(table, names), repeat)
+            memory = table_memory(names, array_backed)
+
+            mode = "array" if array_backed else "entries"
+            print(f"{size:>10} {mode:>8} {add_time / size * 1e9:>12.0f} "
+                  f"{modify_time / size * 1e9:>15.0f} {read_time / size * 1e9:>13.0f} "
+                  f"{memory / size:>15.0f}")
+
+
+def main():
+    """ Symbols Table Benchmark main function """
+
+    args_parser = argparse.ArgumentParser("Asl Symbols Table Benchmark")
+    args_parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 5000, 20000],
+                             help='number of variables in scope')
+    args_parser.add_argument('--repeat', type=int, default=5,
+                             help='runs per measurement, best run is reported')
+    args = args_parser.parse_args()
+
+    benchmark_symbols_table(args.sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
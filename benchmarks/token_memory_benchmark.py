@@ -0,0 +1,106 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Token Memory Benchmark
+
+Measures memory per token of tokenizing the asl_files corpus scaled up to
+multi-megabyte inputs by tracemalloc. Tokens of EnhancedLexer are compared to
+the same tokens stored like lexers stored them before tokens had __slots__ and
+lexemes were interned, an object with __dict__ and its own lexeme string.
+
+Usage:
+    python3 -m benchmarks.token_memory_benchmark --sizes 1 4
+
+"""
+
+import argparse
+import tracemalloc
+
+from benchmarks.benchmark_utils import build_corpus
+from lexer.enhanced_lexer import EnhancedLexer
+
+MEGABYTE = 1024 * 1024
+
+
+class DictToken:
+    """ Token stored in an object with __dict__, like lexer tokens before they had __slots__ """
+
+    def __init__(self, token_type, match, line_number) -> None:
+        self.token_type = token_type
+        self.match = match
+        self.line_number = line_number
+
+
+def copy_lexeme(lexeme: str) -> str:
+    """ Copies lexeme into a new string, like slicing the lexeme out of source
+        text, one character strings are shared by python
+    Args:
+        lexeme: lexeme string
+    Returns:
+        new string equal to lexeme
+    """
+
+    return lexeme[:1] + lexeme[1:]
+
+
+def traced_memory(function):
+    """ Measures memory allocated by function that is still allocated after it returns
+    Args:
+        function: function without arguments
+    Returns:
+        function result, allocated bytes
+    """
+
+    tracemalloc.start()
+    result = function()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def benchmark_token_memory(sizes):
+    """ Runs token memory benchmark and prints one row per corpus size
+    Args:
+        sizes: list of corpus sizes in megabytes
+    Returns:
+        list of result dictionaries
+    """
+
+    results = []
+    print(f"{'size (MB)':>10} {'tokens':>10} {'dict (B/token)':>15} {'slots (B/token)':>16} {'saved':>6}")
+
+    for size in sizes:
+        code = build_corpus(int(size * MEGABYTE))
+
+        tokens, tokens_memory = traced_memory(lambda: EnhancedLexer().tokenize_text(code))
+        _, dict_tokens_memory = traced_memory(
+            lambda: [DictToken(token.token_type, copy_lexeme(token.match), token.line_number)
+                     for token in tokens])
+
+        result = {
+            'size': len(code),
+            'tokens': len(tokens),
+            'dict_token_bytes': dict_tokens_memory / len(tokens),
+            'token_bytes': tokens_memory / len(tokens),
+        }
+        results.append(result)
+        print(f"{len(code) / MEGABYTE:>10.2f} {len(tokens):>10} {result['dict_token_bytes']:>15.1f} "
+              f"{result['token_bytes']:>16.1f} {1 - tokens_memory / dict_tokens_memory:>6.0%}")
+
+    return results
+
+
+def main():
+    """ Token Memory Benchmark main function """
+
+    args_parser = argparse.ArgumentParser("Asl Token Memory Benchmark")
+    args_parser.add_argument('--sizes', type=float, nargs='+', default=[1, 4],
+                             help='corpus sizes in megabytes')
+    args = args_parser.parse_args()
+
+    benchmark_token_memory(args.sizes)
+
+
+if __name__ == "__main__":
+    main()
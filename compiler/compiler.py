@@ -11,6 +11,132 @@ Compiles list of statements into execution tree
 from statements.statement import *
 from symbols.symbols_table import SymbolTable
 from exceptions.language_exception import *
+from lexer.lexer import TokenType
+from statements.expression import ExpressionType, expression_parts
+
+# Loop condition operators of counted loops
+COUNTED_LOOP_OPERATORS = ("<", "<=", ">", ">=")
+
+
+def referenced_variables(statement: Statement) -> list:
+    """ Finds names of variables referenced by statement, names are taken from
+        expression trees and echo variables found by the parser
+    Args:
+        statement: statement
+    Returns:
+        list of variable names
+    """
+
+    names = []
+
+    if isinstance(statement, Variable):
+        names.append(statement.variable_name)
+        names.extend(expression_variables(statement.expression_tree))
+
+    elif isinstance(statement, Input):
+        names.append(statement.input_variable)
+
+    elif isinstance(statement, Echo):
+        if statement.echo_variables:
+            names.extend(name for _, name in statement.echo_variables)
+
+    elif isinstance(statement, (For, While, If, ElseIf)):
+        names.extend(expression_variables(statement.expression_tree))
+
+    return names
+
+
+def expression_variables(expression_tree) -> list:
+    """ Finds names of variables in an expression tree
+    Args:
+        expression_tree: expression tree parsed by the parser, None if the
+                         expression is invalid, it will be reported if it is executed
+    Returns:
+        list of variable names
+    """
+
+    if expression_tree is None:
+        return []
+
+    return [part.name for part in expression_parts(expression_tree) if part.__class__ is not str]
+
+
+def find_symbol_slot(name: str, statement):
+    """ Find slot of variable name referenced by statement, slot resolved by the
+        compiler is used, otherwise it is looked up in symbols tables of the
+        statement scopes once and stored in the statement.
+    Args:
+        name: variable name to be found
+        statement: statement that references the variable
+    Returns:
+        SymbolSlot of variable {name}
+    Raises:
+        UnknownVariable: if variable is not found in symbols tables
+    """
+
+    slot = statement.symbol_slots.get(name)
+
+    if slot is None:
+        symbol_table = find_symbols_table(name, statement)
+
+        if not symbol_table:
+            raise UnknownVariable(f"Variable Not Found {name}")
+
+        slot = symbol_table.get_slot(name)
+        statement.symbol_slots[name] = slot
+
+    return slot
+
+
+def find_symbols_table(name: str, statement):
+    """ Find Symbol table that contains variable name
+
+    Args:
+        name: variable name to be found
+        statement: A statement that can be used to lookup symbols table in
+                   the execution tree.
+    Returns:
+        Symbols table that contains variable {name}
+    """
+
+    if (isinstance(statement, For)
+        or isinstance(statement, While)
+        or isinstance(statement, If)
+        or isinstance(statement, ElseIf)
+        or isinstance(statement, Else)
+        or isinstance(statement, ExecutionTree)):
+
+        if (statement.symbols_table
+            and statement.symbols_table.get_entry_value(name)):
+            # if the given statement is a scope statement, then
+            # lookup variable inside it's symbol tables, if it contains the value,
+            # return it directly, otherwise, lookup value in parents symbols tables.
+            return statement.symbols_table
+
+    # Go up one step
+    pointer = statement.parent
+
+    while True:
+
+        if isinstance(pointer, ConditionStatement):
+            # Skip Condition statement as it doesn't contain
+            # Symbols table, it is used only as an aggregator for
+            # if, elseif, else statements
+            pointer = pointer.parent
+
+        if pointer.symbols_table.get_entry_value(name):
+            return pointer.symbols_table
+
+        if isinstance(pointer, ExecutionTree):
+            # if we hit the execution tree, no more parents to check
+            # Should stop here.
+            break
+
+        # Go up one step
+        pointer = pointer.parent
+
+    # If we reach this point, then variable does not exist in symbols tables
+    return None
 
 
 class ExecutionTree:
@@ -39,17 +165,182 @@ class ExecutionTree:
         self.tree.append(statement)
 
 
+class ScopeBuilder:
+    """ Scope Builder Class
+
+    Sets parents of statements, stores variables in symbols tables of their
+    scopes and resolves variables referenced by statements to symbol slots while
+    statements are added to the execution tree. Slots of each variable name in
+    open scopes are kept in a stack, so a variable is found without searching
+    symbols tables of parents.
+
+    Class Attributes:
+        execution_tree: execution tree that statements are added to
+        scopes: open scope statements, execution tree is the first scope
+        written_variables: names of variables assigned in each open scope
+        visible_slots: variable name ---> symbol slots of open scopes that contain
+                       it, innermost scope slot is the last one
+    """
+
+    def __init__(self, execution_tree: ExecutionTree) -> None:
+        """ Scope Builder Class Constructor
+        Args:
+            execution_tree: execution tree
+        """
+
+        self.execution_tree = execution_tree
+        self.scopes = [execution_tree]
+        self.written_variables = [set()]
+        self.visible_slots = {}
+
+    def add_statement(self, statement, parent):
+        """ Set parent of one line statement, store its variable in symbols table
+            and resolve its variables to symbol slots
+        Args:
+            statement: statement
+            parent: scope statement or execution tree that contains statement
+        Returns:
+            None
+        """
+
+        statement.parent = parent
+
+        if isinstance(statement, Variable):
+            self.store_variable(statement)
+            self.written_variables[-1].add(statement.variable_name)
+
+        elif isinstance(statement, Input):
+            self.written_variables[-1].add(statement.input_variable)
+
+        self.resolve_symbol_slots(statement)
+
+    def store_variable(self, statement: Variable):
+        """ Store variable in symbols table, variables of execution tree are always
+            stored, other variables are stored in their parent symbols table if no
+            open scope contains them
+        Args:
+            statement: variable statement
+        Returns:
+            None
+        """
+
+        name = statement.variable_name
+        symbols_table = statement.parent.symbols_table
+
+        if statement.parent is not self.execution_tree and self.visible_slots.get(name):
+            return
+
+        stored = name in symbols_table.indexes
+
+        # don't store values yet, symbol table should contain the values
+        # after executing the variable instruction, not during compilation.
+        symbols_table.add_entry(name, "", statement.type)
+        statement.symbols_table = symbols_table
+
+        if not stored:
+            self.visible_slots.setdefault(name, []).append(symbols_table.get_slot(name))
+
+    def open_scope(self, statement, parent):
+        """ Set parent of scope statement, its variables are visible until it is closed
+        Args:
+            statement: for, while, if, elseif or else statement
+            parent: statement or execution tree that contains statement
+        Returns:
+            None
+        """
+
+        statement.parent = parent
+        self.scopes.append(statement)
+        self.written_variables.append(set())
+
+        self.resolve_symbol_slots(statement)
+
+    def close_scope(self, statement):
+        """ Close scope statement, its variables are not visible anymore,
+            variables assigned in it are assigned in the scope that contains it
+        Args:
+            statement: open scope statement
+        Returns:
+            None
+        """
+
+        if self.scopes[-1] is not statement:
+            return
+
+        # variables of scope condition that are assigned only inside the scope
+        # are found in its own symbols table
+        self.resolve_symbol_slots(statement)
+
+        self.scopes.pop()
+        written_variables = self.written_variables.pop()
+        self.written_variables[-1].update(written_variables)
+
+        for name in statement.symbols_table.indexes:
+            self.visible_slots[name].pop()
+
+    def resolve_symbol_slots(self, statement):
+        """ Resolve variables referenced by statement to symbol slots of the
+            innermost open scopes that contain them, slots are stored in
+            statement.symbol_slots so the executor reads and writes variables by
+            index without searching symbols tables. Variables that are not stored
+            yet are not resolved, executor finds them when statement is executed.
+        Args:
+            statement: statement
+        Returns:
+            None
+        """
+
+        for name in referenced_variables(statement):
+            slots = self.visible_slots.get(name)
+            if slots and name not in statement.symbol_slots:
+                statement.symbol_slots[name] = slots[-1]
+
+    def build(self, statements: list, parent):
+        """ Set parents and store variables of statements that are already in
+            the execution tree (Recursive Method)
+        Args:
+            statements: list of statements
+            parent: scope statement or execution tree that contains statements
+        Returns:
+            None
+        """
+
+        for statement in statements:
+
+            if isinstance(statement, (For, While)):
+                self.open_scope(statement, parent)
+                self.build(statement.statements, statement)
+                self.close_scope(statement)
+
+            elif isinstance(statement, ConditionStatement):
+                statement.parent = parent
+                branches = [statement.if_statement] + list(statement.elseif_statements)
+                if statement.else_statement:
+                    branches.append(statement.else_statement)
+
+                for branch in branches:
+                    self.open_scope(branch, statement)
+                    self.build(branch.statements, branch)
+                    self.close_scope(branch)
+
+            else:
+                self.add_statement(statement, parent)
+
+
 class Compiler(object):
     """Compiler Class """
 
     def __init__(self) -> None:
         """ Compiler Class Constructor"""
-        pass
+        self.scope_builder = None
 
     def compile(self, statements: list) -> list:
-        """ Compiles statements into execution tree
+        """ Compiles statements into execution tree, parents of statements are set,
+            variables are stored in symbols tables and resolved to symbol slots
+            while statements are added
         Args:
-            statements: list of statements
+            statements: list or iterable of statements, like statements
+                        generator of EnhancedParser.parse_statements()
         Returns:
             execution tree
         """
@@ -58,6 +349,7 @@ class Compiler(object):
             return []
 
         execution_tree = ExecutionTree()
+        self.scope_builder = ScopeBuilder(execution_tree)
         stack = []
         for statement in statements:
             self.compile_statement(execution_tree, stack, statement)
@@ -67,15 +359,37 @@ class Compiler(object):
         if stack:
             raise SyntaxError("Syntax Error, no end for statements, ", stack)
 
-        # TODO remove this function, try to set parents when looping thru
-        # list of statements and adding elements to stack
-        self.set_parents(execution_tree)
-
-        # store variables in the right location in symbols table
-        self.store_variables_in_symbols_table(execution_tree)
+        # statements generator didn't yield statements
+        if not execution_tree.tree:
+            return []
 
         return execution_tree
 
+    def build_scopes(self, execution_tree: ExecutionTree):
+        """ Set parents of execution tree statements, store variables in symbols
+            tables of their scopes and resolve variables to their symbol slots,
+            used when statements of a compiled execution tree are changed,
+            symbols tables should be empty
+        Args:
+            execution_tree: execution tree
+        Returns:
+            None
+        """
+
+        ScopeBuilder(execution_tree).build(execution_tree.tree, execution_tree)
+
+    def scope_parent(self, stack):
+        """ Finds statement that new statements are added to
+        Args:
+            stack: scopes stack
+        Returns:
+            last statement in stack, execution tree if stack is empty
+        """
+
+        if stack:
+            return stack[-1]
+        return self.scope_builder.execution_tree
+
     def compile_statement(self, execution_tree, stack, statement):
         """ Compile statement
         Args:
@@ -86,11 +400,13 @@ class Compiler(object):
             None
         """
 
-        if (isinstance(statement, ElseIf) or
-            isinstance(statement, Else) or
-            isinstance(statement, While)):
+        if isinstance(statement, While):
+            self.scope_builder.open_scope(statement, self.scope_parent(stack))
             stack.append(statement)
 
+        elif isinstance(statement, ElseIf) or isinstance(statement, Else):
+            self.compile_branch(stack, statement)
+
         elif isinstance(statement, For):
             self.compile_for_loop(execution_tree, stack, statement)
 
@@ -145,189 +461,92 @@ class Compiler(object):
         else:
             raise SyntaxError("Break statement should be only inside a While Loops or For Loops")
 
-    def store_variables_in_symbols_table(self, execution_tree: ExecutionTree):
-        """ Store variables in symbols table
-        Args:
-            execution_tree: execution tree
-        Returns:
-            None
-        """
-
-        for statement in execution_tree.tree:
-            if isinstance(statement, Variable):
-                # don't store values yet, symbol table should contain the values
-                # after executing the variable instruction, not during compilation.
-                execution_tree.symbols_table.add_entry(statement.variable_name, "", statement.type)
-                statement.symbols_table = execution_tree.symbols_table
-
-            if (self.is_scope_statement(statement)):
-                self.store_variables_in_symbols_table_for_statements(
-                    statement.statements)
-                pass
-
-            if isinstance(statement, ConditionStatement):
-                self.store_variables_in_symbols_table_for_statements(
-                    statement.if_statement.statements)
-
-                for else_if_statement in statement.elseif_statements:
-                    self.store_variables_in_symbols_table_for_statements(
-                        else_if_statement.statements)
-
-                if statement.else_statement:
-                    self.store_variables_in_symbols_table_for_statements(
-                        statement.else_statement.statements)
-
-        pass
-
-    def find_symbol(self, statement: Variable):
-        """ Finds symbol in symbol tables in the execution tree
+    def counted_loop(self, statement: For, written_variables: set):
+        """ Checks if for loop is a counted loop, its condition compares loop variable
+            to a number or a variable, like i < 10 or i <= n, and its increment adds
+            a number to loop variable, like i += 1 or i = i - 2
         Args:
-            statement: variable statement that contains the symbol that
-                        we look for
+            statement: for loop statement
+            written_variables: names of variables assigned by loop statements
+                               before increment
         Returns:
-            Symbol Table that contains statement
+            CountedLoop, None if loop is not a counted loop
         """
 
-        statement_pointer = statement.parent
-        symbols_table = None
-        variable_name = statement.variable_name
-
-        while statement_pointer:
-            # If statement_pointer points to one of these statement types, that means
-            # it contains a symbol table, otherwise, we keep going up
-            if (self.is_scope_statement(statement_pointer) or
-                isinstance(statement_pointer, ExecutionTree)):
-
-                if statement_pointer.symbols_table.get_entry_value(variable_name):
-                    symbols_table = statement_pointer.symbols_table
-                    break
-
-            if isinstance(statement_pointer, ConditionStatement):
-                # condition statement doesn't have symbol table (No scope)
-                statement_pointer = statement_pointer.parent
-                continue
-
-            # Go Up
-            statement_pointer = statement_pointer.parent
-
-        return symbols_table
-
-    def store_variables_in_symbols_table_for_statements(self, statements: list[Statement]):
-        """ Store variables in symbols table for statements (Recursive Method)
-        Args:
-            statements: list of statements
-        Returns:
-            None
-        """
+        condition = statement.expression_tree
+        increment = statement.loop_increment
 
-        for statement in statements:
-            if isinstance(statement, Variable):
-                # find in all parents if symbol exists in any symbol tables,
-                # if found do nothing
-                symbol = self.find_symbol(statement)
-                # if not found, store it in parents symbol table
-                if not symbol:
-                    statement.parent.symbols_table.add_entry(
-                        statement.variable_name, "", statement.type)
-                    statement.symbols_table = statement.parent.symbols_table
-
-            if (self.is_scope_statement(statement)):
-                # Recursive Call for each statement that contains list of statements
-                # each statement that has scope
-                self.store_variables_in_symbols_table_for_statements(
-                    statement.statements)
-                pass
-
-            if isinstance(statement, ConditionStatement):
-                self.store_variables_in_symbols_table_for_statements(
-                    statement.if_statement.statements)
-                for elseif_statement in statement.elseif_statements:
-                    self.store_variables_in_symbols_table_for_statements(
-                        elseif_statement.statements)
-                if statement.else_statement:
-                    self.store_variables_in_symbols_table_for_statements(
-                        statement.else_statement.statements)
-            pass
+        if (condition is None
+            or condition.type != ExpressionType.OPERATION
+            or condition.operator not in COUNTED_LOOP_OPERATORS
+            or condition.left.type != ExpressionType.VARIABLE
+            or not increment
+            or not statement.statements
+            or statement.statements[-1] is not increment):
+            return None
 
-    def set_parents(self, execution_tree: ExecutionTree):
-        """ Set parents for execution tree
-        Args:
-            execution_tree: execution tree
-        Returns:
-            None
-        """
+        variable = condition.left.name
+        bound = condition.right
 
-        for statement in execution_tree.tree:
+        if bound.type == ExpressionType.CONSTANT:
+            if bound.token_type not in (TokenType.NUMBER, TokenType.REAL):
+                return None
 
-            statement.parent = execution_tree
+        elif bound.type != ExpressionType.VARIABLE or bound.name == variable:
+            return None
 
-            if (self.is_scope_statement(statement)):
-                # Call set parent for statements inside this scope
-                self.set_parent_for_statements(statement, statement.statements)
+        step = self.increment_step(increment, variable)
+        if step is None:
+            return None
 
-            if isinstance(statement, ConditionStatement):
-                # Condition Statement contains if_statement,
-                # elseif_statements and else_statement, each one should
-                # be handled separately
-                statement.if_statement.parent = statement
-                self.set_parent_for_statements(
-                    statement.if_statement,
-                    statement.if_statement.statements)
+        # loop statements before increment should not change variable or bound
+        if (variable in written_variables
+            or (bound.type == ExpressionType.VARIABLE and bound.name in written_variables)):
+            return None
 
-                for elseif in statement.elseif_statements:
-                    elseif.parent = statement
-                    self.set_parent_for_statements(elseif, elseif.statements)
+        return CountedLoop(variable, condition.operator, bound, step)
 
-                if statement.else_statement:
-                    statement.else_statement.parent = statement
-                    self.set_parent_for_statements(
-                        statement.else_statement,
-                        statement.else_statement.statements)
-                pass
-        pass
-
-    def set_parent_for_statements(self, parent, statements):
-        """ Set parents for statements
+    def increment_step(self, increment: Variable, variable: str):
+        """ Finds number added to loop variable by loop increment
         Args:
-            parent: parent of statement
-            statements: list of statements to set {parent} for
+            increment: loop increment variable statement
+            variable: loop variable name
         Returns:
-            None
+            step number, None if increment doesn't add a number to loop variable
         """
 
-        for statement in statements:
-            statement.parent = parent
-
-            if (self.is_scope_statement(statement)):
-                self.set_parent_for_statements(statement, statement.statements)
-
-            # Set parent for condition statement
-            if isinstance(statement, ConditionStatement):
-                statement.if_statement.parent = statement
-                # Set parents for If, else ifs, and else statements
+        value = increment.expression_tree
 
-                self.set_parent_for_statements(
-                    statement.if_statement,
-                    statement.if_statement.statements)
+        if increment.variable_name != variable or value is None:
+            return None
 
-                # Else if statements
-                for elif_statement in statement.elseif_statements:
-                    elif_statement.parent = statement
+        if increment.operation in (TokenType.PLUSEQUAL, TokenType.SUBEQUAL):
+            # i += 1
+            if (value.type != ExpressionType.CONSTANT
+                or value.token_type not in (TokenType.NUMBER, TokenType.REAL)):
+                return None
+            step = float(value.value)
+            return step if increment.operation == TokenType.PLUSEQUAL else -step
 
-                    self.set_parent_for_statements(
-                        elif_statement,
-                        elif_statement.statements)
+        if (increment.operation != TokenType.EQUAL
+            or value.type != ExpressionType.OPERATION
+            or value.operator not in ("+", "-")):
+            return None
 
-                # else statement is optional, if it exists, set parent for else.
-                if statement.else_statement:
-                    statement.else_statement.parent = statement
+        # i = i + 1, i = 1 + i or i = i - 1
+        operands = [value.left, value.right]
+        if value.operator == "+" and value.right.type == ExpressionType.VARIABLE:
+            operands.reverse()
 
-                    self.set_parent_for_statements(
-                        statement.else_statement,
-                        statement.else_statement.statements)
+        loop_variable, number = operands
+        if (loop_variable.type != ExpressionType.VARIABLE
+            or loop_variable.name != variable
+            or number.type != ExpressionType.CONSTANT
+            or number.token_type not in (TokenType.NUMBER, TokenType.REAL)):
+            return None
 
-                pass
-        pass
+        step = float(number.value)
+        return step if value.operator == "+" else -step
 
     def compile_endif(self, execution_tree: ExecutionTree, stack):
         """ Handle End If Statement compilation
@@ -342,6 +561,9 @@ class Compiler(object):
         clause = stack.pop()
         if_statement_stack = []
 
+        # last branch is the only open branch of condition statement
+        self.scope_builder.close_scope(clause)
+
         while not isinstance(clause, ConditionStatement):
             if_statement_stack.append(clause)
             clause = stack.pop()
@@ -375,7 +597,32 @@ class Compiler(object):
         """
 
         condition = ConditionStatement(statement, [], [])
+        condition.line_number = statement.line_number
+        condition.parent = self.scope_parent(stack)
         stack.append(condition)
+        self.scope_builder.open_scope(statement, condition)
+        stack.append(statement)
+
+    def compile_branch(self, stack, statement):
+        """ Handle Else If and Else Statements compilation, previous branch of
+            condition statement is closed, its variables are not visible in this branch
+        Args:
+            stack: scope stack
+            statement: else if or else statement
+        Returns:
+            None
+        """
+
+        condition = None
+        for stack_item in stack[::-1]:
+            if isinstance(stack_item, ConditionStatement):
+                condition = stack_item
+                break
+
+        if stack and isinstance(stack[-1], (If, ElseIf, Else)):
+            self.scope_builder.close_scope(stack[-1])
+
+        self.scope_builder.open_scope(statement, condition)
         stack.append(statement)
 
     def compile_one_line_statement(self, execution_tree, stack, statement):
@@ -394,6 +641,8 @@ class Compiler(object):
         else:
             execution_tree.append(statement)
 
+        self.scope_builder.add_statement(statement, self.scope_parent(stack))
+
     def compile_end_statement(self, execution_tree, stack):
         """ Handle End Statement compilation
         Args:
@@ -404,6 +653,8 @@ class Compiler(object):
         """
 
         end = stack.pop()
+        self.scope_builder.close_scope(end)
+
         if stack:
             stack[-1].statements.append(end)
         else:
@@ -421,10 +672,20 @@ class Compiler(object):
         # Get for loop statement from stack
         for_loop_statement = stack.pop()
 
+        # variables assigned by loop statements, increment is not added yet
+        written_variables = set(self.scope_builder.written_variables[-1])
+
         # create increment variable at the end of for loop
         if for_loop_statement.loop_increment:
             increment_variable = for_loop_statement.loop_increment
             for_loop_statement.statements.append(increment_variable)
+            self.scope_builder.add_statement(increment_variable, for_loop_statement)
+
+        # find if for loop can be executed as counted loop
+        for_loop_statement.counted_loop = self.counted_loop(for_loop_statement, written_variables)
+
+        self.scope_builder.close_scope(for_loop_statement)
+
         if stack:
             stack[-1].statements.append(for_loop_statement)
         else:
@@ -444,6 +705,8 @@ class Compiler(object):
         if statement.loop_initial_variable:
             loop_initial_variable = statement.loop_initial_variable
             self.compile_one_line_statement(execution_tree, stack, loop_initial_variable)
+
+        self.scope_builder.open_scope(statement, self.scope_parent(stack))
         stack.append(statement)
 
     def is_scope_statement(self, statement):
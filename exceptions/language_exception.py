@@ -4,7 +4,8 @@
 
 Exceptions Module
 
-Contains SyntaxError, UnknownVariable, UnexpectedError, ExpressionEvaluationError
+Contains SyntaxError, UnknownVariable, UnexpectedError, ExpressionEvaluationError,
+TranspileError
 Those exceptions are being used in order to identify potential issues in the code
 
 """
@@ -40,3 +41,10 @@ class ExpressionEvaluationError(Exception):
 
     def __init__(self, *args: object) -> None:
         super().__init__(*args)
+
+
+class TranspileError(Exception):
+    """ Transpile Error Exception """
+
+    def __init__(self, *args: object) -> None:
+        super().__init__(*args)
@@ -0,0 +1,522 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Closure Executor Library
+
+Executes programs by walking the execution tree. Each statement and expression
+is converted once into a python closure that has its variables slots, compiled
+expression and children closures bound, executing the program is then calling
+closures without type dispatch, lexing or label lookups.
+
+Loop control is returned by closures, BREAK or CONTINUE, None to continue
+with the next statement.
+
+"""
+
+import operator
+
+from exceptions.language_exception import ExpressionEvaluationError
+from executors.executor import ASSIGNMENT_OPERATIONS, Executor
+from instruction_generators.instructions_generator import InstructionsGenerator
+from instructions.instruction import AssignmentType, VariableInstruction
+from statements.statement import (Break, ConditionStatement, Continue, Echo,
+                                  For, Input, Variable, VariableType, While)
+from symbols.symbols_table import ValueType, native_value, value_type
+
+BREAK = "break"
+CONTINUE = "continue"
+
+# Evaluator operators, both values are cleaned before calling them
+OPERATORS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "%": operator.mod,
+    "^": lambda value1, value2: int(value1) ^ int(value2),
+    "&": lambda value1, value2: value1 and value2,
+    "|": lambda value1, value2: value1 or value2,
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+
+class ClosureExecutor(Executor):
+    """
+
+    Closure Executor Class
+
+    Executes execution tree statements through closures, it can be used as
+    AslRunner executor, instructions are not used.
+
+    Errors that the instructions executor raises when it executes a statement
+    are raised when the statement closure is called, so programs output is
+    the same.
+
+    """
+
+    def execute(self, instructions, execution_tree):
+        """
+        Desc:
+            Execute execution tree
+        Args:
+            instructions: not used, the program is executed from execution tree
+            execution_tree: Execution Tree that contains statements to be executed
+        Returns:
+            None
+        """
+
+        if not execution_tree or not execution_tree.tree:
+            return
+
+        self.execution_tree = execution_tree
+
+        # compiles echo strings of all echo statements
+        self.echo_compiler = InstructionsGenerator()
+        program = self.build_block(execution_tree.tree)
+
+        try:
+            program()
+        finally:
+            # Buffered output is written when program ends or fails
+            self.output.flush()
+
+    def build_block(self, statements: list):
+        """ Builds closure that runs statements in order
+        Args:
+            statements: list of statements
+        Returns:
+            closure that returns BREAK or CONTINUE if a statement returns it
+        """
+
+        closures = tuple(closure for closure in map(self.build_statement, statements)
+                         if closure is not None)
+
+        if len(closures) == 1:
+            return closures[0]
+
+        def block():
+            for closure in closures:
+                signal = closure()
+                if signal is not None:
+                    return signal
+            return None
+
+        return block
+
+    def build_statement(self, statement):
+        """ Builds closure of statement
+        Args:
+            statement: statement
+        Returns:
+            statement closure, None for statements that don't do anything
+        """
+
+        if isinstance(statement, For):
+            return self.build_for_loop(statement)
+
+        elif isinstance(statement, While):
+            return self.build_while_statement(statement)
+
+        elif isinstance(statement, ConditionStatement):
+            return self.build_condition_statement(statement)
+
+        elif isinstance(statement, Echo):
+            return self.build_echo_statement(statement)
+
+        elif isinstance(statement, Input):
+            return self.build_input_statement(statement)
+
+        elif isinstance(statement, Variable):
+            return self.build_variable_statement(statement)
+
+        elif isinstance(statement, Break):
+            return lambda: BREAK
+
+        elif isinstance(statement, Continue):
+            return lambda: CONTINUE
+
+        return None
+
+    def build_raise(self, exception: Exception):
+        """ Builds closure that raises exception when it is called
+        Args:
+            exception: exception to be raised
+        Returns:
+            closure
+        """
+
+        def raise_exception():
+            raise exception
+
+        return raise_exception
+
+    def build_condition(self, condition: str, statement):
+        """ Builds closure that evaluates condition, same as evaluate_condition()
+        Args:
+            condition: condition string
+            statement: statement that contains the condition
+        Returns:
+            closure that returns condition result
+        """
+
+        try:
+            compiled = self.evaluator.compile(condition.strip('"'), statement.expression_tree)
+            slots = [self.find_symbol_slot(name, statement) for _, name in compiled.variables]
+        except Exception as e:
+            return self.build_raise(e)
+
+        return self.build_compiled_expression(compiled, slots)
+
+    def build_compiled_expression(self, compiled, slots: list):
+        """ Builds closure that calculates compiled expression, same as
+            evaluator evaluate_compiled()
+        Args:
+            compiled: CompiledExpression
+            slots: variables slots, in the order of compiled.variables
+        Returns:
+            closure that returns expression result
+        """
+
+        error_message = f"Unable to evaluate expression {compiled.expression}"
+
+        if compiled.single_token:
+            if slots:
+                values, index = slots[0].values, slots[0].index
+                return lambda: str(values[index]) or False
+            value = compiled.registers[0]
+            result = value if value else False
+            return lambda: result
+
+        if (not compiled.is_valid
+            or any(operation[0] not in OPERATORS for operation in compiled.operations)):
+            return self.build_raise(ExpressionEvaluationError(error_message))
+
+        clean_value = self.evaluator.clean_value
+
+        # closure of each register value, operands are cleaned the same way
+        # calculate() cleans values
+        registers = {}
+        for register, value in enumerate(compiled.registers):
+            if value is not None:
+                registers[register] = self.build_constant(clean_value(value))
+
+        for (register, _), slot in zip(compiled.variables, slots):
+            registers[register] = self.build_operand(slot.values, slot.index)
+
+        expression = None
+        for operation, value1, value2, register in compiled.operations:
+            expression = self.build_operation(OPERATORS[operation],
+                                              registers[value1], registers[value2])
+            registers[register] = self.build_cleaned(expression)
+
+        def evaluate():
+            try:
+                return expression()
+            except Exception:
+                raise ExpressionEvaluationError(error_message) from None
+
+        return evaluate
+
+    def build_constant(self, value):
+        """ Builds closure that returns a constant value """
+        return lambda: value
+
+    def build_operand(self, values: list, index: int):
+        """ Builds closure that returns cleaned variable value
+        Args:
+            values: symbols table values array
+            index: variable index in values array
+        Returns:
+            closure
+        """
+
+        clean_value = self.evaluator.clean_value
+        operand_value = self.operand_value
+
+        def operand():
+            value = values[index]
+            if value.__class__ is float:
+                return value
+            return clean_value(operand_value(value))
+
+        return operand
+
+    def build_cleaned(self, expression):
+        """ Builds closure that cleans operation result before it is used by
+            another operation
+        Args:
+            expression: operation closure
+        Returns:
+            closure
+        """
+
+        clean_value = self.evaluator.clean_value
+
+        def cleaned():
+            value = expression()
+            if value.__class__ is float:
+                return value
+            return clean_value(value)
+
+        return cleaned
+
+    def build_operation(self, function, value1, value2):
+        """ Builds closure of an operation
+        Args:
+            function: operator function
+            value1: closure of first value
+            value2: closure of second value
+        Returns:
+            closure
+        """
+
+        return lambda: function(value1(), value2())
+
+    def build_while_statement(self, statement: While):
+        """ Builds while loop closure
+        Args:
+            statement: while statement
+        Returns:
+            closure
+        """
+
+        condition = self.build_condition(statement.condition, statement)
+        body = self.build_block(statement.statements)
+
+        def while_loop():
+            while condition():
+                if body() is BREAK:
+                    break
+            return None
+
+        return while_loop
+
+    def build_for_loop(self, statement: For):
+        """ Builds for loop closure, loop initial variable is a statement before the
+            for loop and loop increment is the last statement inside the loop.
+            Continue statement executes the last statement of the loop (increment)
+            and checks the condition again.
+        Args:
+            statement: for statement
+        Returns:
+            closure
+        """
+
+        condition = self.build_condition(statement.loop_condition, statement)
+        statements = statement.statements
+        last_statement = statements[-1] if statements else None
+
+        if not isinstance(last_statement, (Variable, Echo, Input, Break)):
+            # continue checks the condition again
+            body = self.build_block(statements)
+
+            def for_loop():
+                while condition():
+                    if body() is BREAK:
+                        break
+                return None
+
+            return for_loop
+
+        body = self.build_block(statements[:-1])
+        increment = self.build_block([last_statement])
+
+        def for_loop_with_increment():
+            while condition():
+                if body() is BREAK:
+                    break
+                if increment() is BREAK:
+                    break
+            return None
+
+        return for_loop_with_increment
+
+    def build_condition_statement(self, statement: ConditionStatement):
+        """ Builds if, else if and else statements closure
+        Args:
+            statement: condition statement
+        Returns:
+            closure
+        """
+
+        branches = [statement.if_statement] + list(statement.elseif_statements)
+        conditions = tuple((self.build_condition(branch.condition, branch),
+                            self.build_block(branch.statements)) for branch in branches)
+
+        else_block = None
+        if statement.else_statement:
+            else_block = self.build_block(statement.else_statement.statements)
+
+        def condition_statement():
+            for condition, block in conditions:
+                if condition():
+                    return block()
+            if else_block:
+                return else_block()
+            return None
+
+        return condition_statement
+
+    def build_echo_statement(self, statement: Echo):
+        """ Builds echo statement closure, echo string is compiled the same
+            way InstructionsGenerator compiles it
+        Args:
+            statement: echo statement
+        Returns:
+            closure
+        """
+
+        echo_parts, echo_variables = self.echo_compiler.compile_echo_statement(statement)
+
+        try:
+            variables = tuple((echo_variable.index,
+                               self.find_symbol_slot(echo_variable.name, statement))
+                              for echo_variable in echo_variables)
+        except Exception as e:
+            return self.build_raise(e)
+
+        write_line = self.output.write_line
+
+        if not variables:
+            text = "".join(echo_parts)
+
+            def echo_text():
+                write_line(text)
+
+            return echo_text
+
+        def echo():
+            final_echo_parts = list(echo_parts)
+            for index, slot in variables:
+                final_echo_parts[index] = str(slot.values[slot.index])
+            write_line("".join(final_echo_parts))
+
+        return echo
+
+    def build_input_statement(self, statement: Input):
+        """ Builds input statement closure
+        Args:
+            statement: input statement
+        Returns:
+            closure
+        """
+
+        try:
+            slot = self.find_symbol_slot(statement.input_variable, statement)
+        except Exception as e:
+            return self.build_raise(e)
+
+        values, value_types, index = slot.values, slot.value_types, slot.index
+        flush = self.output.flush
+
+        def read_input():
+            # Echoed lines, like input prompts, are written before waiting for input
+            flush()
+            value = native_value(input())
+            values[index] = value
+            value_types[index] = value_type(value)
+
+        return read_input
+
+    def build_variable_statement(self, statement: Variable):
+        """ Builds variable assignment closure, variable value is compiled
+            the same way the executor compiles variable instructions
+        Args:
+            statement: variable statement
+        Returns:
+            closure
+        """
+
+        if statement.type == VariableType.ARRAY:
+            array = statement.variable_value
+            return self.build_store(statement, lambda: array)
+
+        instruction = VariableInstruction(statement)
+        try:
+            assignment_type = self.compile_variable_instruction(instruction)
+        except Exception as e:
+            return self.build_raise(e)
+
+        if assignment_type == AssignmentType.CONSTANT:
+            constant_value = instruction.constant_value
+            if statement.operation in ASSIGNMENT_OPERATIONS and constant_value.__class__ is not float:
+                # number constant is converted once instead of each time it is applied
+                try:
+                    constant_value = float(constant_value)
+                except (TypeError, ValueError):
+                    pass
+            value = lambda: constant_value
+
+        elif assignment_type == AssignmentType.VARIABLE:
+            slot = instruction.value_symbols[0]
+            values, index = slot.values, slot.index
+            value = lambda: values[index]
+
+        elif assignment_type == AssignmentType.EXPRESSION:
+            value = self.build_compiled_expression(instruction.compiled_value,
+                                                   instruction.value_symbols)
+
+        else:
+            value_parts = instruction.value_parts
+            value_symbols = instruction.value_symbols
+            evaluate = self.evaluator.evaluate
+            is_substitution = assignment_type == AssignmentType.SUBSTITUTION
+
+            def value():
+                parts = list(value_parts)
+                for index, slot in value_symbols:
+                    parts[index] = str(slot.values[slot.index])
+                text = "".join(parts)
+                return evaluate(text) if is_substitution else text
+
+        return self.build_store(statement, value)
+
+    def build_store(self, statement: Variable, value):
+        """ Builds closure that stores value in variable and applies operation
+        Args:
+            statement: variable statement
+            value: closure that returns new value
+        Returns:
+            closure
+        """
+
+        try:
+            slot = self.find_symbol_slot(statement.variable_name, statement)
+        except Exception as e:
+            exception = e
+
+            def store_unknown_variable():
+                value()
+                raise exception
+
+            return store_unknown_variable
+
+        values, value_types, index = slot.values, slot.value_types, slot.index
+        operation = ASSIGNMENT_OPERATIONS.get(statement.operation)
+
+        if operation:
+            real = ValueType.REAL
+
+            def store_operation():
+                old_value = values[index]
+                new_value = value()
+                # other values than floats are converted, strings only if they are numbers
+                if old_value.__class__ is not float:
+                    old_value = float(old_value)
+                if new_value.__class__ is not float:
+                    new_value = float(new_value)
+                values[index] = operation(old_value, new_value)
+                value_types[index] = real
+        else:
+            def store_operation():
+                new_value = value()
+                values[index] = new_value
+                value_types[index] = value_type(new_value)
+
+        return store_operation
@@ -9,13 +9,127 @@ program logical output.
 
 """
 
-from compiler.compiler import ExecutionTree
-from lexer.enhanced_lexer import EnhancedLexer
-from exceptions.language_exception import UnexpectedError, UnknownVariable
+import operator
+import time
+
+from compiler.compiler import find_symbol_slot, find_symbols_table
+from exceptions.language_exception import ExpressionEvaluationError, UnexpectedError
+from executors.output_writer import OutputWriter
 from expression_evaluators.expression_evaluator import Evaluator
-from instructions.instruction import EchoInstruction, InputInstruction, InstructionType, VariableInstruction
-from lexer.lexer import Lexer, TokenType
-from statements.statement import ConditionStatement, Else, ElseIf, For, If, Variable, VariableType, While
+from instructions.instruction import AssignmentType, CountedLoopInstruction, EchoInstruction, InputInstruction, InstructionType, VariableInstruction
+from lexer.lexer import TokenType
+from statements.statement import VariableType
+from statements.expression import ExpressionType, expression_parts
+from symbols.symbols_table import ValueType, native_value, value_type
+
+# Counted loop condition operator ---> comparison function
+COMPARISONS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+# Assignment operations, applied to old value and new value converted to floats
+ASSIGNMENT_OPERATIONS = {
+    TokenType.PLUSEQUAL: operator.add,
+    TokenType.SUBEQUAL: operator.sub,
+    TokenType.MULTEQUAL: operator.mul,
+    TokenType.DIVEQUAL: operator.truediv,
+}
+
+
+def compile_variable_instruction(instruction: VariableInstruction, evaluator: Evaluator):
+    """ Compile variable value once from its expression tree and store on the
+        instruction how the value is calculated:
+        x = 1       constant, stored as native int or float
+        x = y       value of another variable
+        x = y + 1   compiled expression
+        x = s + "a" concatenation, if one of the variables is a string
+    Args:
+        instruction: variable instruction that contains the variable statement
+        evaluator: evaluator that compiles expressions
+    Returns:
+        assignment type
+    """
+
+    statement = instruction.variable_statement
+    expression_tree = getattr(statement, "expression_tree", None)
+
+    if expression_tree is None:
+        # parser couldn't parse variable value, its text is only used in the error
+        raise ExpressionEvaluationError(f"Unable to evaluate expression {statement.variable_value}")
+
+    assignment_type = compile_variable_tree(instruction, expression_tree, evaluator)
+    if assignment_type:
+        return assignment_type
+
+    # Concatenation, or an expression that can only be evaluated after
+    # substituting variables values in its text
+    value_parts = []
+    value_symbols = []
+    is_concatenation = False
+
+    for part in expression_parts(expression_tree):
+        if part.__class__ is str:
+            value_parts.append(part)
+            continue
+
+        slot = find_symbol_slot(part.name, statement)
+        if slot.entry.type == TokenType.STRING:
+            # Variables should be concatenated rather than evaluating them since
+            # there is a string value
+            is_concatenation = True
+
+        value_symbols.append((len(value_parts), slot))
+        value_parts.append("")
+
+    instruction.value_parts = value_parts
+    instruction.value_symbols = value_symbols
+    if is_concatenation:
+        instruction.assignment_type = AssignmentType.CONCATENATION
+    else:
+        instruction.assignment_type = AssignmentType.SUBSTITUTION
+    return instruction.assignment_type
+
+
+def compile_variable_tree(instruction: VariableInstruction, expression_tree, evaluator: Evaluator):
+    """ Compile variable value from its expression tree
+    Args:
+        instruction: variable instruction that contains the variable statement
+        expression_tree: expression tree of variable value
+        evaluator: evaluator that compiles expressions
+    Returns:
+        assignment type, None if the value is a concatenation or can't be compiled,
+        it is then calculated from the text of its parts
+    """
+
+    statement = instruction.variable_statement
+
+    if expression_tree.type == ExpressionType.VARIABLE:
+        # Variable value is an assignment to another variable
+        instruction.value_symbols = [find_symbol_slot(expression_tree.name, statement)]
+        instruction.assignment_type = AssignmentType.VARIABLE
+
+    elif expression_tree.type == ExpressionType.CONSTANT:
+        value = evaluator.constant_register(expression_tree, False)
+        instruction.constant_value = native_value(value)
+        instruction.assignment_type = AssignmentType.CONSTANT
+
+    else:
+        compiled_value = evaluator.compile(statement.variable_value, expression_tree)
+        value_symbols = [find_symbol_slot(name, statement)
+                         for _, name in compiled_value.variables]
+
+        if (not compiled_value.is_valid
+            or any(slot.entry.type == TokenType.STRING for slot in value_symbols)):
+            return None
+
+        instruction.compiled_value = compiled_value
+        instruction.value_symbols = value_symbols
+        instruction.assignment_type = AssignmentType.EXPRESSION
+
+    return instruction.assignment_type
 
 
 class Executor(object):
@@ -33,14 +147,56 @@ class Executor(object):
 
         execution_tree:      Execution tree that contains statement, it is needed in this
                              class in order to lookup symbols tables for variables assignment.
+
+        evaluator:           Expression evaluator used to compile and evaluate conditions
+
+        profiler:            InstructionProfiler that records counts and time of executed
+                             instructions, None if instructions are not profiled
+
+        output:              OutputWriter that echoed lines are written to
     """
 
-    def __init__(self) -> None:
-        """ Executor Class Constructor """
+    def __init__(self, evaluator: Evaluator = None, profiler=None,
+                 output: OutputWriter = None) -> None:
+        """ Executor Class Constructor
+        Args:
+            evaluator: Optional, expression evaluator, like Evaluator(rpn_cache_size=1024)
+            profiler: Optional, InstructionProfiler to profile executed instructions,
+                      instructions are executed without timing them if None
+            output: Optional, OutputWriter to write echoed lines to, lines are
+                    buffered and written to sys.stdout if None
+        Returns:
+            None
+        """
 
         self.instruction_pointer = 0
         self.label_index_table = {}
         self.execution_tree = None
+        self.evaluator = evaluator if evaluator else Evaluator()
+        self.profiler = profiler
+        self.output = output if output else OutputWriter()
+        self.dispatch_table = self.build_dispatch_table()
+
+    def build_dispatch_table(self):
+        """ Builds instruction type to handler lookup table, a handler executes
+            an instruction and returns index of next instruction, or None to
+            continue with the following instruction
+        Args:
+            None
+        Returns:
+            dispatch table dictionary
+        """
+
+        return {
+            InstructionType.ECHO: self.execute_echo_instruction,
+            InstructionType.INPUT: self.execute_input_instruction,
+            InstructionType.VARIABLE: self.execute_variable_instruction,
+            InstructionType.GOTO: self.execute_goto_instruction,
+            InstructionType.JUMP_IF: self.execute_jump_if_instruction,
+            InstructionType.JUMP_IF_NOT: self.execute_jump_if_not_instruction,
+            InstructionType.LABEL: self.execute_label_instruction,
+            InstructionType.COUNTED_LOOP: self.execute_counted_loop_instruction,
+        }
 
     def execute(self, instructions, execution_tree):
         """
@@ -58,62 +214,83 @@ class Executor(object):
             # if no instructions provided, return empty
             return
 
+        # executor can execute many programs, each one starts from its first instruction
         self.execution_tree = execution_tree
+        self.instruction_pointer = 0
+        self.label_index_table = {}
         self.build_label_index_table(instructions)
+        self.resolve_jump_targets(instructions)
+
+        # Handler of each instruction, looked up once before executing
+        handlers = [self.dispatch_table[instruction.type] for instruction in instructions]
+        instructions_count = len(instructions)
+        instruction_pointer = self.instruction_pointer
+
+        try:
+            if self.profiler:
+                self.execute_profiled(instructions, handlers)
+                return
+
+            while instruction_pointer < instructions_count:
+                next_instruction = handlers[instruction_pointer](instructions[instruction_pointer])
+
+                if next_instruction is None:
+                    instruction_pointer += 1
+                else:
+                    instruction_pointer = next_instruction
+
+            self.instruction_pointer = instruction_pointer
+        finally:
+            # Buffered output is written when program ends or fails
+            self.output.flush()
 
-        while self.instruction_pointer < len(instructions):
-            current_instruction = instructions[self.instruction_pointer]
-            self.execute_instruction(current_instruction)
         return
 
-    def execute_instruction(self, current_instruction):
-        """ Execute a given instruction based on instruction type
+    def execute_profiled(self, instructions, handlers):
+        """ Execute instructions like execute(), and record execution count and
+            wall time of each instruction in profiler
         Args:
-            current_instruction: Instruction to be executed
+            instructions: instructions to be executed
+            handlers: handler of each instruction
         Returns:
             None
         """
 
-        # Echo Instruction
-        if current_instruction.type == InstructionType.ECHO:
-            self.execute_echo_instruction(current_instruction)
-            self.increment_instruction_pointer()
-
-        # Input Instruction
-        elif current_instruction.type == InstructionType.INPUT:
-            self.execute_input_instruction(current_instruction)
-            self.increment_instruction_pointer()
+        self.profiler.start(instructions)
+        counts = self.profiler.counts
+        times = self.profiler.times
+        clock = time.perf_counter_ns
 
-        # Variable Instruction
-        elif current_instruction.type == InstructionType.VARIABLE:
-            self.execute_variable_instruction(current_instruction)
-            self.increment_instruction_pointer()
+        instructions_count = len(instructions)
+        instruction_pointer = self.instruction_pointer
 
-        # Goto Instruction
-        elif current_instruction.type == InstructionType.GOTO:
-            self.execute_goto_instruction(current_instruction)
+        while instruction_pointer < instructions_count:
+            start = clock()
+            next_instruction = handlers[instruction_pointer](instructions[instruction_pointer])
+            times[instruction_pointer] += clock() - start
+            counts[instruction_pointer] += 1
 
-        # Jump If Instruction
-        elif current_instruction.type == InstructionType.JUMP_IF:
-            result = self.evaluate_condition(
-                    current_instruction.condition, current_instruction)
-            if result:
-                self.instruction_pointer = self.label_index_table[current_instruction.goto_label]
+            if next_instruction is None:
+                instruction_pointer += 1
             else:
-                self.increment_instruction_pointer()
-
-        # Jump if not Instruction
-        elif current_instruction.type == InstructionType.JUMP_IF_NOT:
-            result = self.evaluate_condition(
-                    current_instruction.condition, current_instruction)
-            if not result:
-                self.instruction_pointer = self.label_index_table[current_instruction.goto_label]
-            else:
-                self.increment_instruction_pointer()
+                instruction_pointer = next_instruction
+
+        self.instruction_pointer = instruction_pointer
+
+    def execute_instruction(self, current_instruction):
+        """ Execute a given instruction based on instruction type
+        Args:
+            current_instruction: Instruction to be executed
+        Returns:
+            None
+        """
 
-        # Label Instruction
-        elif current_instruction.type == InstructionType.LABEL:
+        next_instruction = self.dispatch_table[current_instruction.type](current_instruction)
+
+        if next_instruction is None:
             self.increment_instruction_pointer()
+        else:
+            self.instruction_pointer = next_instruction
 
         return
 
@@ -131,6 +308,149 @@ class Executor(object):
                 self.label_index_table[instruction.label_name] = index
         return
 
+    def resolve_jump_targets(self, instructions):
+        """ Resolves goto index of jump instructions that are not linked by
+            the instructions generator
+        Args:
+            instructions: list of instructions
+        Returns:
+            None
+        Raises:
+            UnexpectedError: if a jump goes to an unknown label
+        """
+
+        for instruction in instructions:
+            if (instruction.type == InstructionType.GOTO
+                or instruction.type == InstructionType.JUMP_IF
+                or instruction.type == InstructionType.JUMP_IF_NOT
+                or instruction.type == InstructionType.COUNTED_LOOP):
+
+                if instruction.goto_index is None:
+                    goto_index = self.label_index_table.get(instruction.goto_label)
+
+                    if goto_index is None:
+                        raise UnexpectedError(f"Unknown label {instruction.goto_label}")
+
+                    instruction.goto_index = goto_index
+        return
+
+    def execute_jump_if_instruction(self, instruction):
+        """ Execute Jump If instruction
+        Args:
+            instruction: jump instruction that contains condition and goto index
+        Returns:
+            goto index if condition is true, otherwise None
+        """
+
+        if self.evaluate_condition(instruction.condition, instruction):
+            return instruction.goto_index
+        return None
+
+    def execute_jump_if_not_instruction(self, instruction):
+        """ Execute Jump If Not instruction
+        Args:
+            instruction: jump instruction that contains condition and goto index
+        Returns:
+            goto index if condition is false, otherwise None
+        """
+
+        if not self.evaluate_condition(instruction.condition, instruction):
+            return instruction.goto_index
+        return None
+
+    def execute_counted_loop_instruction(self, instruction: CountedLoopInstruction):
+        """ Execute Counted Loop instruction, loop variable is incremented and
+            compared to bound natively if both are numbers, otherwise loop increment
+            is executed and loop condition is evaluated
+        Args:
+            instruction: counted loop instruction
+        Returns:
+            goto index of loop statements if condition is true, otherwise None
+        """
+
+        if not instruction.is_compiled:
+            self.compile_counted_loop_instruction(instruction)
+
+        if instruction.step is not None:
+            loop_symbol = instruction.loop_symbol
+            value = loop_symbol.values[loop_symbol.index]
+
+            bound_symbol = instruction.bound_symbol
+            if bound_symbol:
+                bound = bound_symbol.values[bound_symbol.index]
+            else:
+                bound = instruction.bound_value
+
+            if ((value.__class__ is float or value.__class__ is int)
+                and (bound.__class__ is float or bound.__class__ is int)):
+                # same as calculating i + step and i < bound by the evaluator
+                value = float(value) + instruction.step
+                loop_symbol.values[loop_symbol.index] = value
+                loop_symbol.value_types[loop_symbol.index] = ValueType.REAL
+
+                if instruction.compare(value, float(bound)):
+                    return instruction.goto_index
+                return None
+
+        self.execute_variable_instruction(instruction.increment_instruction)
+
+        if self.evaluate_condition(instruction.condition, instruction):
+            return instruction.goto_index
+        return None
+
+    def compile_counted_loop_instruction(self, instruction: CountedLoopInstruction):
+        """ Find slots of counted loop variables and its step, step is None if
+            loop increment doesn't add a number to the same variable the loop
+            condition compares, like a string variable that is concatenated
+        Args:
+            instruction: counted loop instruction
+        Returns:
+            None
+        """
+
+        instruction.is_compiled = True
+        counted_loop = instruction.statement.counted_loop
+        increment = instruction.increment_instruction
+        increment_statement = increment.variable_statement
+
+        assignment_type = self.compile_variable_instruction(increment)
+
+        if increment_statement.operation == TokenType.EQUAL:
+            if assignment_type != AssignmentType.EXPRESSION:
+                return
+
+        elif (assignment_type != AssignmentType.CONSTANT
+              or not (increment.constant_value.__class__ is int
+                      or increment.constant_value.__class__ is float)):
+            return
+
+        loop_symbol = self.find_symbol_slot(counted_loop.variable, instruction.statement)
+        increment_symbol = self.find_symbol_slot(counted_loop.variable, increment_statement)
+
+        if (loop_symbol.values is not increment_symbol.values
+            or loop_symbol.index != increment_symbol.index):
+            return
+
+        bound = counted_loop.bound
+        if bound.type == ExpressionType.VARIABLE:
+            instruction.bound_symbol = self.find_symbol_slot(bound.name, instruction.statement)
+        else:
+            instruction.bound_value = self.evaluator.constant_register(bound)
+
+        instruction.loop_symbol = loop_symbol
+        instruction.compare = COMPARISONS[counted_loop.operator]
+        instruction.step = counted_loop.step
+
+    def execute_label_instruction(self, instruction):
+        """ Label instruction doesn't do anything
+        Args:
+            instruction: label instruction
+        Returns:
+            None
+        """
+
+        return None
+
     def evaluate_condition(self, condition, instruction):
         """ Evaluate the result of a given condition
         Args:
@@ -141,35 +461,54 @@ class Executor(object):
             Condition Result
         """
 
-        tokens = EnhancedLexer().tokenize_text(condition.strip('"'))
-
-        # If condition contains variables, they should be substituted by
-        # their values in the symbols table
-        final_condition = ""
-        for token in tokens:
-            if token.token_type == TokenType.IDENTIFICATION:
+        compiled_condition = instruction.compiled_condition
 
-                # Variable found, Lookup variable value in symbol tables
-                symbol_table = self.find_symbols_table(token.match, instruction.statement)
-                symbol_entry = symbol_table.get_entry_value(token.match)
+        if compiled_condition is None:
+            # First evaluation, compile condition and find its variables
+            # in symbols tables, they are reused for next evaluations.
+            compiled_condition = self.evaluator.compile(
+                condition.strip('"'), getattr(instruction.statement, "expression_tree", None))
+            instruction.condition_symbols = [
+                self.find_symbol_slot(name, instruction.statement)
+                for _, name in compiled_condition.variables]
+            instruction.compiled_condition = compiled_condition
 
-                # Substitute variable value in final condition
-                final_condition += str(symbol_entry.value)
-            else:
-                final_condition += str(token.match)
+        # Read current variables values
+        values = [self.operand_value(slot.values[slot.index])
+                  for slot in instruction.condition_symbols]
 
         # Evaluate final result of condition
-        result = Evaluator().evaluate(final_condition)
+        result = self.evaluator.evaluate_compiled(compiled_condition, values)
         return result
 
+    def find_symbol_slot(self, name: str, statement):
+        """ Find slot of variable name, slots are resolved by the compiler for
+            each statement, if a slot was not resolved, it is looked up in
+            symbols tables once and stored in the statement.
+        Args:
+            name: variable name to be found
+            statement: statement that references the variable
+        Returns:
+            SymbolSlot of variable {name}
+        Raises:
+            UnknownVariable: if variable is not found in symbols tables
+        """
+
+        slot = statement.symbol_slots.get(name)
+
+        if slot is None:
+            slot = find_symbol_slot(name, statement)
+
+        return slot
+
     def execute_goto_instruction(self, current_instruction):
         """ Execute GoTo label instruction
         Args:
             current_instruction: the instruction that contains goto label
         Returns:
-            None
+            goto index
         """
-        self.instruction_pointer = self.label_index_table[current_instruction.goto_label]
+        return current_instruction.goto_index
 
     def execute_variable_instruction(self, instruction: VariableInstruction):
         """ Execute variable assignment instruction
@@ -187,86 +526,65 @@ class Executor(object):
 
         if instruction.variable_statement.type == VariableType.ARRAY:
             # Array Type
-            symbols_table = self.find_symbols_table(variable_name, instruction.variable_statement)
-            symbols_table.modify_entry(variable_name, variable_value)
-        else:
-            # Tokenize variable value to make sure variable can be evaluated
-            tokens = EnhancedLexer().tokenize_text(variable_value)
-            if len(tokens) == 1:
-                self.handle_one_token_variable(instruction, variable_name, variable_value, tokens, operation)
-            else:
-                self.handle_multiple_tokens_variable(instruction, tokens, operation)
+            slot = self.find_symbol_slot(variable_name, instruction.variable_statement)
+            slot.values[slot.index] = variable_value
+            slot.value_types[slot.index] = ValueType.ARRAY
             return
 
-    def handle_multiple_tokens_variable(self, instruction, tokens, operation):
-        """ Evaluate multiple tokens variable expression.
-            For example: x = y + z
-            This method will determine the result of y + z and store it in x
-        Args:
-            instruction: variable instruction that contains the variable statement
-            tokens: variable statement tokens to be evaluated.
-        Returns:
-            None
-        """
+        assignment_type = instruction.assignment_type
 
-        final_expression = ""
+        if assignment_type is None:
+            # First execution, compile variable value once and find
+            # how it should be calculated
+            assignment_type = self.compile_variable_instruction(instruction)
 
-        is_concatenation = False
-        for token in tokens:
-            if token.token_type == TokenType.IDENTIFICATION:
-                # Substitute variable values in final expression to be evaluated
-                symbol_table = self.find_symbols_table(token.match, instruction.variable_statement)
-                symbol = symbol_table.get_entry_value(token.match)
+        if assignment_type == AssignmentType.CONSTANT:
+            value = instruction.constant_value
 
-                if symbol.type == TokenType.STRING:
-                    # Variables should be concatenated rather than evaluating them since
-                    # there is a string value
-                    is_concatenation = True
+        elif assignment_type == AssignmentType.VARIABLE:
+            slot = instruction.value_symbols[0]
+            value = slot.values[slot.index]
 
-                final_expression += str(symbol.value)
-                pass
-            else:
-                # if token.token_type != TokenType.ADD:
-                final_expression += str(token.match)
-            pass
+        elif assignment_type == AssignmentType.EXPRESSION:
+            values = [self.operand_value(slot.values[slot.index])
+                      for slot in instruction.value_symbols]
+            value = self.evaluator.evaluate_compiled(instruction.compiled_value, values)
 
-        if is_concatenation:
-            value = final_expression
         else:
-            value = Evaluator().evaluate(final_expression)
-        name = instruction.variable_name
+            # Substitute variables values in value text
+            value_parts = list(instruction.value_parts)
+            for index, slot in instruction.value_symbols:
+                value_parts[index] = str(slot.values[slot.index])
+            value = "".join(value_parts)
+
+            if assignment_type == AssignmentType.SUBSTITUTION:
+                value = self.evaluator.evaluate(value)
 
-        # Store value of variable
-        self.store_variable(name, value, operation, instruction)
+        self.store_variable(variable_name, value, operation, instruction)
 
-    def handle_one_token_variable(self, instruction, variable_name, variable_value, tokens, operation):
-        """ Evaluate one token variable assignment, example:
-            x = y or x = 1
+    def compile_variable_instruction(self, instruction: VariableInstruction):
+        """ Compile variable value once from its expression tree and store on the
+            instruction how the value is calculated
         Args:
-            instruction: instruction that contains variable statement.
-            variable_name: variable name
-            variable_value: variable value, could be a new value to be assigned or
-                            another variable that it's value should be assigned to variable_name
-            tokens: one token that contains variable y.
+            instruction: variable instruction that contains the variable statement
         Returns:
-            None
+            assignment type
         """
 
-        # if one token found, make sure the value is not another variable
-        if tokens[0].token_type == TokenType.IDENTIFICATION:
-
-            # Variable value is an assignment to another variable
-            symbol_table = self.find_symbols_table(variable_value, instruction.variable_statement)
+        return compile_variable_instruction(instruction, self.evaluator)
 
-            if not symbol_table:
-                raise UnknownVariable(f"Variable not found {variable_value}")
-
-            new_value = symbol_table.get_entry_value(variable_value)
+    def operand_value(self, value):
+        """ Convert variable value to expression operand, numbers are used natively,
+            any other value is used as text
+        Args:
+            value: variable value
+        Returns:
+            operand value
+        """
 
-            self.store_variable(variable_name, new_value.value, operation, instruction)
-        else:
-            # variable value is normal value not variable assignment to another variable
-            self.store_variable(instruction.variable_name, variable_value, operation, instruction)
+        if value.__class__ is float or value.__class__ is int:
+            return value
+        return str(value)
 
     def store_variable(self, variable_name, variable_value, operation, instruction):
         """ Store Variable value in the right location and apply operation
@@ -279,34 +597,30 @@ class Executor(object):
             None
         """
 
-        symbols_table = self.find_symbols_table(variable_name, instruction.variable_statement)
-        new_variable_value = variable_value
+        slot = self.find_symbol_slot(variable_name, instruction.variable_statement)
+        assignment_operation = ASSIGNMENT_OPERATIONS.get(operation)
 
-        if operation != TokenType.EQUAL:
+        if assignment_operation:
             # Apply Operation
 
-            old_value = symbols_table.get_entry_value(variable_name)
+            old_value = slot.values[slot.index]
 
-            if old_value:
-                old_value = old_value.value
+            # Operations are applied on floats, other values are converted,
+            # strings only if they are numbers
+            if old_value.__class__ is not float:
+                old_value = float(old_value)
+            if variable_value.__class__ is not float:
+                variable_value = float(variable_value)
 
-            if operation == TokenType.PLUSEQUAL:
-                new_variable_value = float(old_value) + float(variable_value)
-
-            elif operation == TokenType.SUBEQUAL:
-                new_variable_value = float(old_value) - float(variable_value)
-
-            elif operation == TokenType.MULTEQUAL:
-                new_variable_value = float(old_value) * float(variable_value)
-
-            elif operation == TokenType.DIVEQUAL:
-                new_variable_value = float(old_value) / float(variable_value)
+            slot.values[slot.index] = assignment_operation(old_value, variable_value)
+            slot.value_types[slot.index] = ValueType.REAL
+            return
 
-        symbols_table.modify_entry(variable_name, new_variable_value)
+        slot.values[slot.index] = variable_value
+        slot.value_types[slot.index] = value_type(variable_value)
 
     def find_symbols_table(self, name: str, statement):
         """ Find Symbol table that contains variable name
-
         Args:
             name: variable name to be found
             statement: A statement that can be used to lookup symbols table in
@@ -315,44 +629,7 @@ class Executor(object):
             Symbols table that contains variable {name}
         """
 
-        if (isinstance(statement, For)
-            or isinstance(statement, While)
-            or isinstance(statement, If)
-            or isinstance(statement, ElseIf)
-            or isinstance(statement, Else)
-            or isinstance(statement, ExecutionTree)):
-
-            if (statement.symbols_table
-                and statement.symbols_table.get_entry_value(name)):
-                # if the given statement is a scope statement, then
-                # lookup variable inside it's symbol tables, if it contains the value,
-                # return it directly, otherwise, lookup value in parents symbols tables.
-                return statement.symbols_table
-
-        # Go up one step
-        pointer = statement.parent
-
-        while True:
-
-            if isinstance(pointer, ConditionStatement):
-                # Skip Condition statement as it doesn't contain
-                # Symbols table, it is used only as an aggregator for
-                # if, elseif, else statements
-                pointer = pointer.parent
-
-            if pointer.symbols_table.get_entry_value(name):
-                return pointer.symbols_table
-
-            if isinstance(pointer, ExecutionTree):
-                # if we hit the execution tree, no more parents to check
-                # Should stop here.
-                break
-
-            # Go up one step
-            pointer = pointer.parent
-
-        # If we reach this point, then variable does not exist in symbols tables
-        return None
+        return find_symbols_table(name, statement)
 
     def increment_instruction_pointer(self):
         """
@@ -372,39 +649,21 @@ class Executor(object):
             None
         """
 
-        # Tokenize echo string and keep unknown tokens and spaces.
-        # Echo string might contain anything, this is needed only to find if
-        # echo string contains variables so they can be substituted.
-        tokens = Lexer().tokenize_text(
-            instruction.echo_string.strip('"'),
-            keep_unknown=True,
-            keep_spaces=True)
-
-        final_echo_string = ""
+        final_echo_parts = list(instruction.echo_parts)
 
-        for token in tokens:
-            if token.token_type == TokenType.IDENTIFICATIONBETWEENBRSCKETS:
-                # If echo string contains a variable between {} for example
-                # {variable_name}, Substitute variable_name with it's value
+        for echo_variable in instruction.echo_variables:
+            # Substitute {variable_name} slot with variable value
+            slot = echo_variable.slot
 
-                var_name = token.match
-                var_name = var_name.strip("{}")
+            if slot is None:
+                # Resolve variable the first time this echo is executed
+                slot = self.find_symbol_slot(echo_variable.name, instruction.statement)
+                echo_variable.slot = slot
 
-                symbol_table = self.find_symbols_table(var_name, instruction.statement)
-
-                if not symbol_table:
-                    raise UnknownVariable(f"Variable Not Found {var_name}")
-
-                value = symbol_table.get_entry_value(var_name).value
-                final_echo_string += str(value)
-            else:
-                if token.token_type == TokenType.NUMBER:
-                    final_echo_string += str(int(token.match))
-                else:
-                    final_echo_string += token.match
+            final_echo_parts[echo_variable.index] = str(slot.values[slot.index])
 
-        # Print final echo string
-        print(final_echo_string)
+        # Write final echo string
+        self.output.write_line("".join(final_echo_parts))
 
         return
 
@@ -417,11 +676,13 @@ class Executor(object):
         """
 
         variable_name = instruction.input_variable
-        symbol_table = self.find_symbols_table(variable_name, instruction.statement)
+        slot = self.find_symbol_slot(variable_name, instruction.statement)
 
-        if not symbol_table:
-            raise UnknownVariable(f"Variable Not Found {variable_name}")
+        # Echoed lines, like input prompts, are written before waiting for input
+        self.output.flush()
 
         # input from keyboard
         input_value = input()
-        symbol_table.modify_entry(variable_name, input_value)
+        value = native_value(input_value)
+        slot.values[slot.index] = value
+        slot.value_types[slot.index] = value_type(value)
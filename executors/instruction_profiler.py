@@ -0,0 +1,164 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Instruction Profiler Library
+
+Records how many times each instruction is executed by the Executor and the
+wall time spent executing it. Instructions carry the source line of the
+statement that generated them, so instructions time is also summed per
+source line to find slow lines of a program.
+
+Usage:
+    profiler = InstructionProfiler()
+    Executor(profiler=profiler).execute(instructions, execution_tree)
+    print(profiler.report(source_file="program.asl"))
+
+"""
+
+import linecache
+
+# perf_counter_ns() nanoseconds ---> milliseconds
+NANOSECONDS_PER_MILLISECOND = 1000000
+
+
+class InstructionProfiler:
+    """ Instruction Profiler Class
+
+    Class Attributes:
+        instructions: profiled instructions list
+        counts: number of executions of each instruction, by instruction index
+        times: wall time of executing each instruction in nanoseconds, by instruction index
+    """
+
+    def __init__(self) -> None:
+        """ Instruction Profiler Class Constructor
+        Args:
+            None
+        Returns:
+            None
+        """
+
+        self.instructions = []
+        self.counts = []
+        self.times = []
+
+    def start(self, instructions: list):
+        """ Prepare counters of instructions before they are executed, counters
+            of the same instructions list are kept and added to
+        Args:
+            instructions: instructions to be executed
+        Returns:
+            None
+        """
+
+        if instructions is self.instructions and len(self.counts) == len(instructions):
+            return
+
+        self.instructions = instructions
+        self.counts = [0] * len(instructions)
+        self.times = [0] * len(instructions)
+
+    def total_time(self) -> int:
+        """ Get wall time of all executed instructions
+        Args:
+            None
+        Returns:
+            time in nanoseconds
+        """
+
+        return sum(self.times)
+
+    def instruction_stats(self) -> list:
+        """ Get statistics of executed instructions, sorted by self time, an
+            instruction doesn't contain other instructions, so its self time is
+            its cumulative time
+        Args:
+            None
+        Returns:
+            list of dictionaries with index, instruction, line_number, count and time
+        """
+
+        stats = [
+            {
+                'index': index,
+                'instruction': instruction,
+                'line_number': instruction.line_number,
+                'count': self.counts[index],
+                'time': self.times[index],
+            }
+            for index, instruction in enumerate(self.instructions)
+            if self.counts[index]
+        ]
+
+        stats.sort(key=lambda stat: stat['time'], reverse=True)
+        return stats
+
+    def line_stats(self) -> list:
+        """ Get statistics of executed source lines, sorted by self time, the
+            time of a line is the time of instructions generated from its
+            statement, not of statements nested inside it
+        Args:
+            None
+        Returns:
+            list of dictionaries with line_number, hits, instructions and time,
+            hits is number of times line statement was executed, instructions is
+            number of instructions executed for it
+        """
+
+        lines = {}
+
+        for index, instruction in enumerate(self.instructions):
+            count = self.counts[index]
+            if not count:
+                continue
+
+            line = lines.get(instruction.line_number)
+            if not line:
+                line = {'line_number': instruction.line_number, 'hits': 0,
+                        'instructions': 0, 'time': 0}
+                lines[instruction.line_number] = line
+
+            line['hits'] = max(line['hits'], count)
+            line['instructions'] += count
+            line['time'] += self.times[index]
+
+        stats = list(lines.values())
+        stats.sort(key=lambda stat: stat['time'], reverse=True)
+        return stats
+
+    def report(self, limit: int = 20, source_file: str = None) -> str:
+        """ Build profile report of source lines and instructions sorted by self time
+        Args:
+            limit: Optional, maximum number of rows of each table
+            source_file: Optional, source file of program, code of lines is
+                         added to the report
+        Returns:
+            report text
+        """
+
+        total_time = self.total_time() or 1
+        rows = [f"{'line':>6} {'hits':>10} {'instructions':>13} {'time (ms)':>10} {'%':>6}  code"]
+
+        for stat in self.line_stats()[:limit]:
+            line_number = stat['line_number']
+            code = ""
+            if source_file and line_number:
+                code = linecache.getline(source_file, line_number).strip()
+
+            rows.append(f"{line_number if line_number else '-':>6} {stat['hits']:>10} "
+                        f"{stat['instructions']:>13} "
+                        f"{stat['time'] / NANOSECONDS_PER_MILLISECOND:>10.3f} "
+                        f"{stat['time'] / total_time:>6.1%}  {code}")
+
+        rows.append("")
+        rows.append(f"{'index':>6} {'line':>6} {'count':>10} {'time (ms)':>10} {'%':>6}  instruction")
+
+        for stat in self.instruction_stats()[:limit]:
+            line_number = stat['line_number']
+            rows.append(f"{stat['index']:>6} {line_number if line_number else '-':>6} "
+                        f"{stat['count']:>10} "
+                        f"{stat['time'] / NANOSECONDS_PER_MILLISECOND:>10.3f} "
+                        f"{stat['time'] / total_time:>6.1%}  {stat['instruction']}")
+
+        return "\n".join(rows)
@@ -0,0 +1,97 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Output Writer Library
+
+Buffers lines echoed by programs and writes them to the output sink at once
+when the buffer is full, instead of calling print() for each line. Executors
+flush the buffer before reading input, so prompts are written before the
+program waits for input, and when the program ends or fails.
+
+Usage:
+    output = OutputWriter(io.StringIO(), buffer_size=4096)
+    Executor(output=output).execute(instructions, execution_tree)
+    output.sink.getvalue()
+
+"""
+
+import sys
+
+# Number of buffered characters written to the sink at once
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+
+class OutputWriter:
+    """ Output Writer Class
+
+    Class Attributes:
+        sink: file like object that lines are written to, None for sys.stdout
+        buffer_size: number of buffered characters that are written at once
+        lines: buffered lines
+        buffered: number of buffered characters
+    """
+
+    def __init__(self, sink=None, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        """ Output Writer Class Constructor
+        Args:
+            sink: Optional, file like object that has write(), like a file or
+                  io.StringIO, if None, lines are written to sys.stdout at the
+                  time they are written, like print()
+            buffer_size: Optional, number of buffered characters that are
+                         written at once, lines are written immediately if 0
+        Returns:
+            None
+        """
+
+        self.sink = sink
+        self.buffer_size = buffer_size
+        self.lines = []
+        self.buffered = 0
+
+    def write_line(self, line: str):
+        """ Write line followed by new line
+        Args:
+            line: line text
+        Returns:
+            None
+        """
+
+        self.lines.append(line)
+        self.buffered += len(line) + 1
+
+        if self.buffered >= self.buffer_size:
+            self.write_lines()
+
+    def write_lines(self):
+        """ Write buffered lines to sink
+        Args:
+            None
+        Returns:
+            None
+        """
+
+        if not self.lines:
+            return
+
+        sink = self.sink if self.sink is not None else sys.stdout
+        self.lines.append("")
+        sink.write("\n".join(self.lines))
+        self.lines.clear()
+        self.buffered = 0
+
+    def flush(self):
+        """ Write buffered lines to sink and flush the sink, like before
+            reading input or when program ends
+        Args:
+            None
+        Returns:
+            None
+        """
+
+        self.write_lines()
+
+        sink = self.sink if self.sink is not None else sys.stdout
+        flush = getattr(sink, "flush", None)
+        if flush:
+            flush()
@@ -11,18 +11,146 @@ Contains methods that calculates expressions like
 
 """
 
-from exceptions.language_exception import ExpressionEvaluationError
+from collections import OrderedDict
+
+from exceptions.language_exception import ExpressionEvaluationError, SyntaxError
 from lexer.enhanced_lexer import EnhancedLexer
 from lexer.lexer import TokenType
+from parser.expression_parser import OPERATORS_PRECEDENCE, normalize_minus_signs
+from statements.expression import Constant, ExpressionType, VariableReference
+
+DEFAULT_RPN_CACHE_SIZE = 256
+
+RPN_OPERANDS = (TokenType.NUMBER, TokenType.REAL, TokenType.STRING, TokenType.IDENTIFICATION)
+
+
+class CompiledExpression:
+    """ Compiled Expression Class
+
+    An expression parsed once and turned into a list of operations, so it can
+    be evaluated many times with different variable values without lexing.
+
+    Class Attributes:
+        expression: expression text
+        registers: initial registers values, float for number constants, token
+                   match for other constants and None for variables and operations results
+        variables: list of (register index, variable name) pairs, variable values
+                   are stored in these registers before evaluating
+        operations: list of (operator, first register, second register, result register)
+                    in calculation order, operands before their operation
+        result_register: register that holds the result, None if expression
+                         doesn't calculate anything
+        is_valid: False if evaluating the expression always fails
+        single_token: True if expression contains one token, the result is then
+                      the token value itself
+    """
+
+    def __init__(self, expression: str) -> None:
+        """ Compiled Expression Class Constructor
+        Args:
+            expression: expression text
+        Returns:
+            None
+        """
+
+        self.expression = expression
+        self.registers = []
+        self.variables = []
+        self.operations = []
+        self.result_register = None
+        self.is_valid = True
+        self.single_token = False
+
+    def add_register(self, value=None):
+        """ Adds a new register
+        Args:
+            value: initial register value
+        Returns:
+            index of the new register
+        """
+
+        self.registers.append(value)
+        return len(self.registers) - 1
+
+    def __repr__(self) -> str:
+        return f"Compiled Expression: {self.expression} {self.operations}"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+
+class RpnProgram:
+    """ Reverse Polish Notation Program Class
+
+    Expression shape compiled by shunting-yard algorithm, the same program is
+    used by all expressions that have the same operators and parenthesis, like
+    i < n and 5 < 10, operands of each expression become its registers.
+
+    Class Attributes:
+        code: list of operand indexes (int) and operators (str) in RPN order
+        operands_count: number of operands the program expects
+    """
+
+    def __init__(self, code: list, operands_count: int) -> None:
+        """ RPN Program Class Constructor
+        Args:
+            code: list of operand indexes and operators in RPN order
+            operands_count: number of operands
+        Returns:
+            None
+        """
+
+        self.code = code
+        self.operands_count = operands_count
+
+    def __repr__(self) -> str:
+        return f"RPN Program: {self.code}"
+
+    def __str__(self) -> str:
+        return self.__repr__()
 
 
 class Evaluator:
-    """ Expression Evaluator Class """
+    """ Expression Evaluator Class
 
-    def __init__(self) -> None:
-        """ Expression Evaluator Class Constructor """
-        # empty constructor
-        pass
+    Expressions texts are compiled into RPN programs, programs are cached by
+    expression shape and compiled expressions are cached by text, both in LRU
+    caches of rpn_cache_size entries. Expression trees of the parser are
+    compiled without tokenizing them, their RPN program is the tree in post
+    order, so they are not cached.
+
+    Class Attributes:
+        rpn_cache_size: maximum number of cached RPN programs and of cached expressions texts
+        rpn_cache_hits: number of expressions texts that reused a cached RPN program
+        rpn_cache_misses: number of expressions texts compiled into a new RPN program
+        text_cache_hits: number of expressions texts that reused a cached compiled expression
+        text_cache_misses: number of expressions texts that were compiled
+        lexer: lexer that tokenizes expressions, shared by all evaluations
+    """
+
+    def __init__(self, rpn_cache_size: int = DEFAULT_RPN_CACHE_SIZE) -> None:
+        """ Expression Evaluator Class Constructor
+        Args:
+            rpn_cache_size: Optional, maximum number of cached RPN programs and
+                            of cached expressions texts
+        Returns:
+            None
+        """
+
+        self.rpn_cache_size = rpn_cache_size
+        self.rpn_cache_hits = 0
+        self.rpn_cache_misses = 0
+        self.text_cache_hits = 0
+        self.text_cache_misses = 0
+
+        # expression shape ---> RpnProgram
+        self.rpn_programs = OrderedDict()
+
+        # expression text ---> CompiledExpression, texts that are evaluated
+        # again are not tokenized again
+        self.compiled_expressions = OrderedDict()
+
+        self.lexer = EnhancedLexer()
 
     def clean_value(self, value):
         """ Convert value to float if type is float, or
@@ -34,7 +162,12 @@ class Evaluator:
         """
 
         result = None
-        if self.is_numeric(value):
+        if value.__class__ is float:
+            # native numbers are not parsed again
+            result = value
+        elif value.__class__ is int:
+            result = float(value)
+        elif self.is_numeric(value):
             result = float(value)
         elif isinstance(value, str):
             result = value.strip('"')
@@ -129,14 +262,17 @@ class Evaluator:
                 or token_type == TokenType.OR
                 or token_type == TokenType.NOT)
 
-    def evaluate(self, expression: str):
+    def evaluate(self, expression: str, variables: dict = None):
         """
         Desc:
             evaluate expression like (10 * 30 > 5),
             this should work for both logical and
-            mathematical expressions
+            mathematical expressions. Expression is compiled once, the same
+            way compile() compiles it, and evaluated as compiled expression
         Args:
             expression: expression to be evaluated
+            variables: Optional, variables values by name, variables that are
+                       not found are evaluated as their name text
         Returns:
             result of evaluating expression
         """
@@ -144,69 +280,346 @@ class Evaluator:
         if not expression:
             return False
 
-        # "strip double and single quotes "
-        # expression = expression.strip("'")
-        # expression = expression.strip('"')
-
-        lexer = EnhancedLexer()
-        tokens = lexer.tokenize_text(expression)
-        result = False
+        compiled = self.compile(expression)
 
-        # if only one token, return the same expression
-        if len(tokens) == 1:
-            result = expression
+        if variables:
+            values = [variables.get(name, name) for _, name in compiled.variables]
         else:
-            try:
-                result = self.evaluate_tokens(tokens)
-            except Exception as e:
-                raise ExpressionEvaluationError(
-                    f"Unable to evaluate expression {expression}")
-        return result
+            values = [name for _, name in compiled.variables]
 
-    def evaluate_tokens(self, tokens: list):
+        return self.evaluate_compiled(compiled, values)
+
+    def rpn_program(self, tokens: list) -> RpnProgram:
+        """ Get RPN program of tokens shape from cache, or compile it
+        Args:
+            tokens: expression tokens
+        Returns:
+            RpnProgram
         """
-        Desc:
-           Evaluate list of tokens and returns result
+
+        # operands become registers of compiled expressions, they are not part of the shape
+        shape = tuple(None if token.token_type in RPN_OPERANDS else token.match
+                      for token in tokens)
+
+        program = self.rpn_programs.get(shape)
+
+        if program is not None:
+            self.rpn_cache_hits += 1
+            self.rpn_programs.move_to_end(shape)
+            return program
+
+        self.rpn_cache_misses += 1
+        program = self.compile_rpn(tokens)
+        self.cache_rpn(self.rpn_programs, shape, program)
+        return program
+
+    def tree_rpn_program(self, expression_tree):
+        """ Get RPN program of expression tree, the program code is the tree in
+            post order, it is built without shunting-yard algorithm. Programs of
+            trees are not cached, building the code is the same work as finding
+            the shape of the tree
+        Args:
+            expression_tree: expression tree
+        Returns:
+            RpnProgram, and list of operands nodes in the order they appear
+        """
+
+        code = []
+        operands = []
+        # stack of nodes and operators pushed after their operands
+        stack = [expression_tree]
+
+        while stack:
+            expression = stack.pop()
+
+            if expression.__class__ is str:
+                code.append(expression)
+            elif expression.type == ExpressionType.OPERATION:
+                stack.extend((expression.operator, expression.right, expression.left))
+            else:
+                code.append(len(operands))
+                operands.append(expression)
+
+        return RpnProgram(code, len(operands)), operands
+
+    def compile_rpn(self, tokens: list) -> RpnProgram:
+        """ Compile tokens into RPN program by shunting-yard algorithm, operators
+            precedence is the same as ExpressionParser operators precedence
         Args:
-            tokens: list of tokens
+            tokens: expression tokens
         Returns:
-            result of evaluating tokens
+            RpnProgram
+        Raises:
+            SyntaxError: if tokens are not a valid expression
         """
 
-        values_stack = []
+        code = []
         operators_stack = []
+        operands_count = 0
+        expect_operand = True
 
         for token in tokens:
             token_type = token.token_type
-            value = token.match
-            if self._is_operator(token_type):
-                operators_stack.append(value)
-
-            if (token_type == TokenType.SPACE
-                or token_type == TokenType.OPENPARENTHESIS):
-                # Do Nothing
-                pass
-
-            if token_type == TokenType.CLOSINGPARENTHESIS:
-                value1 = values_stack.pop()
-                value2 = values_stack.pop()
-                operator = operators_stack.pop()
-                result = self.calculate(value2, value1, operator)
-                values_stack.append(result)
-                pass
-
-            if (token_type == TokenType.NUMBER
-                or token_type == TokenType.REAL
-                or token_type == TokenType.STRING
-                or token_type == TokenType.IDENTIFICATION):
-                values_stack.append(value)
-            pass
+
+            if token_type in RPN_OPERANDS and expect_operand:
+                code.append(operands_count)
+                operands_count += 1
+                expect_operand = False
+
+            elif token_type in OPERATORS_PRECEDENCE and not expect_operand:
+                precedence = OPERATORS_PRECEDENCE[token_type]
+                # operators with the same precedence are calculated from left to right
+                while (operators_stack
+                       and operators_stack[-1].token_type != TokenType.OPENPARENTHESIS
+                       and OPERATORS_PRECEDENCE[operators_stack[-1].token_type] >= precedence):
+                    code.append(operators_stack.pop().match)
+                operators_stack.append(token)
+                expect_operand = True
+
+            elif token_type == TokenType.OPENPARENTHESIS and expect_operand:
+                operators_stack.append(token)
+
+            elif token_type == TokenType.CLOSINGPARENTHESIS and not expect_operand:
+                while (operators_stack
+                       and operators_stack[-1].token_type != TokenType.OPENPARENTHESIS):
+                    code.append(operators_stack.pop().match)
+                if not operators_stack:
+                    raise SyntaxError("parenthesis error", token)
+                operators_stack.pop()
+
+            else:
+                raise SyntaxError("unexpected token in expression", token)
+
+        if expect_operand:
+            raise SyntaxError("missing operand in expression")
 
         while operators_stack:
             operator = operators_stack.pop()
-            value1 = values_stack.pop()
-            value2 = values_stack.pop()
-            result = self.calculate(value2, value1, operator)
-            values_stack.append(result)
+            if operator.token_type == TokenType.OPENPARENTHESIS:
+                raise SyntaxError("parenthesis error", operator)
+            code.append(operator.match)
 
-        return result
+        return RpnProgram(code, operands_count)
+
+    def cache_rpn(self, cache: OrderedDict, key, value):
+        """ Adds value to LRU cache, least recently used value is removed
+            when cache is full
+        Args:
+            cache: cache ordered dictionary, least recently used first
+            key: cache key
+            value: cached value
+        Returns:
+            None
+        """
+
+        cache[key] = value
+        if len(cache) > self.rpn_cache_size:
+            cache.popitem(last=False)
+
+    def rpn_cache_info(self) -> dict:
+        """ Get RPN programs cache and compiled texts cache statistics
+        Args:
+            None
+        Returns:
+            dictionary of hits, misses and entries count of each cache, and
+            maximum cache size
+        """
+
+        return {
+            "program_hits": self.rpn_cache_hits,
+            "program_misses": self.rpn_cache_misses,
+            "programs": len(self.rpn_programs),
+            "text_hits": self.text_cache_hits,
+            "text_misses": self.text_cache_misses,
+            "texts": len(self.compiled_expressions),
+            "max_size": self.rpn_cache_size,
+        }
+
+    def compile(self, expression: str, expression_tree=None) -> CompiledExpression:
+        """
+        Desc:
+            Compiles expression once into operations that evaluate_compiled() can run
+            many times, variables (identifiers) become registers that get their values
+            at evaluation time. Operations are built from the RPN program of the
+            expression, programs of texts are shared by texts of the same shape
+        Args:
+            expression: expression to be compiled, like (i < n)
+            expression_tree: Optional, expression tree of expression parsed by the
+                             parser, expression is not tokenized if it is given
+        Returns:
+            CompiledExpression
+        """
+
+        if (expression_tree is not None
+            and expression_tree.type == ExpressionType.CONSTANT
+            and expression_tree.token_type == TokenType.STRING):
+            # one string token expression value is its text without quotes
+            expression_tree = None
+
+        if expression_tree is None:
+            return self.compile_text(expression)
+
+        compiled = CompiledExpression(expression)
+
+        if expression_tree.type != ExpressionType.OPERATION:
+            # parser stores trees without operations for one token expressions only
+            compiled.single_token = True
+            if expression_tree.type == ExpressionType.VARIABLE:
+                compiled.variables.append((compiled.add_register(), expression_tree.name))
+            else:
+                compiled.add_register(self.constant_register(expression_tree, False))
+            return compiled
+
+        program, operands = self.tree_rpn_program(expression_tree)
+        compiled.result_register = self.compile_rpn_program(compiled, program, operands)
+        return compiled
+
+    def compile_text(self, expression: str) -> CompiledExpression:
+        """ Compile expression text into cached RPN program of its shape, compiled
+            expressions are cached by text, so the same text is tokenized once
+        Args:
+            expression: expression text
+        Returns:
+            CompiledExpression
+        """
+
+        compiled = self.compiled_expressions.get(expression)
+
+        if compiled is not None:
+            self.compiled_expressions.move_to_end(expression)
+            self.text_cache_hits += 1
+            return compiled
+
+        self.text_cache_misses += 1
+        compiled = CompiledExpression(expression)
+        tokens = self.normalize_minus_signs(self.lexer.tokenize_text(expression))
+
+        if len(tokens) <= 1:
+            # empty or one token expression is not calculated, its value is the result
+            compiled.single_token = True
+            if not tokens:
+                compiled.add_register("")
+            elif tokens[0].token_type == TokenType.IDENTIFICATION:
+                compiled.variables.append((compiled.add_register(), tokens[0].match))
+            else:
+                compiled.add_register(tokens[0].match)
+        else:
+            try:
+                program = self.rpn_program(tokens)
+            except SyntaxError:
+                program = None
+
+            if program is None or len(program.code) == 1:
+                # invalid expression, or evaluating tokens without calculating
+                # anything, like (x), is an error
+                compiled.is_valid = False
+            else:
+                operands = [VariableReference(token.match)
+                            if token.token_type == TokenType.IDENTIFICATION
+                            else Constant(token.token_type, token.match)
+                            for token in tokens if token.token_type in RPN_OPERANDS]
+                compiled.result_register = self.compile_rpn_program(compiled, program, operands)
+
+        self.cache_rpn(self.compiled_expressions, expression, compiled)
+        return compiled
+
+    def compile_rpn_program(self, compiled: CompiledExpression, program: RpnProgram, operands: list) -> int:
+        """ Adds registers and operations of RPN program to compiled expression,
+            operands of the expression become registers, operands are compiled
+            before their operation
+        Args:
+            compiled: compiled expression
+            program: RPN program of expression shape
+            operands: operands of expression, Constant and VariableReference nodes
+                      in the order they appear
+        Returns:
+            register that holds the result
+        """
+
+        stack = []
+        for item in program.code:
+            if item.__class__ is int:
+                operand = operands[item]
+                if operand.type == ExpressionType.VARIABLE:
+                    register = compiled.add_register()
+                    compiled.variables.append((register, operand.name))
+                else:
+                    # numbers are converted once here, not in every evaluation
+                    register = compiled.add_register(self.constant_register(operand))
+            else:
+                value2 = stack.pop()
+                value1 = stack.pop()
+                register = compiled.add_register()
+                compiled.operations.append((item, value1, value2, register))
+            stack.append(register)
+
+        return stack[0]
+
+    def constant_register(self, constant, convert_numbers: bool = True):
+        """ Register value of a constant expression node
+        Args:
+            constant: Constant expression node
+            convert_numbers: Optional, if True, numbers are converted to float,
+                             otherwise they are kept as text
+        Returns:
+            True or False for boolean constants, float or text for other constants
+        """
+
+        if constant.token_type == TokenType.TRUE:
+            return True
+
+        if constant.token_type == TokenType.FALSE:
+            return False
+
+        value = constant.value
+        if (convert_numbers
+            and constant.token_type != TokenType.STRING
+            and self.is_numeric(value)):
+            value = float(value)
+        return value
+
+    def normalize_minus_signs(self, tokens):
+        """ Apply negative numbers and subtraction rule of expressions texts, a minus
+            sign followed by a number after an operand or a closing parenthesis
+            is subtraction, see expression_parser.normalize_minus_signs()
+        Args:
+            tokens: expression tokens
+        Returns:
+            tokens
+        """
+
+        return normalize_minus_signs(tokens, True)
+
+    def evaluate_compiled(self, compiled: CompiledExpression, values: list):
+        """
+        Desc:
+            Evaluates a compiled expression
+        Args:
+            compiled: expression compiled by compile()
+            values: variables values, in the order of compiled.variables. Numbers
+                    are int or float, any other value is passed as string
+        Returns:
+            result of evaluating expression
+        """
+
+        if compiled.single_token:
+            # one token expression result is its text, like evaluate()
+            value = str(values[0]) if compiled.variables else compiled.registers[0]
+            return value if value else False
+
+        if not compiled.is_valid:
+            raise ExpressionEvaluationError(
+                f"Unable to evaluate expression {compiled.expression}")
+
+        registers = list(compiled.registers)
+        for (register, _), value in zip(compiled.variables, values):
+            registers[register] = value
+
+        try:
+            for operator, value1, value2, result in compiled.operations:
+                registers[result] = self.calculate(registers[value1], registers[value2], operator)
+        except Exception as e:
+            raise ExpressionEvaluationError(
+                f"Unable to evaluate expression {compiled.expression}")
+
+        return registers[compiled.result_register]
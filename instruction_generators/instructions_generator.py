@@ -11,10 +11,15 @@ Converts execution tree into executable instructions list
 
 from compiler.compiler import ExecutionTree
 from exceptions.language_exception import UnexpectedError
-from instructions.instruction import (EchoInstruction, GotoInstruction,
-                                      InputInstruction, Instruction,
-                                      InstructionType, JumpIfNotInstruction,
-                                      LabelInstruction, VariableInstruction)
+from instructions.instruction import (CountedLoopInstruction,
+                                      EchoInstruction, EchoVariable,
+                                      GotoInstruction, InputInstruction,
+                                      Instruction, InstructionType,
+                                      JumpIfNotInstruction, LabelInstruction,
+                                      VariableInstruction)
+from lexer.lexer import Lexer
+from parser.enhanced_parser import parse_echo_string
+from statements.expression import constant_condition
 from statements.statement import (Break, ConditionStatement, Continue, Echo,
                                   For, Input, Variable, While)
 
@@ -30,17 +35,29 @@ class InstructionsGenerator:
         execution_tree: execution tree to be converted to instructions list
         start_label_loop_stack: start loop stack to store start of loop label
         end_label_loop_stack: end loop stack to store end of loop label
+        counted_loops: True if counted for loops are generated with counted loop instruction
+        line_number: source line of statement being generated, added to its instructions
+        echo_lexer: lexer that tokenizes echo strings
 
     """
 
-    def __init__(self) -> None:
-        """ Instructions Generator Class Constructor """
+    def __init__(self, counted_loops: bool = True) -> None:
+        """ Instructions Generator Class Constructor
+        Args:
+            counted_loops: Optional, if False, counted for loops are generated
+                           as other for loops
+        Returns:
+            None
+        """
 
+        self.counted_loops = counted_loops
         self.instruction_list = []
         self.label_counter = 0
         self.execution_tree = None
         self.start_label_loop_stack = []
         self.end_label_loop_stack = []
+        self.line_number = None
+        self.echo_lexer = Lexer()
 
     def create_label_tag(self):
         """ Create Label Tag and increment label counter.
@@ -69,8 +86,39 @@ class InstructionsGenerator:
         Returns:
             None
         """
+        instruction.line_number = self.line_number
         self.instruction_list.append(instruction)
 
+    def generate_condition_jump(self, label: LabelInstruction, condition: str, statement):
+        """ Generate jump to label if condition is false, conditions with constant
+            value don't need to be evaluated, always false conditions jump by goto
+            and always true conditions don't jump
+        Args:
+            label: label to jump to
+            condition: condition string
+            statement: statement that contains the condition
+        Returns:
+            None
+        """
+
+        constant_condition = self.constant_condition(statement)
+
+        if constant_condition is None:
+            self._add_instruction(JumpIfNotInstruction(label.label_name, condition, statement))
+
+        elif not constant_condition:
+            self._add_instruction(GotoInstruction(label.label_name))
+
+    def constant_condition(self, statement):
+        """ Get value of statement condition if it is constant
+        Args:
+            statement: statement that contains a condition
+        Returns:
+            True or False if condition is always true or false, None otherwise
+        """
+
+        return constant_condition(getattr(statement, "expression_tree", None))
+
     def generate_instructions(self, execution_tree: ExecutionTree) -> list:
         """ Compile statements into instructions
         Args:
@@ -81,11 +129,41 @@ class InstructionsGenerator:
 
         self.execution_tree = execution_tree
 
+        # generator can generate instructions of many programs
+        self.instruction_list = []
+        self.label_counter = 0
+        self.start_label_loop_stack = []
+        self.end_label_loop_stack = []
+        self.line_number = None
+
         # if none or no elements in execution tree, return empty list.
         if not execution_tree or not execution_tree.tree:
             return []
 
-        return self.build_instructions_list(execution_tree.tree)
+        instructions = self.build_instructions_list(execution_tree.tree)
+        self.link_instructions(instructions)
+        return instructions
+
+    def link_instructions(self, instructions: list):
+        """ Resolves goto labels of jump instructions to indexes of their labels
+            in instructions list, so that the executor doesn't lookup labels by name
+        Args:
+            instructions: list of instructions
+        Returns:
+            None
+        """
+
+        label_index_table = {}
+        for index, instruction in enumerate(instructions):
+            if instruction.type == InstructionType.LABEL:
+                label_index_table[instruction.label_name] = index
+
+        for instruction in instructions:
+            if (instruction.type == InstructionType.GOTO
+                or instruction.type == InstructionType.JUMP_IF
+                or instruction.type == InstructionType.JUMP_IF_NOT
+                or instruction.type == InstructionType.COUNTED_LOOP):
+                instruction.goto_index = label_index_table.get(instruction.goto_label)
 
     def build_instructions_list(self, execution_tree: list) -> list:
         """ Compile statements into instructions
@@ -95,8 +173,12 @@ class InstructionsGenerator:
             list of instructions
         """
 
+        # instructions after children statements belong to parent statement
+        parent_line_number = self.line_number
+
         # for each statement in execution tree, generate instructions
         for statement in execution_tree:
+            self.line_number = statement.line_number
 
             # For Statement
             if isinstance(statement, For):
@@ -130,6 +212,7 @@ class InstructionsGenerator:
             elif isinstance(statement, Continue):
                 self.generate_continue_statement()
 
+        self.line_number = parent_line_number
         return self.instruction_list
 
     def generate_continue_statement(self):
@@ -183,9 +266,42 @@ class InstructionsGenerator:
             None
         """
 
-        instruction = EchoInstruction(InstructionType.ECHO, statement)
-        instruction.echo_string = statement.echo_string
-        self.instruction_list.append(instruction)
+        echo_parts, echo_variables = self.compile_echo_statement(statement)
+        instruction = EchoInstruction(statement.echo_string, statement,
+                                      echo_parts, echo_variables)
+        self._add_instruction(instruction)
+
+    def compile_echo_statement(self, statement: Echo):
+        """ Compiles echo statement into literal parts and variable slots, echo
+            string parsed by the parser is not tokenized again
+        Args:
+            statement: echo statement
+        Returns:
+            tuple of echo parts list and echo variables list
+        """
+
+        if statement.echo_parts is None:
+            return self.compile_echo_string(statement.echo_string)
+
+        return statement.echo_parts, [EchoVariable(index, name)
+                                      for index, name in statement.echo_variables]
+
+    def compile_echo_string(self, echo_string):
+        """ Compiles echo string once into literal parts and variable slots,
+            so executing echo is only joining the parts after filling the slots
+            with variable values.
+
+            Example:
+                "{i} is even" ---> parts ['', ' is even'], variables [{i} at index 0]
+
+        Args:
+            echo_string: echo string between double quotes
+        Returns:
+            tuple of echo parts list and echo variables list
+        """
+
+        echo_parts, echo_variables = parse_echo_string(echo_string, self.echo_lexer)
+        return echo_parts, [EchoVariable(index, name) for index, name in echo_variables]
 
     def generate_input_statement(self, statement):
         """ Method to create input instruction
@@ -197,7 +313,7 @@ class InstructionsGenerator:
 
         instruction = InputInstruction(InstructionType.INPUT, statement)
         instruction.input_variable = statement.input_variable
-        self.instruction_list.append(instruction)
+        self._add_instruction(instruction)
 
     def generate_for_loop(self, statement):
         """
@@ -233,6 +349,13 @@ class InstructionsGenerator:
             None
         """
 
+        if (self.counted_loops
+            and statement.counted_loop
+            and statement.statements
+            and statement.statements[-1] is statement.loop_increment):
+            self.generate_counted_loop(statement)
+            return
+
         # create label_1
         label_1 = self.generate_label()
         self._add_instruction(label_1)
@@ -248,8 +371,7 @@ class InstructionsGenerator:
 
         # Jump statement to be executed to determine if loop should continue
         # or not based on loop condition
-        jump_for = JumpIfNotInstruction(label2.label_name, statement.loop_condition, statement)
-        self._add_instruction(jump_for)
+        self.generate_condition_jump(label2, statement.loop_condition, statement)
 
         # generate instruction for loop statements
         self.end_label_loop_stack.append(label2)
@@ -261,6 +383,7 @@ class InstructionsGenerator:
         # this label will be used in case of continue statement to increment the for loop
         # variable and then check loop condition to determine weather the program should execute
         # the next iteration or not.
+        before_increment_label.line_number = statement.line_number
         self.instruction_list.insert(len(self.instruction_list) - 1, before_increment_label)
         self.start_label_loop_stack.pop()
         self.end_label_loop_stack.pop()
@@ -272,6 +395,60 @@ class InstructionsGenerator:
         # End of Loop Label
         self._add_instruction(label2)
 
+    def generate_counted_loop(self, statement):
+        """
+        This method builds counted for loop instructions, loop condition is evaluated
+        once before the loop, counted loop instruction increments loop variable and
+        evaluates loop condition after loop statements:
+
+                instructions:
+                    -----------------------
+                    before statements
+                    start
+                    Label_1:
+                        Jump If not $condition to Label_2
+                    Label_3:
+                        statements inside for
+                    loop_increment_label:
+                        Counted loop increment, if $condition goto Label_3
+                    Label_2:
+                    after statements
+                    -----------------------
+
+        Args:
+            statement: For loop statement that has a counted loop
+        Returns:
+            None
+        """
+
+        label_1 = self.generate_label()
+        self._add_instruction(label_1)
+
+        before_increment_label = self.generate_label()
+        self.start_label_loop_stack.append(before_increment_label)
+
+        label2 = self.generate_label()
+        self.generate_condition_jump(label2, statement.loop_condition, statement)
+
+        label_3 = self.generate_label()
+        self._add_instruction(label_3)
+
+        # Build instructions for children statements, except loop increment
+        self.end_label_loop_stack.append(label2)
+        self.build_instructions_list(statement.statements[:-1])
+        self.start_label_loop_stack.pop()
+        self.end_label_loop_stack.pop()
+
+        # continue statement jumps to loop increment
+        self._add_instruction(before_increment_label)
+
+        increment = VariableInstruction(statement.loop_increment)
+        self._add_instruction(CountedLoopInstruction(
+            label_3.label_name, statement.loop_condition, increment, statement))
+
+        # End of Loop Label
+        self._add_instruction(label2)
+
     def generate_while_statement(self, statement):
         """
         Create instructions for While loop statement
@@ -302,20 +479,19 @@ class InstructionsGenerator:
         """
 
         label_1 = self.generate_label()
-        self.instruction_list.append(label_1)
+        self._add_instruction(label_1)
         self.start_label_loop_stack.append(label_1)
 
         label2 = self.generate_label()
-        jump = JumpIfNotInstruction(label2.label_name, statement.condition, statement)
-        self.instruction_list.append(jump)
+        self.generate_condition_jump(label2, statement.condition, statement)
         self.end_label_loop_stack.append(label2)
 
         # call for children
         self.build_instructions_list(statement.statements)
 
         goto = GotoInstruction(label_1.label_name)
-        self.instruction_list.append(goto)
-        self.instruction_list.append(label2)
+        self._add_instruction(goto)
+        self._add_instruction(label2)
 
         self.start_label_loop_stack.pop()
         self.end_label_loop_stack.pop()
@@ -416,10 +592,9 @@ class InstructionsGenerator:
 
         if statement.elseif_statements:
             for else_if in statement.elseif_statements:
+                self.line_number = else_if.line_number
                 label_3 = self.generate_label()
-                jump2 = JumpIfNotInstruction(
-                    label_3.label_name, else_if.condition, else_if)
-                self._add_instruction(jump2)
+                self.generate_condition_jump(label_3, else_if.condition, else_if)
                 self.build_instructions_list(else_if.statements)
 
                 goto_end = GotoInstruction(end_label.label_name)
@@ -427,6 +602,8 @@ class InstructionsGenerator:
 
                 self._add_instruction(label_3)
 
+            self.line_number = statement.line_number
+
     def handle_if_condition(self, statement, end_label):
         """ Create instructions for if statement condition
 
@@ -469,9 +646,8 @@ class InstructionsGenerator:
         label_1 = self.generate_label()
         self._add_instruction(label_1)
         label_2 = self.generate_label()
-        jump = JumpIfNotInstruction(
-            label_2.label_name, statement.if_statement.condition, statement.if_statement)
-        self._add_instruction(jump)
+        self.generate_condition_jump(
+            label_2, statement.if_statement.condition, statement.if_statement)
         self.build_instructions_list(statement.if_statement.statements)
         goto_end = GotoInstruction(end_label.label_name)
         self._add_instruction(goto_end)
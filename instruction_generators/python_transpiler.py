@@ -0,0 +1,757 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Python Transpiler
+
+Alternative backend to InstructionsGenerator, converts execution tree into
+python source code of one function and compiles it with compile(). Variables
+become local variables of the function, loops become python loops and
+expressions are calculated directly with the same rules as the Evaluator.
+
+Program output and errors are the same as executing instructions generated
+by InstructionsGenerator, errors that the executor raises when executing a
+statement are raised when the same statement is executed. Echoed lines are
+written to the OutputWriter of the executor, which is flushed before reading
+input and when the program ends or fails.
+
+    x = 0
+    while (x < 3)
+        x += 1
+        echo "{x}"
+    endwhile
+
+    def asl_program(initial_values, write_line, flush, _o=..., input=input, ...):
+        v0 = initial_values[0]
+        v0 = 0
+        while True:
+            try:
+                _r = ((v0 if v0.__class__ is float else _o(v0)) < 3.0)
+            except Exception:
+                raise ExpressionEvaluationError('Unable to evaluate expression (x < 3)') from None
+            if not _r:
+                break
+            v0 = (v0 if v0.__class__ is float else float(v0)) + 1
+            write_line(str(v0))
+
+"""
+
+from exceptions.language_exception import (ExpressionEvaluationError, TranspileError,
+                                           UnexpectedError, UnknownVariable)
+from compiler.compiler import find_symbol_slot
+from executors.executor import compile_variable_instruction
+from executors.output_writer import OutputWriter
+from expression_evaluators.expression_evaluator import Evaluator
+from instruction_generators.instructions_generator import InstructionsGenerator
+from instructions.instruction import AssignmentType, VariableInstruction
+from lexer.lexer import TokenType
+from statements.statement import (Break, ConditionStatement, Continue, Echo,
+                                  For, Input, Variable, VariableType, While)
+from symbols.symbols_table import native_value
+
+# Python expression of each evaluator operator, a and b are cleaned values
+OPERATORS = {
+    "+": "({a} + {b})",
+    "-": "({a} - {b})",
+    "*": "({a} * {b})",
+    "/": "({a} / {b})",
+    "%": "({a} % {b})",
+    "^": "(int({a}) ^ int({b}))",
+    "&": "_and({a}, {b})",
+    "|": "_or({a}, {b})",
+    ">": "({a} > {b})",
+    "<": "({a} < {b})",
+    ">=": "({a} >= {b})",
+    "<=": "({a} <= {b})",
+    "==": "({a} == {b})",
+    "!=": "({a} != {b})",
+}
+
+# Python operation of each assignment operator, a is the old value and b the new
+# value, both converted to floats
+ASSIGNMENT_OPERATIONS = {
+    TokenType.PLUSEQUAL: "{a} + {b}",
+    TokenType.SUBEQUAL: "{a} - {b}",
+    TokenType.MULTEQUAL: "{a} * {b}",
+    TokenType.DIVEQUAL: "{a} / {b}",
+}
+
+FUNCTION_NAME = "asl_program"
+
+
+class LoopContext:
+    """ Loop Context Class
+
+    Class Attributes:
+        statement: for or while statement
+        broken_flag: name of local variable that tells if the loop body was left
+                     by break, used by for loops that need to run their last
+                     statement (increment) on continue, None otherwise
+    """
+
+    def __init__(self, statement, broken_flag=None) -> None:
+        """ Loop Context Class Constructor
+        Args:
+            statement: loop statement
+            broken_flag: Optional, broken flag local variable name
+        Returns:
+            None
+        """
+
+        self.statement = statement
+        self.broken_flag = broken_flag
+
+
+class PythonTranspiler:
+    """ Python Transpiler Class
+
+    Class Attributes:
+        lines: generated python source lines
+        indentation: current indentation level
+        variables: dictionary of (values array id, index) to local variable name
+        initial_values: initial value of each local variable
+        constants: values referenced by generated code, name to value
+        loop_stack: loops that contain the statement being generated
+        label_counter: counter used to create unique local names
+        evaluator: evaluator used to compile expressions
+        source: generated python source of last transpiled program
+    """
+
+    def __init__(self) -> None:
+        """ Python Transpiler Class Constructor """
+
+        self.reset()
+
+    def reset(self):
+        """ Reset state of transpiled program, each program is transpiled
+            from empty state
+        Args:
+            None
+        Returns:
+            None
+        """
+
+        self.lines = []
+        self.indentation = 0
+        self.variables = {}
+        self.initial_values = []
+        self.constants = {}
+        self.loop_stack = []
+        self.label_counter = 0
+        self.evaluator = Evaluator()
+        self.source = ""
+
+    def transpile(self, execution_tree, output: OutputWriter = None):
+        """ Transpile execution tree into a python function
+        Args:
+            execution_tree: execution tree generated by the compiler
+            output: Optional, OutputWriter to write echoed lines to, like the
+                    output of the executor, lines are buffered and written to
+                    sys.stdout if None
+        Returns:
+            function without arguments that runs the program
+        Raises:
+            TranspileError: if python can't compile the generated code, like
+                            loops nested deeper than python allows
+        """
+
+        self.reset()
+
+        body = []
+        if execution_tree and execution_tree.tree:
+            self.lines = body
+            self.indentation = 1
+            self.generate_statements(execution_tree.tree)
+
+        header = [f"def {FUNCTION_NAME}(initial_values, write_line, flush, "
+                  f"{self.helpers_arguments()}):"]
+        for name, index in self.local_variables():
+            header.append(f"    {name} = initial_values[{index}]")
+        if not body and len(header) == 1:
+            body.append("    pass")
+
+        self.source = "\n".join(header + body) + "\n"
+
+        namespace = dict(self.constants)
+        try:
+            code = compile(self.source, f"<{FUNCTION_NAME}>", "exec")
+        except (SyntaxError, RecursionError, MemoryError) as e:
+            raise TranspileError(f"Unable to transpile program: {e}")
+        exec(code, namespace)
+
+        function = namespace[FUNCTION_NAME]
+        initial_values = list(self.initial_values)
+        output = output if output else OutputWriter()
+
+        def run_program():
+            try:
+                function(initial_values, output.write_line, output.flush)
+            finally:
+                # Buffered output is written when program ends or fails
+                output.flush()
+
+        return run_program
+
+    def helpers_arguments(self):
+        """ Helpers are default arguments of the generated function, so that
+            generated code reads them as local variables
+        Args:
+            None
+        Returns:
+            arguments source
+        """
+
+        helpers = {
+            "_o": self.operand,
+            "_c": self.evaluator.clean_value,
+            "_and": self.logical_and,
+            "_or": self.logical_or,
+            "_evaluate": self.evaluator.evaluate,
+            "_native": native_value,
+            "ExpressionEvaluationError": ExpressionEvaluationError,
+        }
+        self.constants.update({f"_helper{name}": helper for name, helper in helpers.items()})
+        arguments = [f"{name}=_helper{name}" for name in helpers]
+        arguments += ["float=float", "int=int", "str=str", "input=input"]
+        return ", ".join(arguments)
+
+    def local_variables(self):
+        """ Get local variables names and indexes in initial values
+        Args:
+            None
+        Returns:
+            list of (name, index)
+        """
+
+        return [(name, int(name[1:])) for name in self.variables.values()]
+
+    def operand(self, value):
+        """ Convert variable value to cleaned expression operand, same as the
+            executor operand_value() followed by evaluator clean_value()
+        Args:
+            value: variable value
+        Returns:
+            cleaned value
+        """
+
+        if value.__class__ is not float and value.__class__ is not int:
+            value = str(value)
+        return self.evaluator.clean_value(value)
+
+    def logical_and(self, value1, value2):
+        """ Evaluator & operator, both values are calculated before """
+        return value1 and value2
+
+    def logical_or(self, value1, value2):
+        """ Evaluator | operator, both values are calculated before """
+        return value1 or value2
+
+    def emit(self, line: str):
+        """ Adds a line of code at current indentation
+        Args:
+            line: code line
+        Returns:
+            None
+        """
+
+        self.lines.append("    " * self.indentation + line)
+
+    def add_constant(self, value) -> str:
+        """ Adds a value referenced by generated code
+        Args:
+            value: constant value
+        Returns:
+            name of constant
+        """
+
+        name = f"_k{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    def literal(self, value) -> str:
+        """ Python source of a value
+        Args:
+            value: int, float, str, bool or any other value
+        Returns:
+            source of value, or name of constant
+        """
+
+        if value.__class__ in (int, str, bool) or value is None:
+            return repr(value)
+        if value.__class__ is float and value == value and value not in (float("inf"), float("-inf")):
+            return repr(value)
+        return self.add_constant(value)
+
+    def unique_name(self, prefix: str) -> str:
+        """ Creates a unique local name
+        Args:
+            prefix: name prefix
+        Returns:
+            local name
+        """
+
+        self.label_counter += 1
+        return f"{prefix}{self.label_counter}"
+
+    def variable(self, slot) -> str:
+        """ Local variable name of a symbol slot, slots of the same symbol share
+            the same local variable
+        Args:
+            slot: SymbolSlot
+        Returns:
+            local variable name
+        """
+
+        key = (id(slot.values), slot.index)
+        name = self.variables.get(key)
+        if name is None:
+            name = f"v{len(self.initial_values)}"
+            self.variables[key] = name
+            self.initial_values.append(slot.values[slot.index])
+        return name
+
+    def find_variable(self, name: str, statement) -> str:
+        """ Find local variable of variable name referenced by statement
+        Args:
+            name: variable name
+            statement: statement that references the variable
+        Returns:
+            local variable name
+        Raises:
+            UnknownVariable: if variable is not found in symbols tables
+        """
+
+        return self.variable(find_symbol_slot(name, statement))
+
+    def emit_raise(self, exception: Exception):
+        """ Raises exception when generated code reaches this line, it is used
+            for errors that the executor raises when it executes a statement
+        Args:
+            exception: exception to be raised
+        Returns:
+            None
+        """
+
+        self.emit(f"raise {self.add_constant(exception)}")
+
+    def generate_statements(self, statements: list):
+        """ Generate code for statements, same statements as InstructionsGenerator
+        Args:
+            statements: list of statements
+        Returns:
+            None
+        """
+
+        for statement in statements:
+
+            # For Statement
+            if isinstance(statement, For):
+                self.generate_for_loop(statement)
+
+            # While Statement
+            elif isinstance(statement, While):
+                self.generate_while_statement(statement)
+
+            # Condition Statement
+            elif isinstance(statement, ConditionStatement):
+                self.generate_condition_statement(statement)
+
+            # Echo Statement
+            elif isinstance(statement, Echo):
+                self.generate_echo_statement(statement)
+
+            # Input Statement
+            elif isinstance(statement, Input):
+                self.generate_input_statement(statement)
+
+            # Variable Statement
+            elif isinstance(statement, Variable):
+                self.generate_variable_statement(statement)
+
+            # Break Statement
+            elif isinstance(statement, Break):
+                self.generate_break_statement()
+
+            # Continue Statement
+            elif isinstance(statement, Continue):
+                self.generate_continue_statement()
+
+    def generate_block(self, statements: list):
+        """ Generate indented block of statements
+        Args:
+            statements: list of statements
+        Returns:
+            None
+        """
+
+        self.indentation += 1
+        start = len(self.lines)
+        self.generate_statements(statements)
+        if len(self.lines) == start:
+            self.emit("pass")
+        self.indentation -= 1
+
+    def generate_condition(self, condition: str, statement) -> str:
+        """ Generate code that calculates a condition into a local variable,
+            same as executor evaluate_condition()
+        Args:
+            condition: condition string
+            statement: statement that contains the condition
+        Returns:
+            name of local variable that contains condition result
+        """
+
+        result = "_r"
+
+        try:
+            compiled = self.evaluator.compile(condition.strip('"'), statement.expression_tree)
+            variables = [self.find_variable(name, statement) for _, name in compiled.variables]
+        except Exception as e:
+            self.emit_raise(e)
+            return result
+
+        self.generate_compiled_expression(compiled, variables, result)
+        return result
+
+    def generate_compiled_expression(self, compiled, variables: list, result: str):
+        """ Generate code that calculates a compiled expression into result,
+            same as evaluator evaluate_compiled()
+        Args:
+            compiled: CompiledExpression
+            variables: local variables names, in the order of compiled.variables
+            result: local variable name to store result in
+        Returns:
+            None
+        """
+
+        error_message = self.literal(f"Unable to evaluate expression {compiled.expression}")
+
+        if compiled.single_token:
+            if variables:
+                self.emit(f"{result} = str({variables[0]}) or False")
+            else:
+                value = compiled.registers[0]
+                self.emit(f"{result} = {self.literal(value if value else False)}")
+            return
+
+        unknown_operator = any(operator not in OPERATORS
+                               for operator, _, _, _ in compiled.operations)
+
+        if not compiled.is_valid or unknown_operator:
+            self.emit(f"raise ExpressionEvaluationError({error_message})")
+            return
+
+        # python expression of each register, operands are cleaned the same way
+        # calculate() cleans values
+        registers = {}
+        for register, value in enumerate(compiled.registers):
+            if value is not None:
+                registers[register] = self.literal(self.evaluator.clean_value(value))
+
+        for (register, _), variable in zip(compiled.variables, variables):
+            registers[register] = f"({variable} if {variable}.__class__ is float else _o({variable}))"
+
+        for index, (operator, value1, value2, register) in enumerate(compiled.operations):
+            expression = OPERATORS[operator].format(a=registers[value1], b=registers[value2])
+            if index == len(compiled.operations) - 1:
+                registers[register] = expression
+            else:
+                temporary = self.unique_name("_t")
+                registers[register] = (f"({temporary} if ({temporary} := {expression}).__class__ "
+                                       f"is float else _c({temporary}))")
+
+        self.emit("try:")
+        self.emit(f"    {result} = {registers[compiled.result_register]}")
+        self.emit("except Exception:")
+        self.emit(f"    raise ExpressionEvaluationError({error_message}) from None")
+
+    def generate_while_statement(self, statement: While):
+        """ Generate while loop
+        Args:
+            statement: while statement
+        Returns:
+            None
+        """
+
+        self.emit("while True:")
+        self.indentation += 1
+        result = self.generate_condition(statement.condition, statement)
+        self.emit(f"if not {result}:")
+        self.emit("    break")
+        self.indentation -= 1
+
+        self.loop_stack.append(LoopContext(statement))
+        self.generate_block(statement.statements)
+        self.loop_stack.pop()
+
+    def generate_for_loop(self, statement: For):
+        """ Generate for loop, loop initial variable is a statement before the
+            for loop and loop increment is the last statement inside the loop.
+
+            Continue statement executes the last statement of the loop (increment)
+            and checks the condition again, if the loop contains continue statements
+            the loop body except the last statement is generated inside a loop that
+            runs once, continue leaves this loop and break sets broken flag to
+            leave the for loop too.
+        Args:
+            statement: for statement
+        Returns:
+            None
+        """
+
+        self.emit("while True:")
+        self.indentation += 1
+        result = self.generate_condition(statement.loop_condition, statement)
+        self.emit(f"if not {result}:")
+        self.emit("    break")
+        self.indentation -= 1
+
+        statements = statement.statements
+        last_statement = statements[-1] if statements else None
+
+        if (isinstance(last_statement, (Variable, Echo, Input, Break))
+            and self.contains_continue(statements)):
+
+            broken_flag = self.unique_name("_broken")
+            self.loop_stack.append(LoopContext(statement, broken_flag))
+
+            self.indentation += 1
+            self.emit(f"{broken_flag} = True")
+            self.emit("while True:")
+            self.indentation += 1
+            self.generate_statements(statements[:-1])
+            self.emit(f"{broken_flag} = False")
+            self.emit("break")
+            self.indentation -= 1
+            self.emit(f"if {broken_flag}:")
+            self.emit("    break")
+            self.generate_statements([last_statement])
+            self.indentation -= 1
+        else:
+            self.loop_stack.append(LoopContext(statement))
+            self.generate_block(statements)
+
+        self.loop_stack.pop()
+
+    def contains_continue(self, statements: list) -> bool:
+        """ Checks if statements contain continue statement of the loop that
+            contains them, continue statements inside nested loops are not counted
+        Args:
+            statements: list of statements
+        Returns:
+            True if a continue statement is found
+        """
+
+        for statement in statements:
+            if isinstance(statement, Continue):
+                return True
+
+            if isinstance(statement, ConditionStatement):
+                branches = [statement.if_statement] + list(statement.elseif_statements)
+                if statement.else_statement:
+                    branches.append(statement.else_statement)
+                if any(self.contains_continue(branch.statements) for branch in branches):
+                    return True
+
+        return False
+
+    def generate_condition_statement(self, statement: ConditionStatement):
+        """ Generate if, else if and else statements
+        Args:
+            statement: condition statement
+        Returns:
+            None
+        """
+
+        if not statement.if_statement:
+            raise UnexpectedError(
+                "Unexpected state, if statement should not be none inside condition")
+
+        branches = [statement.if_statement] + list(statement.elseif_statements)
+        indentation = self.indentation
+
+        for branch in branches:
+            result = self.generate_condition(branch.condition, branch)
+            self.emit(f"if {result}:")
+            self.generate_block(branch.statements)
+            self.emit("else:")
+            self.indentation += 1
+
+        if statement.else_statement:
+            self.generate_statements(statement.else_statement.statements)
+        self.emit("pass")
+
+        self.indentation = indentation
+
+    def generate_break_statement(self):
+        """ Generate break statement
+        Args:
+            None
+        Returns:
+            None
+        """
+
+        self.emit("break")
+
+    def generate_continue_statement(self):
+        """ Generate continue statement
+        Args:
+            None
+        Returns:
+            None
+        """
+
+        loop = self.loop_stack[-1]
+        if loop.broken_flag:
+            self.emit(f"{loop.broken_flag} = False")
+            self.emit("break")
+        else:
+            self.emit("continue")
+
+    def generate_echo_statement(self, statement: Echo):
+        """ Generate echo statement, echo string is compiled the same way
+            InstructionsGenerator compiles it
+        Args:
+            statement: echo statement
+        Returns:
+            None
+        """
+
+        echo_parts, echo_variables = InstructionsGenerator().compile_echo_statement(
+            statement)
+
+        parts = [self.literal(part) for part in echo_parts]
+        try:
+            for echo_variable in echo_variables:
+                variable = self.find_variable(echo_variable.name, statement)
+                parts[echo_variable.index] = f"str({variable})"
+        except UnknownVariable as e:
+            self.emit_raise(e)
+            return
+
+        parts = [part for part in parts if part != "''"]
+        if not parts:
+            self.emit("write_line('')")
+        elif len(parts) == 1:
+            self.emit(f"write_line({parts[0]})")
+        else:
+            self.emit(f"write_line(''.join(({', '.join(parts)})))")
+
+    def generate_input_statement(self, statement: Input):
+        """ Generate input statement
+        Args:
+            statement: input statement
+        Returns:
+            None
+        """
+
+        try:
+            variable = self.find_variable(statement.input_variable, statement)
+        except UnknownVariable as e:
+            self.emit_raise(e)
+            return
+
+        # Echoed lines, like input prompts, are written before waiting for input
+        self.emit("flush()")
+        self.emit(f"{variable} = _native(input())")
+
+    def generate_variable_statement(self, statement: Variable):
+        """ Generate variable assignment, same as executor
+            execute_variable_instruction()
+        Args:
+            statement: variable statement
+        Returns:
+            None
+        """
+
+        variable_value = statement.variable_value
+
+        if statement.type == VariableType.ARRAY:
+            self.generate_store(statement, self.add_constant(variable_value))
+            return
+
+        try:
+            value, is_number = self.generate_variable_value(statement)
+        except Exception as e:
+            self.emit_raise(e)
+            return
+
+        self.generate_store(statement, value, is_number)
+
+    def generate_variable_value(self, statement: Variable) -> tuple:
+        """ Generate code of variable value, variable value is compiled
+            the same way the executor compiles variable instructions
+        Args:
+            statement: variable statement
+        Returns:
+            local name or literal of the value, and True if the value is a
+            number constant
+        """
+
+        instruction = VariableInstruction(statement)
+        assignment_type = compile_variable_instruction(instruction, self.evaluator)
+
+        if assignment_type == AssignmentType.CONSTANT:
+            value = instruction.constant_value
+            return self.literal(value), value.__class__ is float or value.__class__ is int
+
+        if assignment_type == AssignmentType.VARIABLE:
+            # assignment to another variable
+            return self.variable(instruction.value_symbols[0]), False
+
+        if assignment_type == AssignmentType.EXPRESSION:
+            variables = [self.variable(slot) for slot in instruction.value_symbols]
+            self.generate_compiled_expression(instruction.compiled_value, variables, "_r")
+            return "_r", False
+
+        parts = [self.literal(part) for part in instruction.value_parts]
+        for index, slot in instruction.value_symbols:
+            parts[index] = f"str({self.variable(slot)})"
+
+        text = f"''.join(({', '.join(parts)},))"
+
+        if assignment_type == AssignmentType.CONCATENATION:
+            self.emit(f"_r = {text}")
+        else:
+            # expression can only be evaluated after substituting variables values
+            self.emit(f"_r = _evaluate({text})")
+        return "_r", False
+
+    def float_operand(self, name: str) -> str:
+        """ Python expression of assignment operation operand, floats are used as
+            they are, other values are converted, strings only if they are numbers
+        Args:
+            name: local variable name
+        Returns:
+            python expression of the operand
+        """
+
+        return f"({name} if {name}.__class__ is float else float({name}))"
+
+    def generate_store(self, statement: Variable, value: str, is_number: bool = False):
+        """ Generate storing value in variable and applying operation
+        Args:
+            statement: variable statement
+            value: local name or literal of the new value
+            is_number: Optional, True if value is a number constant, it is used
+                       by operations as it is
+        Returns:
+            None
+        """
+
+        try:
+            variable = self.find_variable(statement.variable_name, statement)
+        except UnknownVariable as e:
+            self.emit(f"_r = {value}")
+            self.emit_raise(e)
+            return
+
+        operation = ASSIGNMENT_OPERATIONS.get(statement.operation)
+        if operation:
+            if not is_number:
+                value = self.float_operand(value)
+
+            operation = operation.format(a=self.float_operand(variable), b=value)
+            self.emit(f"{variable} = {operation}")
+        else:
+            self.emit(f"{variable} = {value}")
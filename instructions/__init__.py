@@ -1,9 +1,12 @@
-__version__ = '1.1'
+__version__ = '1.6'
 __all__ = ['InstructionType',
+           'AssignmentType',
            'Instruction',
            'LabelInstruction',
            'EchoInstruction',
+           'EchoVariable',
            'GotoInstruction',
            'JumpIfInstruction',
            'JumpIfNotInstruction',
-           'VariableInstruction']
+           'VariableInstruction',
+           'CountedLoopInstruction']
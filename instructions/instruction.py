@@ -23,6 +23,17 @@ class InstructionType(Enum):
     JUMP_IF_NOT = 5
     VARIABLE = 6
     INPUT = 7
+    COUNTED_LOOP = 8
+
+
+class AssignmentType(Enum):
+    """ Enum contains how a variable instruction calculates its value """
+
+    CONSTANT = 1
+    VARIABLE = 2
+    EXPRESSION = 3
+    CONCATENATION = 4
+    SUBSTITUTION = 5
 
 
 class Instruction(object):
@@ -38,6 +49,9 @@ class Instruction(object):
 
         self.type = type
 
+        # Source line of the statement that generated this instruction, None if unknown
+        self.line_number = None
+
     def __repr__(self) -> str:
         return f"{self.type}"
 
@@ -66,15 +80,51 @@ class LabelInstruction(Instruction):
         return self.__repr__()
 
 
+class EchoVariable(object):
+    """ Echo Variable Class
+
+    A variable slot inside a compiled echo string, for example {x}
+
+    Class Attributes:
+        index: index of the slot in echo instruction echo_parts list
+        name: variable name
+        slot: symbol slot of the variable, resolved by the executor
+              the first time the echo instruction is executed
+    """
+
+    def __init__(self, index: int, name: str) -> None:
+        """ Echo Variable Class Constructor
+        Args:
+            index: index of the slot in echo_parts list
+            name: variable name
+        Returns:
+            None
+        """
+
+        self.index = index
+        self.name = name
+        self.slot = None
+
+    def __repr__(self) -> str:
+        return f"{{{self.name}}}"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+
 class EchoInstruction(Instruction):
     """ Echo Instruction Class """
 
-    def __init__(self, echo_string: str, statement=None) -> None:
+    def __init__(self, echo_string: str, statement=None,
+                 echo_parts=None, echo_variables=None) -> None:
         """ Echo Instruction Class Constructor
         Args:
             echo_string: string that needs to be printed
             statement: Optional, echo statement that contains echo string,
                         used in order to lookup symbols table.
+            echo_parts: Optional, echo string compiled into list of literal strings,
+                        variable slots are empty strings to be filled at runtime
+            echo_variables: Optional, list of EchoVariable slots in echo_parts
         Returns:
             None
         """
@@ -82,6 +132,8 @@ class EchoInstruction(Instruction):
         super().__init__(InstructionType.ECHO)
         self.echo_string = echo_string
         self.statement = statement
+        self.echo_parts = echo_parts if echo_parts is not None else []
+        self.echo_variables = echo_variables if echo_variables is not None else []
 
     def __repr__(self) -> str:
         return f"echo ---> {self.echo_string}"
@@ -128,6 +180,9 @@ class GotoInstruction(Instruction):
         super().__init__(InstructionType.GOTO)
         self.goto_label = label
 
+        # Index of goto label in instructions list, set by the link step
+        self.goto_index = None
+
     def __repr__(self) -> str:
         return f"Goto ---> {self.goto_label}"
 
@@ -154,6 +209,14 @@ class JumpIfInstruction(Instruction):
         self.condition = condition
         self.statement = statement
 
+        # Index of goto label in instructions list, set by the link step
+        self.goto_index = None
+
+        # Condition compiled by the executor the first time it is evaluated,
+        # and symbol slots of its variables
+        self.compiled_condition = None
+        self.condition_symbols = None
+
     def __repr__(self) -> str:
         return f"Jump if to {self.goto_label} condition {self.condition}"
 
@@ -180,6 +243,14 @@ class JumpIfNotInstruction(Instruction):
         self.condition = condition
         self.statement = statement
 
+        # Index of goto label in instructions list, set by the link step
+        self.goto_index = None
+
+        # Condition compiled by the executor the first time it is evaluated,
+        # and symbol slots of its variables
+        self.compiled_condition = None
+        self.condition_symbols = None
+
     def __repr__(self) -> str:
         return f"Jump if not to {self.goto_label} condition {self.condition}"
 
@@ -199,6 +270,13 @@ class VariableInstruction(Instruction):
             symbols_table: symbols table that contains this variable
         Returns:
             None
+
+        Class Attributes:
+            assignment_type: how the value is calculated, see AssignmentType
+            constant_value: native value of a constant assignment
+            compiled_value: compiled expression of an expression assignment
+            value_parts: text parts of concatenation and substitution assignments
+            value_symbols: slots of variables used in the value
         """
 
         super().__init__(InstructionType.VARIABLE)
@@ -208,9 +286,71 @@ class VariableInstruction(Instruction):
         self.symbols_table = symbols_table
         self.variable_statement = variable_statement
 
+        # Set by the executor the first time the instruction is executed
+        self.assignment_type = None
+        self.constant_value = None
+        self.compiled_value = None
+        self.value_parts = None
+        self.value_symbols = None
+
     def __repr__(self) -> str:
         return f"var {self.variable_name} ---> {self.variable_expression}"
 
     def __str__(self) -> str:
         return self.__repr__()
 
+
+class CountedLoopInstruction(Instruction):
+    """ Counted Loop Instruction Class
+
+    Last instruction of a counted for loop, it increments loop variable and jumps
+    back to loop statements if loop condition is still true, it replaces loop
+    increment, goto to loop start and loop condition jump of the loop
+    """
+
+    def __init__(self, label: str, condition: str,
+                 increment_instruction: VariableInstruction, statement=None) -> None:
+        """ Counted Loop Instruction Class Constructor
+        Args:
+            label: label of loop statements start, to go to if condition is true
+            condition: loop condition
+            increment_instruction: variable instruction of loop increment, it is
+                                   executed if variables values are not numbers
+            statement: Optional, for loop statement that contains counted_loop
+        Returns:
+            None
+
+        Class Attributes:
+            loop_symbol: slot of loop variable, set by the executor
+            bound_symbol: slot of bound variable, None if bound is a number
+            bound_value: bound number, if bound is not a variable
+            step: number added to loop variable, None if loop can't be counted natively
+            compare: comparison function of loop condition operator
+        """
+
+        super().__init__(InstructionType.COUNTED_LOOP)
+        self.goto_label = label
+        self.condition = condition
+        self.increment_instruction = increment_instruction
+        self.statement = statement
+
+        # Index of goto label in instructions list, set by the link step
+        self.goto_index = None
+
+        # Condition compiled by the executor if variables values are not numbers
+        self.compiled_condition = None
+        self.condition_symbols = None
+
+        # Set by the executor the first time the instruction is executed
+        self.is_compiled = False
+        self.loop_symbol = None
+        self.bound_symbol = None
+        self.bound_value = None
+        self.step = None
+        self.compare = None
+
+    def __repr__(self) -> str:
+        return f"Counted loop to {self.goto_label} {self.increment_instruction.variable_expression} condition {self.condition}"
+
+    def __str__(self) -> str:
+        return self.__repr__()
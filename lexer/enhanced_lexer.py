@@ -10,10 +10,75 @@ Example:
 
 """
 
+import re
+import sys
+
 from lexer.lexer import Lexer, Token, TokenType
 from exceptions.language_exception import SyntaxError
 
 
+# Keywords recognized by the language, any other alphabetical value is an identifier
+KEYWORDS = {
+    'call': TokenType.CALL,
+    'method': TokenType.METHOD,
+    'elif': TokenType.ELIF,
+    'if': TokenType.IF,
+    'else': TokenType.ELSE,
+    'fi': TokenType.FI,
+    'endif': TokenType.FI,
+    'endfor': TokenType.ENDFOR,
+    'endwhile': TokenType.ENDWHILE,
+    'break': TokenType.BREAK,
+    'continue': TokenType.CONTINUE,
+    'for': TokenType.FOR,
+    'while': TokenType.WHILE,
+    'struct': TokenType.STRUCT,
+    'endstruct': TokenType.ENDSTRUCT,
+    'echo': TokenType.ECHO,
+    'print': TokenType.PRINT,
+    'input': TokenType.INPUT,
+    'return': TokenType.RETURN,
+    'true': TokenType.TRUE,
+    'false': TokenType.FALSE,
+}
+
+# Characters that always produce one token of the same type
+SINGLE_CHAR_TOKENS = {
+    '%': TokenType.MOD,
+    '&': TokenType.AND,
+    '|': TokenType.OR,
+    '}': TokenType.LEFTBRACKET,
+    '{': TokenType.RIGHTBRAKET,
+    '(': TokenType.OPENPARENTHESIS,
+    ')': TokenType.CLOSINGPARENTHESIS,
+    '[': TokenType.OPENSQUAREBRACKET,
+    ']': TokenType.CLOSESQUAREBRACKET,
+    ';': TokenType.SEMICOLON,
+    '.': TokenType.DOT,
+    ',': TokenType.COMMA,
+}
+
+# Operators that become a different token when followed by '=',
+# operator ---> (token type, token type followed by '=', lexeme followed by '=')
+EQUAL_SUFFIX_TOKENS = {
+    '=': (TokenType.EQUAL, TokenType.EQUIVALENT, '=='),
+    '>': (TokenType.GREATERTHAN, TokenType.GREATERTHANOREQUAL, '>='),
+    '<': (TokenType.LESSTHAN, TokenType.LESSTHANOREQUAL, '<='),
+    '+': (TokenType.ADD, TokenType.PLUSEQUAL, '+='),
+    '*': (TokenType.MULT, TokenType.MULTEQUAL, '*='),
+    '!': (TokenType.NOT, TokenType.NOTEQUIVALENT, '!='),
+}
+
+ALPHABETS = "abcdefghijklmnopqrstuvwxyz"
+CAPS_ALPHABETS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+NUMERICAL_VALUES = "1234567890"
+
+# Runs scanned in bulk instead of one character at a time
+IDENTIFIER_TAIL_REGEX = re.compile(r'[a-zA-Z0-9_]*')
+NUMBER_TAIL_REGEX = re.compile(r'[0-9.]*')
+SPACES_REGEX = re.compile(r' *')
+
+
 class EnhancedLexer(Lexer):
     """ Lexer Class
 
@@ -21,11 +86,18 @@ class EnhancedLexer(Lexer):
     tokens
 
     Class Attributes:
-        self.alphabets: list of english language alphabets
-        self.caps_alphabets: list of english language alphabets all caps
-        self.numeric: list of digits
+        self.alphabets: set of english language alphabets
+        self.caps_alphabets: set of english language alphabets all caps
+        self.numeric: set of digits
         self.idx: current id pointing to current character to be tokenized.
         self.line_number: current line number
+        self.keep_unknown: keep_unknown option of the current tokenize_text call
+        self.keep_spaces: keep_spaces option of the current tokenize_text call
+        self.ignore_new_lines: ignore_new_lines option of the current tokenize_text call
+        self.offset: index of tokenized text in source text, text is tokenized in
+                     parts by tokenize_stream
+        self.dispatch_table: maps each recognized character to the method that
+                             tokenizes the lexeme starting with it
 
     """
 
@@ -33,11 +105,47 @@ class EnhancedLexer(Lexer):
         """ init Lexer Class """
 
         super().__init__()
-        self.alphabets = "abcdefghijklmnopqrstuvwxyz"
-        self.caps_alphabets = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-        self.numerical_values = "1234567890"
+        self.alphabets = frozenset(ALPHABETS)
+        self.caps_alphabets = frozenset(CAPS_ALPHABETS)
+        self.numerical_values = frozenset(NUMERICAL_VALUES)
         self.idx = 0
         self.line_number = 1
+        self.keep_unknown = False
+        self.keep_spaces = False
+        self.ignore_new_lines = True
+        self.offset = 0
+        self.dispatch_table = self.build_dispatch_table()
+
+    def build_dispatch_table(self):
+        """ Builds character to handler lookup table, so finding the handler
+            of the current character costs one dictionary lookup
+        Args:
+            None
+        Returns:
+            dictionary of character to tokenize method
+        """
+
+        dispatch_table = {}
+
+        for char in NUMERICAL_VALUES:
+            dispatch_table[char] = self.tokenize_numerical_value
+
+        for char in ALPHABETS + CAPS_ALPHABETS:
+            dispatch_table[char] = self.tokenize_alphabetical_value
+
+        for char in SINGLE_CHAR_TOKENS:
+            dispatch_table[char] = self.tokenize_single_char
+
+        for char in EQUAL_SUFFIX_TOKENS:
+            dispatch_table[char] = self.tokenize_equal_suffix
+
+        dispatch_table[' '] = self.tokenize_space
+        dispatch_table['\n'] = self.tokenize_new_line
+        dispatch_table['-'] = self.tokenize_minus
+        dispatch_table['/'] = self.tokenize_division
+        dispatch_table['"'] = self.tokenize_string
+
+        return dispatch_table
 
     def is_numeric(self, char):
         """ Check if value is a numerical value
@@ -77,101 +185,129 @@ class EnhancedLexer(Lexer):
 
         self.idx = 0
         self.line_number = 1
+        self.keep_unknown = keep_unknown
+        self.keep_spaces = keep_spaces
+        self.ignore_new_lines = ignore_new_lines
+        self.offset = 0
         tokens = []
 
-        while self.idx < len(text):
+        self.tokenize_lines(text, tokens, False)
+
+        return tokens
+
+    def tokenize_stream(self,
+                        chunks,
+                        keep_unknown=False,
+                        keep_spaces=False,
+                        ignore_new_lines=True):
+        """ Tokenize source text read in chunks, tokens are yielded once the lines
+            they are in are read, so the whole text and its tokens are never kept
+            in memory. Tokens are the same tokens tokenize_text() returns for the
+            text of all chunks.
+        Args:
+            chunks:           iterable of text strings
+            keep_unknown:     weather to keep an unknown token or not
+            keep_spaces:      weather white spaces should be added to tokens or not
+            ignore_new_lines: weather new line tokens should be ignored
+        Returns:
+            generator of meaningful tokens
+        """
+
+        self.line_number = 1
+        self.keep_unknown = keep_unknown
+        self.keep_spaces = keep_spaces
+        self.ignore_new_lines = ignore_new_lines
+        self.offset = 0
+
+        # chunks that are not tokenized yet, they are joined once when a line is
+        # completed, so unterminated strings and comments are not copied for
+        # each chunk read
+        pending = []
+        # characters that can terminate a string or a comment that continues
+        # after tokenized lines, None if no lexeme is waiting to be terminated
+        closing = None
+        previous_token = []
+
+        for chunk in chunks:
+            pending.append(chunk)
+
+            # string or comment is tokenized again only after a character that
+            # can terminate it is read
+            if closing and not any(char in chunk for char in closing):
+                continue
+            closing = None
+
+            # only complete lines are tokenized, lexemes don't continue after a new
+            # line except strings and multi line comments
+            if '\n' not in chunk:
+                continue
+
+            text = "".join(pending)
+            end = text.rfind('\n') + 1
+
+            tokens = list(previous_token)
+            position = self.tokenize_lines(text[:end], tokens, True)
+            self.offset += position
+
+            yield from tokens[len(previous_token):]
+
+            # minus sign checks previous token
+            previous_token = tokens[-1:]
+
+            # keep only text after the last complete token
+            pending = [text[position:]] if position < len(text) else []
+            if position < end:
+                closing = '"' if text[position] == '"' else '*/'
+                if any(char in text[end:] for char in closing):
+                    closing = None
+
+        tokens = list(previous_token)
+        self.tokenize_lines("".join(pending), tokens, False)
+        yield from tokens[len(previous_token):]
+
+    def tokenize_lines(self, text, tokens, more_text):
+        """ Tokenize lines of text, used by tokenize_text for the whole text and by
+            tokenize_stream for lines read, a lexeme that continues after text
+            is not tokenized if more text will be read
+        Args:
+            text:      text of complete lines
+            tokens:    list of tokens
+            more_text: True if text is not the end of source text
+        Returns:
+            index of text that tokenizing stopped at
+        """
+
+        self.idx = 0
+
+        dispatch_table = self.dispatch_table
+        handle_unknown_char = self.handle_unknown_char
+        text_length = len(text)
+
+        while self.idx < text_length:
+
+            start = self.idx
+            line_number = self.line_number
+            tokens_count = len(tokens)
 
             current_char = text[self.idx]
+            dispatch_table.get(current_char, handle_unknown_char)(text, tokens, current_char)
 
-            # Numerical value
-            if self.is_numeric(current_char):
-                self.tokenize_numerical_value(text, tokens, current_char)
-            # Alphabetical value
-            elif self.is_alphabetical(current_char):
-                self.tokenize_alphabetical_value(text, tokens)
-            # Space
-            elif current_char == ' ':
-                self.tokenize_space(keep_spaces, tokens, current_char)
-            # New line
-            elif current_char == '\n':
-                self.tokenize_new_line(ignore_new_lines, tokens, current_char)
-            # Equal
-            elif current_char == '=':
-                # Equivalent
-                self.tokenize_equivalent(text, tokens, current_char)
-            # Greater than
-            elif current_char == '>':
-                self.tokenize_greater_than(text, tokens, current_char)
-            # Less than
-            elif current_char == '<':
-                self.tokenize_less_than(text, tokens, current_char)
-            # Plus
-            elif current_char == '+':
-                self.tokenize_plus(text, tokens, current_char)
-            # Minus
-            elif current_char == '-':
-                self.tokenize_minus(text, tokens, current_char)
-            # Multiply
-            elif current_char == '*':
-                self.tokenize_multiply(text, tokens, current_char)
-            # Division
-            elif current_char == '/':
-                self.tokenize_division(text, tokens, current_char)
-            # Modulus
-            elif current_char == '%':
-                tokens.append(Token(TokenType.MOD, current_char, self.line_number))
-            # And
-            elif current_char == '&':
-                tokens.append(Token(TokenType.AND, current_char, self.line_number))
-            # Or
-            elif current_char == '|':
-                tokens.append(Token(TokenType.OR, current_char, self.line_number))
-            # Not
-            elif current_char == '!':
-                self.tokenize_not(text, tokens, current_char)
-            # Left Bracket
-            elif current_char == '}':
-                tokens.append(Token(TokenType.LEFTBRACKET, current_char, self.line_number))
-            # Right Bracket
-            elif current_char == '{':
-                tokens.append(Token(TokenType.RIGHTBRAKET, current_char, self.line_number))
-            # Open Parenthesis
-            elif current_char == '(':
-                tokens.append(Token(TokenType.OPENPARENTHESIS, current_char, self.line_number))
-            # Close Parenthesis
-            elif current_char == ')':
-                tokens.append(Token(TokenType.CLOSINGPARENTHESIS, current_char, self.line_number))
-            # Open Square Parenthesis
-            elif current_char == '[':
-                tokens.append(Token(TokenType.OPENSQUAREBRACKET, current_char, self.line_number))
-            # Close Square Parenthesis
-            elif current_char == ']':
-                tokens.append(Token(TokenType.CLOSESQUAREBRACKET, current_char, self.line_number))
-            # Semicolon
-            elif current_char == ';':
-                tokens.append(Token(TokenType.SEMICOLON, current_char, self.line_number))
-            # String value
-            elif current_char == '"':
-                self.tokenize_string(text, tokens)
-            # Dot
-            elif current_char == '.':
-                tokens.append(Token(TokenType.DOT, ".", self.line_number))
-            # Comma
-            elif current_char == ',':
-                tokens.append(Token(TokenType.COMMA, ",", self.line_number))
-            # Unknown chat
-            else:
-                self.handle_unknown_char(keep_unknown, tokens, current_char)
+            if more_text and self.idx >= text_length:
+                # string or comment is not terminated yet, tokenize it again
+                # when next chunk is read
+                del tokens[tokens_count:]
+                self.line_number = line_number
+                return start
 
             self.idx += 1
 
-        return tokens
+        return text_length
 
-    def handle_unknown_char(self, keep_unknown, tokens, current_char):
+    def handle_unknown_char(self, text, tokens, current_char):
         """ This method determines weather unknown character should be added to tokens list or not.
 
         Args:
-            keep_unknown: weather unknown character should be added to list of tokens or not
+            text: code text string
             tokens: list of tokens
             current_char: current character to be checked
 
@@ -179,47 +315,68 @@ class EnhancedLexer(Lexer):
             None
         """
 
-        if keep_unknown:
+        if self.keep_unknown:
             tokens.append(Token(TokenType.UNKNOWN, current_char, self.line_number))
         else:
-            self.handle_syntax_error(Token(TokenType.UNKNOWN, current_char, self.line_number), f"Syntax Error index: {self.idx}")
+            self.handle_syntax_error(Token(TokenType.UNKNOWN, current_char, self.line_number), f"Syntax Error index: {self.offset + self.idx}")
 
-    def tokenize_string(self, text, tokens):
-        """ This method will tokenize a string and adds to to list of tokens.
+    def tokenize_single_char(self, text, tokens, current_char):
+        """ This method will tokenize a character that is a complete token by itself,
+            like parenthesis, brackets, semicolon, dot and comma.
 
         Args:
             text: code text string
             tokens: list of tokens
+            current_char: current character
 
         Returns:
             None
         """
 
-        string_value = '"'
-        self.idx += 1
-        while (self.idx < len(text) and text[self.idx] != '"'):
-            string_value += text[self.idx]
-            self.idx += 1
-        string_value += '"'
-        tokens.append(Token(TokenType.STRING, string_value, self.line_number))
+        tokens.append(Token(SINGLE_CHAR_TOKENS[current_char], current_char, self.line_number))
 
-    def tokenize_not(self, text, tokens, current_char):
-        """ This method will tokenize not "!" operation, and determine if next char is not equal "!="
+    def tokenize_equal_suffix(self, text, tokens, current_char):
+        """ This method will tokenize an operator that changes meaning when followed by '=',
+            for example '=' or '==', '>' or '>=', '<' or '<=', '+' or '+=', '*' or '*='
+            and '!' or '!='
 
         Args:
             text: code text string
             tokens: list of tokens
-            current_char: current character representing '!' char.
+            current_char: current character representing the operator
 
         Returns:
             None
         """
 
-        if self.idx + 1 < len(text) and text[self.idx + 1] == '=':
-            tokens.append(Token(TokenType.NOTEQUIVALENT, "!=", self.line_number))
+        token_type, equal_token_type, equal_lexeme = EQUAL_SUFFIX_TOKENS[current_char]
+
+        if text.startswith('=', self.idx + 1):
+            tokens.append(Token(equal_token_type, equal_lexeme, self.line_number))
             self.idx += 1
         else:
-            tokens.append(Token(TokenType.NOT, current_char, self.line_number))
+            tokens.append(Token(token_type, current_char, self.line_number))
+
+    def tokenize_string(self, text, tokens, current_char):
+        """ This method will tokenize a string and adds to to list of tokens.
+
+        Args:
+            text: code text string
+            tokens: list of tokens
+            current_char: current character representing double quote
+
+        Returns:
+            None
+        """
+
+        end = text.find('"', self.idx + 1)
+        if end == -1:
+            # Unterminated string, take the rest of the text
+            end = len(text)
+
+        string_value = '"' + text[self.idx + 1:end] + '"'
+        self.idx = end
+        tokens.append(Token(TokenType.STRING, string_value, self.line_number))
 
     def tokenize_division(self, text, tokens, current_char):
         """ This method will tokenize division operation '/', or division equal
@@ -263,19 +420,22 @@ class EnhancedLexer(Lexer):
         """
 
         comment_line_number = self.line_number
-        comment_content = ""
-        self.idx += 2
-        while (self.idx < len(text)
-               and text[self.idx] != '*'
-               and self.idx + 1 < len(text)
-               and text[self.idx + 1] != '/'):
-
-            comment_content += text[self.idx]
-            if text[self.idx] == '\n':
-                self.line_number += 1
-            self.idx += 1
-
-        self.idx += 1
+        start = self.idx + 2
+
+        # comment ends before '*', or before a character followed by '/', or
+        # before the last character of text
+        candidates = [len(text) - 1]
+        star = text.find('*', start)
+        if star != -1:
+            candidates.append(star)
+        slash = text.find('/', start + 1)
+        if slash != -1:
+            candidates.append(slash - 1)
+        end = max(start, min(candidates))
+
+        comment_content = text[start:end]
+        self.line_number += comment_content.count('\n')
+        self.idx = end + 1
         tokens.append(Token(TokenType.COMMENT, comment_content, comment_line_number))
 
     def tokenize_one_line_comment(self, text, tokens):
@@ -289,32 +449,15 @@ class EnhancedLexer(Lexer):
         """
 
         self.idx += 1
-        comment_content = ""
-        while (self.idx < len(text) and text[self.idx] != '\n'):
-            comment_content += text[self.idx]
-            self.idx += 1
+        end = text.find('\n', self.idx)
+        if end == -1:
+            end = len(text)
+
+        comment_content = text[self.idx:end]
+        self.idx = end
         tokens.append(Token(TokenType.COMMENT, comment_content, self.line_number))
         self.line_number += 1
 
-    def tokenize_multiply(self, text, tokens, current_char):
-        """ This function will tokenize multiply operation * and if it is followed by =
-            so two possible tokens * or *=
-        Args:
-            text: code text string.
-            tokens: list of tokens.
-            current_char: current character.
-
-        Returns:
-            None
-        """
-
-        # Multiply Equal
-        if self.idx + 1 < len(text) and text[self.idx + 1] == '=':
-            tokens.append(Token(TokenType.MULTEQUAL, "*=", self.line_number))
-            self.idx += 1
-        else:
-            tokens.append(Token(TokenType.MULT, current_char, self.line_number))
-
     def tokenize_minus(self, text, tokens, current_char):
         """ This method will tokenize minus operation or minus equal or negative number.
         Args:
@@ -332,103 +475,20 @@ class EnhancedLexer(Lexer):
             self.idx += 1
         elif self.idx + 1 < len(text) and self.is_numeric(text[self.idx + 1]):
             # check previous token if it is also number,
-            if tokens and tokens[-1].token_type in [TokenType.NUMBER, TokenType.REAL]:
+            if tokens and tokens[-1].token_type in (TokenType.NUMBER, TokenType.REAL):
                 tokens.append(Token(TokenType.SUB, current_char, self.line_number))
             else:
                 # Negative number
-                self.idx += 1
-                number = current_char
-                while (self.idx < len(text)
-                       and (self.is_numeric(text[self.idx])
-                       or text[self.idx] == '.')):
-                    number += text[self.idx]
-                    self.idx += 1
-                self.idx -= 1
-                # Real number contains dot.
-                if '.' in number:
-                    tokens.append(Token(TokenType.REAL, number, self.line_number))
-                else:
-                    tokens.append(Token(TokenType.NUMBER, number, self.line_number))
+                self.tokenize_numerical_value(text, tokens, current_char)
         else:
             # Subtract
             tokens.append(Token(TokenType.SUB, current_char, self.line_number))
 
-    def tokenize_plus(self, text, tokens, current_char):
-        """ This function will tokenize plus operation '+' or plus equal '+='
-        Args:
-            text: code text string.
-            tokens: list of tokens.
-            current_char: current character representing plus sign
-
-        Returns:
-            None
-        """
-
-        # Plus Equal
-        if self.idx + 1 < len(text) and text[self.idx + 1] == '=':
-            tokens.append(Token(TokenType.PLUSEQUAL, "+=", self.line_number))
-            self.idx += 1
-        else:
-            tokens.append(Token(TokenType.ADD, current_char, self.line_number))
-
-    def tokenize_less_than(self, text, tokens, current_char):
-        """ This method will tokenize less than '<' or less than or equal '<='
-        Args:
-            text: code text string.
-            tokens: list of tokens.
-            current_char: current character representing less than sign
-
-        Returns:
-            None
-        """
-
-        # Less than or equal
-        if self.idx + 1 < len(text) and text[self.idx + 1] == '=':
-            tokens.append(Token(TokenType.LESSTHANOREQUAL, "<=", self.line_number))
-            self.idx += 1
-        else:
-            tokens.append(Token(TokenType.LESSTHAN, current_char, self.line_number))
-
-    def tokenize_greater_than(self, text, tokens, current_char):
-        """ This method will tokenize greater than '>' or greater than or equal '>='
-        Args:
-            text: code text string.
-            tokens: list of tokens.
-            current_char: current character representing greater than sign.
-
-        Returns:
-            None
-        """
-
-        # Greater than or equal
-        if self.idx + 1 < len(text) and text[self.idx + 1] == '=':
-            tokens.append(Token(TokenType.GREATERTHANOREQUAL, ">=", self.line_number))
-            self.idx += 1
-        else:
-            tokens.append(Token(TokenType.GREATERTHAN, current_char, self.line_number))
-
-    def tokenize_equivalent(self, text, tokens, current_char):
-        """ This method will tokenize equal sign '=' or equal equal sign '=='
-        Args:
-            text: code text string.
-            tokens: list of tokens.
-            current_char: current character representing equal sign.
-
-        Returns:
-            None
-        """
-
-        if self.idx + 1 < len(text) and text[self.idx + 1] == '=':
-            tokens.append(Token(TokenType.EQUIVALENT, "==", self.line_number))
-            self.idx += 1
-        else:
-            tokens.append(Token(TokenType.EQUAL, current_char, self.line_number))
-
-    def tokenize_new_line(self, ignore_new_lines, tokens, current_char):
+    def tokenize_new_line(self, text, tokens, current_char):
         """ This function will tokenize new line \n and weather this token
             should be added to list of tokens or not based on ignore_new_lines
         Args:
-            ignore_new_lines: weather new lines should be ignored or not
+            text: code text string
             tokens: list of tokens
             current_char: current character representing new line
 
@@ -437,14 +497,14 @@ class EnhancedLexer(Lexer):
         """
 
         self.line_number += 1
-        if not ignore_new_lines:
+        if not self.ignore_new_lines:
             tokens.append(Token(TokenType.NEWLINE, current_char, self.line_number))
 
-    def tokenize_space(self, keep_spaces, tokens, current_char):
-        """ This function will tokenize space ' ' and adds it to list of tokens if
-            keep_spaces is set to true
+    def tokenize_space(self, text, tokens, current_char):
+        """ This function will tokenize a run of spaces ' ' and adds them to list of tokens if
+            keep_spaces is set to true, one token per space.
         Args:
-            keep_spaces: weather spaces should be added to list of tokens or not
+            text: code text string
             tokens: list of tokens
             current_char: current character representing space.
 
@@ -452,31 +512,31 @@ class EnhancedLexer(Lexer):
             None
         """
 
-        if keep_spaces:
-            tokens.append(Token(TokenType.SPACE, current_char, self.line_number))
+        end = SPACES_REGEX.match(text, self.idx).end()
+
+        if self.keep_spaces:
+            for _ in range(end - self.idx):
+                tokens.append(Token(TokenType.SPACE, current_char, self.line_number))
+
+        self.idx = end - 1
 
-    def tokenize_alphabetical_value(self, text, tokens):
+    def tokenize_alphabetical_value(self, text, tokens, current_char):
         """ This function will tokenize alphabetical value and checks if
             the alphabetical string represents a keyword or an identifier.
         Args:
             text: code text string
             tokens: list of tokens
+            current_char: current character
 
         Returns:
             None
         """
 
-        identifier = text[self.idx]
-        self.idx += 1
-
         # Identifier might contain letters, numbers or underscores.
-        while (self.idx < len(text)
-                and (self.is_alphabetical(text[self.idx])
-                or self.is_numeric(text[self.idx])
-                or text[self.idx] == '_')):
-            identifier += text[self.idx]
-            self.idx += 1
-        self.idx -= 1
+        # Lexemes are interned, tokens of the same identifier share one string
+        end = IDENTIFIER_TAIL_REGEX.match(text, self.idx + 1).end()
+        identifier = sys.intern(text[self.idx:end])
+        self.idx = end - 1
 
         # check if the found identifier is a keyword
         self.tokenize_keyword(tokens, identifier)
@@ -491,53 +551,12 @@ class EnhancedLexer(Lexer):
             None
         """
 
-        if identifier == 'call':
-            tokens.append(Token(TokenType.CALL, identifier, self.line_number))
-        elif identifier == 'method':
-            tokens.append(Token(TokenType.METHOD, identifier, self.line_number))
-        elif identifier == 'elif':
-            tokens.append(Token(TokenType.ELIF, identifier, self.line_number))
-        elif identifier == 'if':
-            tokens.append(Token(TokenType.IF, identifier, self.line_number))
-        elif identifier == 'else':
-            tokens.append(Token(TokenType.ELSE, identifier, self.line_number))
-        elif identifier == 'fi':
-            tokens.append(Token(TokenType.FI, identifier, self.line_number))
-        elif identifier == 'endif':
-            tokens.append(Token(TokenType.FI, identifier, self.line_number))
-        elif identifier == 'endfor':
-            tokens.append(Token(TokenType.ENDFOR, identifier, self.line_number))
-        elif identifier == 'endwhile':
-            tokens.append(Token(TokenType.ENDWHILE, identifier, self.line_number))
-        elif identifier == 'break':
-            tokens.append(Token(TokenType.BREAK, identifier, self.line_number))
-        elif identifier == 'continue':
-            tokens.append(Token(TokenType.CONTINUE, identifier, self.line_number))
-        elif identifier == 'for':
-            tokens.append(Token(TokenType.FOR, identifier, self.line_number))
-        elif identifier == 'while':
-            tokens.append(Token(TokenType.WHILE, identifier, self.line_number))
-        elif identifier == 'struct':
-            tokens.append(Token(TokenType.STRUCT, identifier, self.line_number))
-        elif identifier == 'endstruct':
-            tokens.append(Token(TokenType.ENDSTRUCT, identifier, self.line_number))
-        elif identifier == 'echo':
-            tokens.append(Token(TokenType.ECHO, identifier, self.line_number))
-        elif identifier == 'print':
-            tokens.append(Token(TokenType.PRINT, identifier, self.line_number))
-        elif identifier == 'input':
-            tokens.append(Token(TokenType.INPUT, identifier, self.line_number))
-        elif identifier == 'return':
-            tokens.append(Token(TokenType.RETURN, identifier, self.line_number))
-        elif identifier == 'true':
-            tokens.append(Token(TokenType.TRUE, identifier, self.line_number))
-        elif identifier == 'false':
-            tokens.append(Token(TokenType.FALSE, identifier, self.line_number))
-        else:
-            tokens.append(Token(TokenType.IDENTIFICATION, identifier, self.line_number))
+        token_type = KEYWORDS.get(identifier, TokenType.IDENTIFICATION)
+        tokens.append(Token(token_type, identifier, self.line_number))
 
     def tokenize_numerical_value(self, text, tokens, current_char):
-        """ tokenize_numerical_value
+        """ tokenize numerical value, the number might start with a minus sign
+            if it is a negative number.
         Args:
             text: text code string
             tokens: list of tokens
@@ -547,12 +566,11 @@ class EnhancedLexer(Lexer):
             None
         """
 
-        number = current_char
-        self.idx += 1
-        while (self.idx < len(text) and (self.is_numeric(text[self.idx]) or text[self.idx] == '.')):
-            number += text[self.idx]
-            self.idx += 1
-        self.idx -= 1
+        # Numbers might contain digits or dots.
+        end = NUMBER_TAIL_REGEX.match(text, self.idx + 1).end()
+        number = sys.intern(text[self.idx:end])
+        self.idx = end - 1
+
         # Real number contains dot.
         if '.' in number:
             tokens.append(Token(TokenType.REAL, number, self.line_number))
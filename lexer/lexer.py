@@ -233,7 +233,8 @@ class TokenType(Enum):
 class Token:
     """ Token Class
 
-    Holds information about a token
+    Holds information about a token, tokens don't have a __dict__, lexers create
+    many of them, each one only holds its slots
 
     Class Variables:
         token_type: the type of the token
@@ -241,6 +242,8 @@ class Token:
         line_number: line number
     """
 
+    __slots__ = ("token_type", "match", "line_number")
+
     def __init__(self, token_type: TokenType, match: str, line_number: int) -> None:
         """ Token Constructor
         Args:
@@ -265,6 +268,116 @@ class Token:
                 and self.line_number == __o.line_number )
 
 
+# this list contains all regular expressions that are recognized by
+# the programming language.
+REGEX_LIST = [
+    # Comment
+    {'type': TokenType.COMMENT, 'regex': '(/\*([^*]|[\r\n]|(\*+([^*/]|[\r\n])))*\*+/)|(//.*)'},
+
+    # KeyWords:
+    {'type': TokenType.CALL, 'regex': '^call'},
+    {'type': TokenType.METHOD, 'regex': '^method'},
+    {'type': TokenType.ELIF, 'regex': '^elif'},
+    {'type': TokenType.IF, 'regex': '^if'},
+    {'type': TokenType.ELSE, 'regex': '^else'},
+    {'type': TokenType.FI, 'regex': '^fi'},
+    {'type': TokenType.FI, 'regex': '^endif'},
+    {'type': TokenType.ENDFOR, 'regex': '^endfor'},
+    {'type': TokenType.ENDWHILE, 'regex': '^endwhile'},
+    {'type': TokenType.BREAK, 'regex': '^break\n'},
+    {'type': TokenType.CONTINUE, 'regex': '^continue\n'},
+    {'type': TokenType.FOR, 'regex': '^for'},
+    {'type': TokenType.WHILE, 'regex': '^while'},
+    {'type': TokenType.STRUCT, 'regex': '^struct'},
+    {'type': TokenType.ENDSTRUCT, 'regex': '^endstruct'},
+    {'type': TokenType.ECHO, 'regex': '^echo'},
+    {'type': TokenType.PRINT, 'regex': '^print'},
+    {'type': TokenType.INPUT, 'regex': '^input'},
+    {'type': TokenType.RETURN, 'regex': '^return'},
+    {'type': TokenType.TRUE, 'regex': '^true'},
+    {'type': TokenType.FALSE, 'regex': '^false'},
+
+    # Expressions:
+    {'type': TokenType.IDENTIFICATIONBETWEENBRSCKETS, 'regex': "\{.*?\}"},
+    {'type': TokenType.IDENTIFICATION, 'regex': '^[a-zA-Z_$][a-zA-Z_$0-9]*'},
+    {'type': TokenType.STRING, 'regex': '^"[^"]*"'},
+    {'type': TokenType.REAL, 'regex': '[0-9]+\.[0-9]*'},
+    {'type': TokenType.NUMBER, 'regex': '^\d+'},
+
+    # Assignment Operators
+    {'type': TokenType.EQUIVALENT, 'regex': '^=='},
+    {'type': TokenType.PLUSEQUAL, 'regex': '^\+='},
+    {'type': TokenType.SUBEQUAL, 'regex': '^\-='},
+    {'type': TokenType.MULTEQUAL, 'regex': '^\*='},
+    {'type': TokenType.DIVEQUAL, 'regex': '^\/='},
+    {'type': TokenType.INVERT, 'regex': '^=!'},
+    {'type': TokenType.EQUAL, 'regex': '^='},
+
+    # Logical Compare Operators
+    {'type': TokenType.NOTEQUIVALENT, 'regex': '^!='},
+    {'type': TokenType.GREATERTHANOREQUAL, 'regex': '^>='},
+    {'type': TokenType.LESSTHANOREQUAL, 'regex': '^<='},
+    {'type': TokenType.GREATERTHAN, 'regex': '^>'},
+    {'type': TokenType.LESSTHAN, 'regex': '^<'},
+
+    # Mathematical Operators
+    {'type': TokenType.ADD, 'regex': '^\+'},
+    {'type': TokenType.SUB, 'regex': '^\-'},
+    {'type': TokenType.MULT, 'regex': '^\*'},
+    {'type': TokenType.DIV, 'regex': '^\/'},
+    {'type': TokenType.MOD, 'regex': '^\%'},
+
+    # Logical Operators
+    {'type': TokenType.AND, 'regex': '^&'},
+    {'type': TokenType.OR, 'regex': '^\|'},
+    {'type': TokenType.NOT, 'regex': '^!'},
+
+    #brackets and parenthesis
+    {'type': TokenType.LEFTBRACKET, 'regex': '^}'},
+    {'type': TokenType.RIGHTBRAKET, 'regex': '^{'},
+    {'type': TokenType.OPENPARENTHESIS, 'regex': '^\('},
+    {'type': TokenType.CLOSINGPARENTHESIS, 'regex': '^\)'},
+    {'type': TokenType.OPENSQUAREBRACKET, 'regex': '^\['},
+    {'type': TokenType.CLOSESQUAREBRACKET, 'regex': '^\]'},
+
+    # Semicolon
+    {'type': TokenType.SEMICOLON, 'regex': "^;"},
+
+    {'type': TokenType.NEWLINE, 'regex': '^\n'},
+    {'type': TokenType.SPACE, 'regex': '\s'},
+    {'type': TokenType.COMMA, 'regex': '^,'},
+    {'type': TokenType.DOT, 'regex': '^\.'},
+]
+
+
+def compile_master_regex(regex_list: list):
+    """ Compiles regex list into a single alternation of named groups.
+        Alternatives are tried from left to right, so the first regex in
+        regex list that matches still wins, exactly like looping over the list.
+    Args:
+        regex_list: list of token types and their regular expressions
+    Returns:
+        compiled master regular expression, and dictionary that maps each
+        named group to its token type
+    """
+
+    alternatives = []
+    group_types = {}
+    for index, regex in enumerate(regex_list):
+        group_name = f"T{index}"
+        group_types[group_name] = regex['type']
+
+        # pattern.match(text, pos) does not treat pos as the start of
+        # the string, so the '^' anchors must be dropped.
+        alternatives.append(f"(?P<{group_name}>{regex['regex'].removeprefix('^')})")
+
+    return re.compile("|".join(alternatives)), group_types
+
+
+# Compiled once when the module is imported and shared by all lexers
+MASTER_REGEX, GROUP_TYPES = compile_master_regex(REGEX_LIST)
+
+
 class Lexer(object):
     """ Lexer Class
 
@@ -273,92 +386,32 @@ class Lexer(object):
 
     Class Attributes:
         regex_list: A list that contains token types and their regular expressions
+        master_regex: regex_list compiled into one pattern of named groups, shared
+                      by all lexers, MASTER_REGEX
+        group_types: maps each named group of master_regex to its token type
 
     """
 
     def __init__(self) -> None:
         """ init Lexer Class """
 
-        # this list contains all regular expressions that are recognized by
-        # the programming language.
-        self.regex_list = [
-            # Comment
-            {'type': TokenType.COMMENT, 'regex': '(/\*([^*]|[\r\n]|(\*+([^*/]|[\r\n])))*\*+/)|(//.*)'},
-
-            # KeyWords:
-            {'type': TokenType.CALL, 'regex': '^call'},
-            {'type': TokenType.METHOD, 'regex': '^method'},
-            {'type': TokenType.ELIF, 'regex': '^elif'},
-            {'type': TokenType.IF, 'regex': '^if'},
-            {'type': TokenType.ELSE, 'regex': '^else'},
-            {'type': TokenType.FI, 'regex': '^fi'},
-            {'type': TokenType.FI, 'regex': '^endif'},
-            {'type': TokenType.ENDFOR, 'regex': '^endfor'},
-            {'type': TokenType.ENDWHILE, 'regex': '^endwhile'},
-            {'type': TokenType.BREAK, 'regex': '^break\n'},
-            {'type': TokenType.CONTINUE, 'regex': '^continue\n'},
-            {'type': TokenType.FOR, 'regex': '^for'},
-            {'type': TokenType.WHILE, 'regex': '^while'},
-            {'type': TokenType.STRUCT, 'regex': '^struct'},
-            {'type': TokenType.ENDSTRUCT, 'regex': '^endstruct'},
-            {'type': TokenType.ECHO, 'regex': '^echo'},
-            {'type': TokenType.PRINT, 'regex': '^print'},
-            {'type': TokenType.INPUT, 'regex': '^input'},
-            {'type': TokenType.RETURN, 'regex': '^return'},
-            {'type': TokenType.TRUE, 'regex': '^true'},
-            {'type': TokenType.FALSE, 'regex': '^false'},
-
-            # Expressions:
-            {'type': TokenType.IDENTIFICATIONBETWEENBRSCKETS, 'regex': "\{.*?\}"},
-            {'type': TokenType.IDENTIFICATION, 'regex': '^[a-zA-Z_$][a-zA-Z_$0-9]*'},
-            {'type': TokenType.STRING, 'regex': '^"[^"]*"'},
-            {'type': TokenType.REAL, 'regex': '[0-9]+\.[0-9]*'},
-            {'type': TokenType.NUMBER, 'regex': '^\d+'},
-
-            # Assignment Operators
-            {'type': TokenType.EQUIVALENT, 'regex': '^=='},
-            {'type': TokenType.PLUSEQUAL, 'regex': '^\+='},
-            {'type': TokenType.SUBEQUAL, 'regex': '^\-='},
-            {'type': TokenType.MULTEQUAL, 'regex': '^\*='},
-            {'type': TokenType.DIVEQUAL, 'regex': '^\/='},
-            {'type': TokenType.INVERT, 'regex': '^=!'},
-            {'type': TokenType.EQUAL, 'regex': '^='},
-
-            # Logical Compare Operators
-            {'type': TokenType.NOTEQUIVALENT, 'regex': '^!='},
-            {'type': TokenType.GREATERTHANOREQUAL, 'regex': '^>='},
-            {'type': TokenType.LESSTHANOREQUAL, 'regex': '^<='},
-            {'type': TokenType.GREATERTHAN, 'regex': '^>'},
-            {'type': TokenType.LESSTHAN, 'regex': '^<'},
-
-            # Mathematical Operators
-            {'type': TokenType.ADD, 'regex': '^\+'},
-            {'type': TokenType.SUB, 'regex': '^\-'},
-            {'type': TokenType.MULT, 'regex': '^\*'},
-            {'type': TokenType.DIV, 'regex': '^\/'},
-            {'type': TokenType.MOD, 'regex': '^\%'},
-
-            # Logical Operators
-            {'type': TokenType.AND, 'regex': '^&'},
-            {'type': TokenType.OR, 'regex': '^\|'},
-            {'type': TokenType.NOT, 'regex': '^!'},
-
-            #brackets and parenthesis
-            {'type': TokenType.LEFTBRACKET, 'regex': '^}'},
-            {'type': TokenType.RIGHTBRAKET, 'regex': '^{'},
-            {'type': TokenType.OPENPARENTHESIS, 'regex': '^\('},
-            {'type': TokenType.CLOSINGPARENTHESIS, 'regex': '^\)'},
-            {'type': TokenType.OPENSQUAREBRACKET, 'regex': '^\['},
-            {'type': TokenType.CLOSESQUAREBRACKET, 'regex': '^\]'},
-
-            # Semicolon
-            {'type': TokenType.SEMICOLON, 'regex': "^;"},
-
-            {'type': TokenType.NEWLINE, 'regex': '^\n'},
-            {'type': TokenType.SPACE, 'regex': '\s'},
-            {'type': TokenType.COMMA, 'regex': '^,'},
-            {'type': TokenType.DOT, 'regex': '^\.'},
-        ]
+        self.regex_list = REGEX_LIST
+        self.master_regex = MASTER_REGEX
+        self.group_types = GROUP_TYPES
+
+    def build_master_regex(self):
+        """ Returns master regex of the lexer, it is compiled again only if
+            regex_list was changed and master_regex was set to None
+        Args:
+            None
+        Returns:
+            compiled master regular expression
+        """
+
+        if self.master_regex is None:
+            self.master_regex, self.group_types = compile_master_regex(self.regex_list)
+
+        return self.master_regex
 
     def tokenize_text(self, text: str,
                       keep_unknown=False,
@@ -378,50 +431,48 @@ class Lexer(object):
         tokens = []
         line_number = 1
 
-        while text:
+        master_regex = self.build_master_regex()
+        group_types = self.group_types
+        position = 0
+        text_length = len(text)
 
-            token_type = None
-            match = None
+        while position < text_length:
 
-            # Find a matching token in regex_list
-            for regex in self.regex_list:
-                current_match = re.match(regex['regex'], text)
-                if current_match:
-                    # match found
-                    token_type = regex
-                    match = current_match
-                    break
+            # Find a matching token, scanning from the current position
+            match = master_regex.match(text, position)
 
             if match:
 
-                # New Token Found, remove match from text.
-                text = text.removeprefix(match.group())
+                # New Token Found, move position after the match.
+                token_type = group_types[match.lastgroup]
+                match_value = match.group()
+                position = match.end()
 
-                if ((keep_spaces and token_type['type'] == TokenType.SPACE)
-                    or (not ignore_new_lines and token_type['type'] == TokenType.NEWLINE)):
+                if ((keep_spaces and token_type == TokenType.SPACE)
+                    or (not ignore_new_lines and token_type == TokenType.NEWLINE)):
                     # add white space token to list
-                    token = Token(token_type['type'], match.group(), line_number)
+                    token = Token(token_type, match_value, line_number)
                     tokens.append(token)
 
-                if token_type['type'] != TokenType.SPACE and token_type['type'] != TokenType.NEWLINE:
+                if token_type != TokenType.SPACE and token_type != TokenType.NEWLINE:
 
-                    token_value = match.group().strip()
-                    token = Token(token_type['type'], token_value, line_number)
+                    token_value = match_value.strip()
+                    token = Token(token_type, token_value, line_number)
                     tokens.append(token)
 
                 # Increase line number when finding new line.
-                if token_type['type'] == TokenType.NEWLINE:
+                if token_type == TokenType.NEWLINE:
                     line_number += 1
             else:
 
                 # Unrecognized token found
                 if keep_unknown:
-                    token = Token(TokenType.UNKNOWN, text[0], line_number)
+                    token = Token(TokenType.UNKNOWN, text[position], line_number)
                     tokens.append(token)
-                    # Remove first unknown char from the text string.
-                    text = text[1:]
+                    # Skip first unknown char.
+                    position += 1
                 else:
                     # Exception, unrecognized token, raise syntax error
-                    raise SyntaxError(f"Syntax Error at line {line_number} \n {text}")
+                    raise SyntaxError(f"Syntax Error at line {line_number} \n {text[position:]}")
 
         return tokens
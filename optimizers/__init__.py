@@ -0,0 +1,7 @@
+"""
+
+Optimizers Library
+
+Contains optional optimization passes over generated instructions
+
+"""
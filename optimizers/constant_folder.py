@@ -0,0 +1,285 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Constant Folder
+
+Optional pass over the execution tree after compiling, it simplifies the
+expression trees of statements so they are not calculated every time they run:
+
+    - operations on constants are calculated once, x = 10 * 3 becomes x = 30.0
+    - identities are removed, (a * b) * 1 becomes a * b
+    - conditions that are always true or always false become true or false
+      constants, the instructions generator doesn't evaluate them
+
+Values are calculated by the evaluator, so folded expressions have the same value
+they have when they run. Operations that fail, like 1 / 0, are not folded, they fail
+when they run. Identities are only removed from operations that always calculate
+numbers, x * 1 is not x if x is a string or an integer.
+
+"""
+
+import math
+
+from compiler.compiler import ExecutionTree
+from expression_evaluators.expression_evaluator import Evaluator
+from lexer.lexer import TokenType
+from statements.expression import Constant, ExpressionType, Operation
+from statements.statement import ConditionStatement, For, Variable, While
+
+# Operator ---> (identity value, True if identity can be on the left side),
+# x + 0 is not an identity, -0.0 + 0 is 0.0
+IDENTITIES = {
+    "-": (0.0, False),
+    "*": (1.0, True),
+    "/": (1.0, False),
+}
+
+# Operations that calculate numbers from numbers, their operands are not strings
+NUMERIC_OPERATORS = ("+", "-", "*", "/")
+
+
+class ConstantFolder:
+    """ Constant Folder Class
+
+    Class Attributes:
+        stats: number of expressions changed by each pass
+    """
+
+    def __init__(self) -> None:
+        """ Constant Folder Class Constructor """
+
+        self.evaluator = Evaluator()
+        self.stats = {}
+
+    def optimize(self, execution_tree: ExecutionTree) -> ExecutionTree:
+        """ Fold expressions of execution tree statements, statements are modified in place
+        Args:
+            execution_tree: execution tree generated by the compiler
+        Returns:
+            execution tree
+        """
+
+        self.stats = {
+            "expressions": 0,
+            "folded_constants": 0,
+            "simplified_identities": 0,
+            "constant_conditions": 0,
+        }
+
+        if execution_tree:
+            self.fold_statements(execution_tree.tree)
+
+        return execution_tree
+
+    def fold_statements(self, statements: list):
+        """ Fold expressions of statements (Recursive Method)
+        Args:
+            statements: list of statements
+        Returns:
+            None
+        """
+
+        for statement in statements:
+
+            if isinstance(statement, Variable):
+                self.fold_variable(statement)
+
+            elif isinstance(statement, (For, While)):
+                self.fold_condition(statement)
+                self.fold_statements(statement.statements)
+
+            elif isinstance(statement, ConditionStatement):
+                for branch in [statement.if_statement] + list(statement.elseif_statements):
+                    self.fold_condition(branch)
+                    self.fold_statements(branch.statements)
+
+                if statement.else_statement:
+                    self.fold_statements(statement.else_statement.statements)
+
+    def fold_variable(self, statement: Variable):
+        """ Fold variable value, values are only replaced by numbers and booleans,
+            the values they have when they are calculated
+        Args:
+            statement: variable statement
+        Returns:
+            None
+        """
+
+        expression_tree = statement.expression_tree
+        if expression_tree is None or expression_tree.type != ExpressionType.OPERATION:
+            return
+
+        self.stats["expressions"] += 1
+        statement.expression_tree = self.fold(expression_tree)
+
+    def fold_condition(self, statement):
+        """ Fold condition of statement, a condition that is folded into a constant
+            becomes a true or false constant
+        Args:
+            statement: If, ElseIf, While or For statement
+        Returns:
+            None
+        """
+
+        expression_tree = statement.expression_tree
+        if expression_tree is None or expression_tree.type != ExpressionType.OPERATION:
+            return
+
+        self.stats["expressions"] += 1
+        expression_tree = self.fold(expression_tree)
+
+        if expression_tree.type == ExpressionType.CONSTANT:
+            value = self.evaluator.constant_register(expression_tree)
+            expression_tree = self.boolean_constant(bool(value))
+            self.stats["constant_conditions"] += 1
+
+        statement.expression_tree = expression_tree
+
+    def fold(self, expression_tree):
+        """ Fold constant operations and remove identities of expression tree
+            (Recursive Method)
+        Args:
+            expression_tree: expression node
+        Returns:
+            folded expression node
+        """
+
+        if expression_tree.type != ExpressionType.OPERATION:
+            return expression_tree
+
+        operator = expression_tree.operator
+        left = self.fold(expression_tree.left)
+        right = self.fold(expression_tree.right)
+
+        if left.type == ExpressionType.CONSTANT and right.type == ExpressionType.CONSTANT:
+            folded = self.fold_operation(operator, left, right)
+            if folded:
+                self.stats["folded_constants"] += 1
+                # concatenations are the source code text of the expression
+                folded.source = expression_tree
+                return folded
+
+        simplified = self.simplify_identity(operator, left, right)
+        if simplified:
+            self.stats["simplified_identities"] += 1
+            simplified.source = expression_tree
+            return simplified
+
+        operation = Operation(operator, left, right)
+        operation.parentheses = expression_tree.parentheses
+        return operation
+
+    def fold_operation(self, operator: str, left: Constant, right: Constant):
+        """ Calculate operation on two constants
+        Args:
+            operator: operator
+            left: left constant
+            right: right constant
+        Returns:
+            constant of the result, None if operation fails or its result
+            is not a finite number or a boolean
+        """
+
+        try:
+            value = self.evaluator.calculate(self.evaluator.constant_register(left),
+                                             self.evaluator.constant_register(right),
+                                             operator)
+        except Exception:
+            # operation fails when it runs
+            return None
+
+        if value.__class__ is bool:
+            return self.boolean_constant(value)
+
+        if value.__class__ is float and math.isfinite(value):
+            # infinite numbers text is not a number token
+            return Constant(TokenType.REAL, str(value))
+
+        return None
+
+    def simplify_identity(self, operator: str, left, right):
+        """ Remove identity operand of operation, like x * 1 or x - 0, if the
+            other operand always calculates a number
+        Args:
+            operator: operator
+            left: left operand
+            right: right operand
+        Returns:
+            the other operand, None if operation is not an identity
+        """
+
+        if operator not in IDENTITIES:
+            return None
+
+        identity, identity_on_left = IDENTITIES[operator]
+
+        if self.is_number(right, identity) and self.is_numeric_operation(left):
+            return left
+
+        if identity_on_left and self.is_number(left, identity) and self.is_numeric_operation(right):
+            return right
+
+        return None
+
+    def is_number(self, expression_tree, number: float) -> bool:
+        """ Checks if expression node is a number constant equal to number
+        Args:
+            expression_tree: expression node
+            number: number
+        Returns:
+            True if node is a constant equal to number
+        """
+
+        if (expression_tree.type != ExpressionType.CONSTANT
+            or expression_tree.token_type not in (TokenType.NUMBER, TokenType.REAL)):
+            return False
+
+        value = self.evaluator.constant_register(expression_tree)
+        return value.__class__ is float and value == number
+
+    def is_numeric_operation(self, expression_tree) -> bool:
+        """ Checks if expression node is an operation that always calculates a
+            float number, or fails (Recursive Method)
+        Args:
+            expression_tree: expression node
+        Returns:
+            True if node calculates a number
+        """
+
+        if expression_tree.type != ExpressionType.OPERATION:
+            return False
+
+        if expression_tree.operator in ("-", "*", "/"):
+            # strings can't be subtracted, multiplied or divided by numbers
+            return True
+
+        # strings can be added, both operands should be numbers
+        return (expression_tree.operator in NUMERIC_OPERATORS
+                and self.is_numeric_operand(expression_tree.left)
+                and self.is_numeric_operand(expression_tree.right))
+
+    def is_numeric_operand(self, expression_tree) -> bool:
+        """ Checks if expression node is a number constant or a numeric operation
+        Args:
+            expression_tree: expression node
+        Returns:
+            True if node value is a number
+        """
+
+        if expression_tree.type == ExpressionType.CONSTANT:
+            return self.evaluator.constant_register(expression_tree).__class__ is float
+
+        return self.is_numeric_operation(expression_tree)
+
+    def boolean_constant(self, value: bool) -> Constant:
+        """ Builds true or false constant
+        Args:
+            value: boolean value
+        Returns:
+            Constant
+        """
+
+        if value:
+            return Constant(TokenType.TRUE, "true")
+        return Constant(TokenType.FALSE, "false")
@@ -0,0 +1,351 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Dead Code Eliminator
+
+Optional pass over the execution tree after compiling, it removes statements
+that never run or don't change the program output:
+
+    - if, elif and else branches that never run because of constant conditions,
+      an always true branch becomes the else of branches before it
+    - while and for loops with always false conditions
+    - statements after break or continue in the same loop body
+    - variables assigned a constant value that are never read
+
+Constant conditions are found by ConstantFolder, it should run before this pass.
+Symbols tables are built again so removed variables don't have symbols.
+
+The last statement of a for loop body is never removed, continue statement jumps
+to the instruction before it, which is the loop increment.
+
+"""
+
+import re
+
+from compiler.compiler import Compiler, ExecutionTree
+from lexer.lexer import TokenType
+from statements.expression import Constant, ExpressionType, constant_condition
+from statements.statement import (Break, ConditionStatement, Continue, Echo,
+                                  Else, For, If, Input, Variable, While)
+from symbols.symbols_table import SymbolTable
+
+# Variable names in statements text, same as lexer identification regex
+IDENTIFICATION_REGEX = re.compile(r"[a-zA-Z_$][a-zA-Z_$0-9]*")
+
+
+class DeadCodeEliminator:
+    """ Dead Code Eliminator Class
+
+    Class Attributes:
+        stats: number of statements removed by each pass
+    """
+
+    def __init__(self) -> None:
+        """ Dead Code Eliminator Class Constructor """
+
+        self.compiler = Compiler()
+        self.stats = {}
+
+    def optimize(self, execution_tree: ExecutionTree) -> ExecutionTree:
+        """ Remove dead statements of execution tree, statements are modified in place
+        Args:
+            execution_tree: execution tree generated by the compiler
+        Returns:
+            execution tree
+        """
+
+        self.stats = {
+            "dead_branches": 0,
+            "dead_loops": 0,
+            "unreachable_statements": 0,
+            "unused_variables": 0,
+            "removed_symbols": 0,
+        }
+
+        if not execution_tree:
+            return execution_tree
+
+        symbols_count = self.count_symbols(execution_tree)
+
+        execution_tree.tree = self.eliminate_statements(execution_tree.tree, False, False)
+
+        read_variables = set()
+        self.find_read_variables(execution_tree.tree, read_variables)
+        execution_tree.tree = self.remove_unused_variables(execution_tree.tree, read_variables, False)
+
+        # symbols of removed variables are not stored again
+        self.reset_scopes(execution_tree)
+        self.compiler.build_scopes(execution_tree)
+
+        self.stats["removed_symbols"] = symbols_count - self.count_symbols(execution_tree)
+        return execution_tree
+
+    def eliminate_statements(self, statements: list, in_loop: bool, keep_last: bool) -> list:
+        """ Remove dead branches, dead loops and unreachable statements (Recursive Method)
+        Args:
+            statements: list of statements
+            in_loop: True if statements are inside a loop body
+            keep_last: True if last statement should not be removed
+        Returns:
+            list of statements that can run
+        """
+
+        last_statement = statements[-1] if statements else None
+
+        for index, statement in enumerate(statements):
+            if in_loop and isinstance(statement, (Break, Continue)):
+                reachable = statements[:index + 1]
+                if keep_last and statement is not last_statement:
+                    reachable.append(last_statement)
+                self.stats["unreachable_statements"] += len(statements) - len(reachable)
+                statements = reachable
+                break
+
+        result = []
+
+        for statement in statements:
+
+            if self.is_dead(statement) and not (keep_last and statement is last_statement):
+                if isinstance(statement, ConditionStatement):
+                    self.stats["dead_branches"] += 1 + len(statement.elseif_statements)
+                else:
+                    self.stats["dead_loops"] += 1
+                continue
+
+            if isinstance(statement, For):
+                statement.statements = self.eliminate_statements(statement.statements, True, True)
+
+            elif isinstance(statement, While):
+                statement.statements = self.eliminate_statements(statement.statements, True, False)
+
+            elif isinstance(statement, ConditionStatement) and not self.is_dead(statement):
+                # dead condition statement is kept as last statement of for loop body
+                self.eliminate_branches(statement, in_loop)
+
+            result.append(statement)
+
+        return result
+
+    def is_dead(self, statement) -> bool:
+        """ Checks if statement never runs, a loop with always false condition or
+            a condition statement without else that all its conditions are always false
+        Args:
+            statement: statement
+        Returns:
+            True if statement is dead
+        """
+
+        if isinstance(statement, (For, While)):
+            return constant_condition(statement.expression_tree) is False
+
+        if isinstance(statement, ConditionStatement):
+            branches = [statement.if_statement] + list(statement.elseif_statements)
+            return (not statement.else_statement
+                    and all(constant_condition(branch.expression_tree) is False
+                            for branch in branches))
+
+        return False
+
+    def eliminate_branches(self, statement: ConditionStatement, in_loop: bool):
+        """ Remove branches of condition statement that never run
+        Args:
+            statement: condition statement
+            in_loop: True if statement is inside a loop body
+        Returns:
+            None
+        """
+
+        branches = []
+        else_statement = statement.else_statement
+
+        for position, branch in enumerate([statement.if_statement] + list(statement.elseif_statements)):
+            condition_value = constant_condition(branch.expression_tree)
+
+            if condition_value is False:
+                self.stats["dead_branches"] += 1
+                continue
+
+            branch.statements = self.eliminate_statements(branch.statements, in_loop, False)
+
+            if condition_value:
+                # branches after always true branch never run
+                self.stats["dead_branches"] += len(statement.elseif_statements) - position
+                if else_statement:
+                    self.stats["dead_branches"] += 1
+
+                if branches:
+                    # it runs if branches before it don't
+                    else_statement = Else(branch.statements)
+                    else_statement.line_number = branch.line_number
+                else:
+                    branches.append(branch)
+                    else_statement = None
+                break
+
+            branches.append(branch)
+
+        else:
+            if else_statement:
+                else_statement.statements = self.eliminate_statements(
+                    else_statement.statements, in_loop, False)
+
+        if not branches:
+            # else always runs when conditions before it are always false
+            branch = If("true", else_statement.statements)
+            branch.line_number = else_statement.line_number
+            branch.expression_tree = Constant(TokenType.TRUE, "true")
+            branches.append(branch)
+            else_statement = None
+
+        if_statement = branches[0]
+        if not isinstance(if_statement, If):
+            if_statement = If(if_statement.condition, if_statement.statements)
+            if_statement.expression_tree = branches[0].expression_tree
+            if_statement.line_number = branches[0].line_number
+
+        statement.if_statement = if_statement
+        statement.elseif_statements = branches[1:]
+        statement.else_statement = else_statement
+
+    def find_read_variables(self, statements: list, read_variables: set):
+        """ Find names of variables that statements read (Recursive Method), all
+            names in statements text are considered read
+        Args:
+            statements: list of statements
+            read_variables: set to add names to
+        Returns:
+            None
+        """
+
+        for statement in statements:
+            texts = []
+
+            if isinstance(statement, Variable):
+                texts.append(str(statement.variable_value))
+                if (statement.operation != TokenType.EQUAL
+                    or not IDENTIFICATION_REGEX.fullmatch(statement.variable_name)):
+                    # x += 1 and x[1] = 1 read x
+                    texts.append(statement.variable_name)
+
+            elif isinstance(statement, Input):
+                texts.append(statement.input_variable)
+
+            elif isinstance(statement, Echo):
+                texts.append(statement.echo_string)
+
+            elif isinstance(statement, For):
+                texts.append(statement.loop_condition or "")
+                self.find_read_variables(statement.statements, read_variables)
+
+            elif isinstance(statement, While):
+                texts.append(statement.condition)
+                self.find_read_variables(statement.statements, read_variables)
+
+            elif isinstance(statement, ConditionStatement):
+                for branch in [statement.if_statement] + list(statement.elseif_statements):
+                    texts.append(branch.condition)
+                    self.find_read_variables(branch.statements, read_variables)
+
+                if statement.else_statement:
+                    self.find_read_variables(statement.else_statement.statements, read_variables)
+
+            for text in texts:
+                read_variables.update(IDENTIFICATION_REGEX.findall(text))
+
+    def remove_unused_variables(self, statements: list, read_variables: set, keep_last: bool) -> list:
+        """ Remove variables that are never read and their value is a constant,
+            assigning a constant doesn't fail (Recursive Method)
+        Args:
+            statements: list of statements
+            read_variables: names of variables that are read
+            keep_last: True if last statement should not be removed
+        Returns:
+            list of statements
+        """
+
+        result = []
+
+        for index, statement in enumerate(statements):
+
+            if (isinstance(statement, Variable)
+                and statement.operation == TokenType.EQUAL
+                and statement.variable_name not in read_variables
+                and statement.expression_tree is not None
+                and statement.expression_tree.type == ExpressionType.CONSTANT
+                and not (keep_last and index == len(statements) - 1)):
+                self.stats["unused_variables"] += 1
+                continue
+
+            if isinstance(statement, For):
+                statement.statements = self.remove_unused_variables(
+                    statement.statements, read_variables, True)
+
+            elif isinstance(statement, While):
+                statement.statements = self.remove_unused_variables(
+                    statement.statements, read_variables, False)
+
+            elif isinstance(statement, ConditionStatement):
+                branches = [statement.if_statement] + list(statement.elseif_statements)
+                if statement.else_statement:
+                    branches.append(statement.else_statement)
+
+                for branch in branches:
+                    branch.statements = self.remove_unused_variables(
+                        branch.statements, read_variables, False)
+
+            result.append(statement)
+
+        return result
+
+    def reset_scopes(self, execution_tree: ExecutionTree):
+        """ Empty symbols tables and symbol slots of execution tree statements
+        Args:
+            execution_tree: execution tree
+        Returns:
+            None
+        """
+
+        execution_tree.symbols_table = SymbolTable()
+
+        statements = list(execution_tree.tree)
+
+        while statements:
+            statement = statements.pop()
+            statement.symbol_slots = {}
+
+            if self.compiler.is_scope_statement(statement):
+                statement.symbols_table = SymbolTable()
+                statements.extend(statement.statements)
+
+            elif isinstance(statement, ConditionStatement):
+                statements.append(statement.if_statement)
+                statements.extend(statement.elseif_statements)
+                if statement.else_statement:
+                    statements.append(statement.else_statement)
+
+    def count_symbols(self, execution_tree: ExecutionTree) -> int:
+        """ Count symbols of all symbols tables of execution tree
+        Args:
+            execution_tree: execution tree
+        Returns:
+            number of symbols
+        """
+
+        count = len(execution_tree.symbols_table.values)
+        statements = list(execution_tree.tree)
+
+        while statements:
+            statement = statements.pop()
+
+            if self.compiler.is_scope_statement(statement):
+                count += len(statement.symbols_table.values)
+                statements.extend(statement.statements)
+
+            elif isinstance(statement, ConditionStatement):
+                statements.append(statement.if_statement)
+                statements.extend(statement.elseif_statements)
+                if statement.else_statement:
+                    statements.append(statement.else_statement)
+
+        return count
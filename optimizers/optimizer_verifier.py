@@ -0,0 +1,56 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Optimizer Verifier
+
+Runs sample programs with and without an optimizer and verifies that
+the optimized programs produce identical output, errors are part of the output.
+
+Usage:
+    python3 -m optimizers.optimizer_verifier
+
+"""
+
+import sys
+
+from optimizers.peephole_optimizer import PeepholeOptimizer
+from runners.program_verifier import DEFAULT_INPUT, verify_programs
+
+
+def verify_optimizer(optimizer_class=PeepholeOptimizer, folder="asl_files",
+                     program_input=DEFAULT_INPUT, **runner_options) -> dict:
+    """ Verifies that optimized programs output is identical to
+        not optimized programs output
+    Args:
+        optimizer_class: optimizer class to verify
+        folder: folder that contains .asl files
+        program_input: text used as keyboard input
+        runner_options: Optional, other AslRunner arguments, like executor,
+                        transpile or tree_optimizers
+    Returns:
+        dictionary of file name to (expected output, optimized output)
+        of programs that produce different output, empty if all are identical
+    """
+
+    return verify_programs(folder, program_input, optimizer=optimizer_class(), **runner_options)
+
+
+def main():
+    """ Optimizer Verifier main function """
+
+    differences = verify_optimizer()
+
+    for filename, (expected_output, optimized_output) in differences.items():
+        print(f"{filename}: optimized output is different")
+        print(f"expected:\n{expected_output}")
+        print(f"optimized:\n{optimized_output}")
+
+    if differences:
+        sys.exit(1)
+
+    print("optimized programs output is identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Peephole Optimizer
+
+Optional pass between instructions generation and execution, it removes
+instructions that only cost executor steps:
+
+    - jumps to labels and to gotos are threaded to their final destination
+    - instructions that can't be reached are removed, like code after goto
+    - label instructions are removed after resolving jumps to indexes
+    - gotos to the next instruction are removed
+
+"""
+
+from instructions.instruction import InstructionType
+
+
+class PeepholeOptimizer:
+    """ Peephole Optimizer Class
+
+    Class Attributes:
+        stats: number of instructions changed or removed by each optimization
+    """
+
+    def __init__(self) -> None:
+        """ Peephole Optimizer Class Constructor """
+
+        self.stats = {}
+
+    def optimize(self, instructions: list) -> list:
+        """ Optimize instructions list, jump instructions are modified in place
+        Args:
+            instructions: instructions list generated by InstructionsGenerator
+        Returns:
+            optimized instructions list, jumps goto_index point to indexes in it
+        """
+
+        self.stats = {
+            "instructions": len(instructions),
+            "threaded_jumps": 0,
+            "unreachable": 0,
+            "labels": 0,
+            "redundant_gotos": 0,
+            "optimized_instructions": 0,
+        }
+
+        if not instructions:
+            return instructions
+
+        targets = self.resolve_targets(instructions)
+        self.thread_jumps(instructions, targets)
+
+        keep = self.find_reachable(instructions, targets)
+        self.stats["unreachable"] = keep.count(False)
+
+        for index, instruction in enumerate(instructions):
+            if keep[index] and instruction.type == InstructionType.LABEL:
+                keep[index] = False
+                self.stats["labels"] += 1
+
+        self.remove_redundant_gotos(instructions, targets, keep)
+
+        optimized = self.relocate(instructions, targets, keep)
+        self.stats["optimized_instructions"] = len(optimized)
+        return optimized
+
+    def is_jump(self, instruction) -> bool:
+        """ Checks if instruction is goto, jump if, jump if not or counted loop instruction
+        Args:
+            instruction: instruction
+        Returns:
+            True if instruction is a jump
+        """
+
+        return (instruction.type == InstructionType.GOTO
+                or instruction.type == InstructionType.JUMP_IF
+                or instruction.type == InstructionType.JUMP_IF_NOT
+                or instruction.type == InstructionType.COUNTED_LOOP)
+
+    def resolve_targets(self, instructions: list) -> dict:
+        """ Finds target index of every jump instruction
+        Args:
+            instructions: instructions list
+        Returns:
+            dictionary of jump instruction index to target index
+        """
+
+        label_index_table = {}
+        for index, instruction in enumerate(instructions):
+            if instruction.type == InstructionType.LABEL:
+                label_index_table[instruction.label_name] = index
+
+        targets = {}
+        for index, instruction in enumerate(instructions):
+            if self.is_jump(instruction):
+                target = label_index_table.get(instruction.goto_label)
+                if target is None:
+                    target = instruction.goto_index
+                targets[index] = target
+        return targets
+
+    def thread_jumps(self, instructions: list, targets: dict):
+        """ Changes jumps targets that are labels or gotos to the first instruction
+            that does something
+        Args:
+            instructions: instructions list
+            targets: dictionary of jump instruction index to target index
+        Returns:
+            None
+        """
+
+        for index in targets:
+            target = targets[index]
+            final_target = self.final_target(instructions, targets, target)
+
+            if final_target != target:
+                targets[index] = final_target
+                self.stats["threaded_jumps"] += 1
+
+    def final_target(self, instructions: list, targets: dict, target: int) -> int:
+        """ Follows labels and gotos starting from target
+        Args:
+            instructions: instructions list
+            targets: dictionary of jump instruction index to target index
+            target: index to start from
+        Returns:
+            index of first instruction that is not label or goto, goto
+            of an infinite loop, or the end of instructions list
+        """
+
+        visited = set()
+
+        while target is not None and target < len(instructions):
+            instruction = instructions[target]
+
+            if instruction.type == InstructionType.LABEL:
+                target += 1
+
+            elif instruction.type == InstructionType.GOTO and target not in visited:
+                visited.add(target)
+                target = targets[target]
+
+            else:
+                break
+
+        return target
+
+    def find_reachable(self, instructions: list, targets: dict) -> list:
+        """ Finds instructions that can be reached from first instruction
+        Args:
+            instructions: instructions list
+            targets: dictionary of jump instruction index to target index
+        Returns:
+            list of booleans, True if instruction at the same index is reachable
+        """
+
+        reachable = [False] * len(instructions)
+        pending = [0]
+
+        while pending:
+            index = pending.pop()
+
+            if index is None or index >= len(instructions) or reachable[index]:
+                continue
+
+            reachable[index] = True
+            instruction = instructions[index]
+
+            if index in targets:
+                pending.append(targets[index])
+
+            if instruction.type != InstructionType.GOTO:
+                pending.append(index + 1)
+
+        return reachable
+
+    def next_kept(self, keep: list, index: int) -> int:
+        """ Finds first kept instruction at or after index
+        Args:
+            keep: list of booleans, True for kept instructions
+            index: index to start from
+        Returns:
+            index of first kept instruction, or length of instructions list
+        """
+
+        while index < len(keep) and not keep[index]:
+            index += 1
+        return index
+
+    def remove_redundant_gotos(self, instructions: list, targets: dict, keep: list):
+        """ Removes gotos that go to the next kept instruction, removing a goto
+            can make a previous goto redundant, so it is repeated until nothing changes
+        Args:
+            instructions: instructions list
+            targets: dictionary of jump instruction index to target index
+            keep: list of booleans, True for kept instructions
+        Returns:
+            None
+        """
+
+        changed = True
+        while changed:
+            changed = False
+            for index, instruction in enumerate(instructions):
+                if (keep[index]
+                    and instruction.type == InstructionType.GOTO
+                    and targets[index] is not None
+                    and self.next_kept(keep, index + 1) == self.next_kept(keep, targets[index])):
+                    keep[index] = False
+                    self.stats["redundant_gotos"] += 1
+                    changed = True
+
+    def relocate(self, instructions: list, targets: dict, keep: list) -> list:
+        """ Builds optimized list of kept instructions and points jumps to new indexes
+        Args:
+            instructions: instructions list
+            targets: dictionary of jump instruction index to target index
+            keep: list of booleans, True for kept instructions
+        Returns:
+            optimized instructions list
+        """
+
+        # new index of every old index, an index of a removed instruction
+        # maps to the next kept instruction
+        new_indexes = [0] * (len(instructions) + 1)
+        new_index = len([flag for flag in keep if flag])
+        for index in range(len(instructions), -1, -1):
+            if index < len(instructions) and keep[index]:
+                new_index -= 1
+            new_indexes[index] = new_index
+
+        optimized = []
+        for index, instruction in enumerate(instructions):
+            if not keep[index]:
+                continue
+            if index in targets and targets[index] is not None:
+                instruction.goto_index = new_indexes[targets[index]]
+            optimized.append(instruction)
+
+        return optimized
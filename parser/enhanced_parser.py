@@ -12,9 +12,63 @@ Convert list of tokens into statements and extract their attributes
 # from parser import Parser
 
 
-from lexer.lexer import Token, TokenType
+from lexer.lexer import Lexer, Token, TokenType
 from statements.statement import Echo, Else, ElseIf, EndFor, EndWhile, Fi, For, If, Input, Variable, VariableType, While, Break, Continue
 from exceptions.language_exception import SyntaxError
+from parser.expression_parser import ExpressionParser, normalize_minus_signs
+from parser.token_buffer import TokenBuffer
+from statements.expression import ExpressionType
+
+EXPRESSION_OPERANDS = (TokenType.IDENTIFICATION, TokenType.NUMBER, TokenType.REAL, TokenType.STRING)
+
+
+def parse_echo_string(echo_string: str, lexer: Lexer) -> tuple:
+    """ Parse echo string into literal parts and variable slots, so echo
+        variables are found once and executing echo is only joining the parts
+        after filling the slots with variable values.
+
+        Example:
+            "{i} is even" ---> parts ['', ' is even'], variables [(0, 'i')]
+
+    Args:
+        echo_string: echo string between double quotes
+        lexer: lexer that tokenizes echo string
+    Returns:
+        tuple of echo parts list and list of (part index, variable name) pairs
+    """
+
+    # Tokenize echo string and keep unknown tokens and spaces.
+    # Echo string might contain anything, this is needed only to find if
+    # echo string contains variables so they can be substituted.
+    tokens = lexer.tokenize_text(
+        echo_string.strip('"'),
+        keep_unknown=True,
+        keep_spaces=True)
+
+    echo_parts = []
+    echo_variables = []
+    literal = ""
+
+    for token in tokens:
+        if token.token_type == TokenType.IDENTIFICATIONBETWEENBRSCKETS:
+            # Variable between {} for example {variable_name}, add a slot
+            # to be filled with variable value
+            if literal:
+                echo_parts.append(literal)
+                literal = ""
+
+            echo_variables.append((len(echo_parts), token.match.strip("{}")))
+            echo_parts.append("")
+
+        elif token.token_type == TokenType.NUMBER:
+            literal += str(int(token.match))
+        else:
+            literal += token.match
+
+    if literal:
+        echo_parts.append(literal)
+
+    return echo_parts, echo_variables
 
 
 class EnhancedParser:
@@ -37,6 +91,7 @@ class EnhancedParser:
         """
 
         self.token_pointer = 0
+        self.echo_lexer = Lexer()
 
         self.comments = [
             TokenType.COMMENT
@@ -103,11 +158,32 @@ class EnhancedParser:
             list of statements
         """
 
+        return list(self.parse_statements(lexes))
+
+    def parse_statements(self, lexes):
+        """ Parse lexes into statements, statements are yielded once they are
+            parsed. Lexes that are not a list, like tokens generator of
+            EnhancedLexer.tokenize_stream(), are read through a TokenBuffer.
+        Args:
+            lexes: list or iterable of lexes
+
+        Returns:
+            generator of statements
+        """
+
+        if not isinstance(lexes, (list, TokenBuffer)):
+            lexes = TokenBuffer(lexes)
+
+        streaming = isinstance(lexes, TokenBuffer)
         statements = []
 
         self.token_pointer = 0
 
-        while self.token_pointer <= len(lexes) - 1:
+        while self.is_there_more_tokens(lexes):
+
+            if streaming:
+                # tokens of parsed statements are not read again
+                lexes.release(self.token_pointer)
 
             lex = lexes[self.token_pointer]
             lex_type = lex.token_type
@@ -148,7 +224,28 @@ class EnhancedParser:
             # Increment Index to get next token
             self.increment_token_pointer()
 
-        return statements
+            for statement in statements:
+                self.set_line_number(statement, lex.line_number)
+
+            yield from statements
+            statements.clear()
+
+    def set_line_number(self, statement, line_number):
+        """ Set source line of statement, and of initial variable and increment
+            of for loop statement
+        Args:
+            statement: parsed statement
+            line_number: line of first token of statement
+        Returns:
+            None
+        """
+
+        statement.line_number = line_number
+
+        if isinstance(statement, For):
+            for variable in (statement.loop_initial_variable, statement.loop_increment):
+                if isinstance(variable, Variable):
+                    variable.line_number = line_number
 
     def check_token_type_in_list(self, lexes, token_types, stop_on=None):
         """ Checks if current token belongs to list of token types.
@@ -173,11 +270,14 @@ class EnhancedParser:
     def is_there_more_tokens(self, lexes):
         """ This Method Checks if lexes list contains more tokens or not.
         Args:
-            lexes: List of tokens.
+            lexes: List of tokens, or TokenBuffer.
         Returns:
             True:  If there are more tokens.
             False: If there are not more tokens.
         """
+
+        if isinstance(lexes, TokenBuffer):
+            return lexes.has_token(self.token_pointer)
         return len(lexes) > self.token_pointer
 
     def parse_for(self, lexes, statements):
@@ -199,7 +299,9 @@ class EnhancedParser:
             self.increment_token_pointer()
 
             loop_initial_variable = self.parse_for_loop_variable(lexes, parenthesis_stack)
+            condition_start = self.token_pointer + 1
             condition = self.parse_for_loop_condition(lexes, parenthesis_stack)
+            condition_tree = self.parse_expression(lexes, condition_start, self.token_pointer - 1)
             increment = self.parse_for_loop_increment(lexes)
 
             # empty condition should return true, this is necessary for cases like;
@@ -208,11 +310,14 @@ class EnhancedParser:
             # as a technique for infinite loop, this language should support it.
             if len(condition) == 0:
                 condition = "1"
+                condition_tree = self.parse_expression(
+                    [Token(TokenType.NUMBER, condition, lexes[self.token_pointer].line_number)], 0, 1)
 
             if lexes[self.token_pointer].token_type == TokenType.CLOSINGPARENTHESIS:
                 parenthesis_stack.pop()
                 if not parenthesis_stack:
                     forloop = For([], loop_initial_variable, condition, increment)
+                    forloop.expression_tree = condition_tree
                     statements.append(forloop)
                 else:
                     self.handle_syntax_error(lexes[self.token_pointer], "invalid for loop, unbalanced parenthesis")
@@ -245,12 +350,35 @@ class EnhancedParser:
 
         return condition
 
-    def parse_expression(self, lexes):
-        if (lexes[self.token_pointer].token_type == TokenType.NUMBER
-            or lexes[self.token_pointer].token_type == TokenType.REAL):
-            pass
+    def parse_expression(self, lexes, start, end, operations_only=True):
+        """ Parse expression tokens into expression tree
+        Args:
+            lexes: list of lexes
+            start: index of first expression token
+            end: index after last expression token
+            operations_only: Optional, if False a value between parenthesis, like (x),
+                             is parsed too, variable values are calculated from
+                             their trees only
+        Returns:
+            expression tree, None if tokens are not an expression that
+            calculates something or a single value
+        """
+
+        tokens = normalize_minus_signs(lexes[start:end])
+
+        if len(tokens) == 1 and tokens[0].token_type in EXPRESSION_OPERANDS:
+            return ExpressionParser().parse(tokens)
+
+        try:
+            expression_tree = ExpressionParser().parse(tokens)
+        except SyntaxError:
+            # invalid expressions fail when they are evaluated
+            return None
+
+        if operations_only and expression_tree.type != ExpressionType.OPERATION:
+            return None
+        return expression_tree
 
-        pass
     def parse_for_loop_variable(self, lexes, parenthesis_stack):
         """ Parse for loop Variable
         Args:
@@ -272,6 +400,7 @@ class EnhancedParser:
             if self.check_token_type_in_list(lexes, self.valid_assignment_operation, TokenType.SEMICOLON):
                 var_op = lexes[self.token_pointer].token_type
                 self.increment_token_pointer()
+                value_start = self.token_pointer
                 var_val = ""
                 # Get variable expression.
                 while lexes[self.token_pointer].token_type != TokenType.SEMICOLON:
@@ -284,7 +413,9 @@ class EnhancedParser:
                         parenthesis_stack.pop()
                     self.increment_token_pointer()
 
-                return Variable(var_name, var_op, var_val)
+                variable = Variable(var_name, var_op, var_val)
+                variable.expression_tree = self.parse_expression(lexes, value_start, self.token_pointer, False)
+                return variable
         return None
 
     def parse_for_loop_increment(self, lexes):
@@ -306,6 +437,7 @@ class EnhancedParser:
             if self.check_token_type_in_list(lexes, self.valid_assignment_operation, TokenType.CLOSINGPARENTHESIS):
                 var_operation = lexes[self.token_pointer].token_type
                 self.increment_token_pointer()
+                value_start = self.token_pointer
                 var_val = ""
 
                 # Get variable expression.
@@ -317,7 +449,9 @@ class EnhancedParser:
 
                     self.increment_token_pointer()
 
-                return Variable(var_name, var_operation, var_val)
+                variable = Variable(var_name, var_operation, var_val)
+                variable.expression_tree = self.parse_expression(lexes, value_start, self.token_pointer, False)
+                return variable
             else:
                 self.handle_syntax_error(lexes[self.token_pointer], "Invalid operation")
         return None
@@ -332,8 +466,10 @@ class EnhancedParser:
         """
 
         self.increment_token_pointer()
+        condition_start = self.token_pointer
         while_condition = self.parse_between_parenthesis(lexes)
         while_statement = While(while_condition, [])
+        while_statement.expression_tree = self.parse_expression(lexes, condition_start, self.token_pointer + 1)
         statements.append(while_statement)
 
     def parse_variable(self, lexes, statements):
@@ -368,14 +504,17 @@ class EnhancedParser:
                     self.increment_token_pointer()
 
                 first_token_type = VariableType.ARRAY
-                pass
+                expression_tree = None
             else:
+                value_start = self.token_pointer
                 first_token_type, variable_value = self.parse_variable_expression(lexes)
+                expression_tree = self.parse_expression(lexes, value_start, self.token_pointer, False)
                 # Token pointer now points at next token outside variable scope,
                 # this has caused an error with next statement
                 self.token_pointer -= 1
 
             variable_statement = Variable(variable_name, operation, variable_value, first_token_type)
+            variable_statement.expression_tree = expression_tree
             statements.append(variable_statement)
         elif lexes[self.token_pointer].token_type == TokenType.OPENSQUAREBRACKET:
             # Array referencing here.
@@ -448,8 +587,10 @@ class EnhancedParser:
         """
 
         self.increment_token_pointer()
+        condition_start = self.token_pointer
         elif_condition = self.parse_between_parenthesis(lexes)
         elif_statement = ElseIf(elif_condition, [])
+        elif_statement.expression_tree = self.parse_expression(lexes, condition_start, self.token_pointer + 1)
         statements.append(elif_statement)
         pass
 
@@ -464,9 +605,11 @@ class EnhancedParser:
 
         self.increment_token_pointer()
 
+        condition_start = self.token_pointer
         if_condition = self.parse_between_parenthesis(lexes)
 
         if_statement = If(if_condition, [])
+        if_statement.expression_tree = self.parse_expression(lexes, condition_start, self.token_pointer + 1)
         statements.append(if_statement)
         pass
 
@@ -534,6 +677,8 @@ class EnhancedParser:
                 self.handle_syntax_error(next_lex, "Unclosed parenthesis in echo")
 
         echo_statement = Echo(echoString)
+        echo_statement.echo_parts, echo_statement.echo_variables = parse_echo_string(
+            echoString, self.echo_lexer)
         statements.append(echo_statement)
 
     def parse_input(self, lexes, statements):
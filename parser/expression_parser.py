@@ -0,0 +1,204 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Expression Parser Library
+
+Parses expression tokens into expression tree with operators precedence,
+operators with the same precedence are calculated from left to right.
+
+    Precedence (lowest to highest):
+        |
+        &
+        ==  !=
+        <  >  <=  >=
+        +  -
+        *  /  %
+
+"""
+
+from exceptions.language_exception import SyntaxError
+from lexer.lexer import Token, TokenType
+from statements.expression import Constant, Operation, VariableReference
+
+# Binary operators binding power, higher binds tighter
+OPERATORS_PRECEDENCE = {
+    TokenType.OR: 1,
+    TokenType.AND: 2,
+    TokenType.EQUIVALENT: 3,
+    TokenType.NOTEQUIVALENT: 3,
+    TokenType.GREATERTHAN: 4,
+    TokenType.LESSTHAN: 4,
+    TokenType.GREATERTHANOREQUAL: 4,
+    TokenType.LESSTHANOREQUAL: 4,
+    TokenType.ADD: 5,
+    TokenType.SUB: 5,
+    TokenType.MULT: 6,
+    TokenType.DIV: 6,
+    TokenType.MOD: 6,
+}
+
+CONSTANT_TOKENS = (TokenType.NUMBER, TokenType.REAL, TokenType.STRING)
+
+
+def normalize_minus_signs(tokens: list, parenthesis_operand: bool = False) -> list:
+    """ Conditions used to be evaluated by joining tokens without spaces,
+        substituting variables by their values and tokenizing the text again.
+        In the joined text a minus sign followed by a number is subtraction if
+        the previous token is a number or a variable value, otherwise it is
+        a negative number, for example x -1 becomes x-1 (subtraction) and
+        (a) - 1 becomes (a)-1 (negative number). Apply the same rule here.
+    Args:
+        tokens: expression tokens
+        parenthesis_operand: Optional, if True, a closing parenthesis is an operand
+                             too, (a) - 1 is a subtraction. Texts evaluated by
+                             Evaluator are not joined, their tokens are as written
+    Returns:
+        tokens
+    """
+
+    operands = (TokenType.NUMBER, TokenType.REAL, TokenType.IDENTIFICATION)
+    if parenthesis_operand:
+        operands += (TokenType.CLOSINGPARENTHESIS,)
+    numbers = (TokenType.NUMBER, TokenType.REAL)
+    result = []
+    previous_is_operand = False
+    index = 0
+    count = len(tokens)
+
+    while index < count:
+        token = tokens[index]
+        token_type = token.token_type
+
+        if (token_type in numbers
+            and previous_is_operand
+            and token.match.startswith('-')):
+            # subtraction
+            result.append(Token(TokenType.SUB, '-', token.line_number))
+            token = Token(token_type, token.match[1:], token.line_number)
+
+        elif (token_type == TokenType.SUB
+              and not previous_is_operand
+              and index + 1 < count
+              and tokens[index + 1].token_type in numbers
+              and not tokens[index + 1].match.startswith('-')):
+            # negative number
+            next_token = tokens[index + 1]
+            token = Token(next_token.token_type, '-' + next_token.match, token.line_number)
+            index += 1
+
+        result.append(token)
+        previous_is_operand = token.token_type in operands
+        index += 1
+
+    return result
+
+
+class ExpressionParser:
+    """
+
+    Expression Parser Class
+
+    Pratt parser, each operand is parsed first, then operators that bind
+    tighter than the current operator take the operand as their left side.
+
+    """
+
+    def __init__(self) -> None:
+        """ Expression Parser Class Constructor """
+
+        self.tokens = []
+        self.token_pointer = 0
+
+    def parse(self, tokens: list):
+        """ Parse expression tokens into expression tree
+        Args:
+            tokens: expression tokens, spaces and comments are ignored
+        Returns:
+            root expression node
+        Raises:
+            SyntaxError: if tokens are not a valid expression
+        """
+
+        self.tokens = [token for token in tokens
+                       if token.token_type not in (TokenType.SPACE, TokenType.COMMENT)]
+        self.token_pointer = 0
+
+        if not self.tokens:
+            raise SyntaxError("empty expression")
+
+        expression = self.parse_expression(0)
+
+        if self.token_pointer < len(self.tokens):
+            self.handle_syntax_error(self.tokens[self.token_pointer], "unexpected token in expression")
+
+        return expression
+
+    def parse_expression(self, min_precedence: int):
+        """ Parse operand followed by operators that bind tighter than min_precedence
+        Args:
+            min_precedence: precedence of the operator on the left of the expression
+        Returns:
+            expression node
+        """
+
+        left = self.parse_operand()
+
+        while self.token_pointer < len(self.tokens):
+            token = self.tokens[self.token_pointer]
+            precedence = OPERATORS_PRECEDENCE.get(token.token_type)
+
+            if precedence is None or precedence <= min_precedence:
+                break
+
+            self.token_pointer += 1
+            right = self.parse_expression(precedence)
+            left = Operation(token.match, left, right)
+
+        return left
+
+    def parse_operand(self):
+        """ Parse constant, variable or expression between parenthesis
+        Args:
+            None
+        Returns:
+            expression node
+        """
+
+        if self.token_pointer >= len(self.tokens):
+            self.handle_syntax_error(self.tokens[-1], "missing operand after")
+
+        token = self.tokens[self.token_pointer]
+        self.token_pointer += 1
+
+        if token.token_type in CONSTANT_TOKENS:
+            return Constant(token.token_type, token.match)
+
+        if token.token_type == TokenType.IDENTIFICATION:
+            return VariableReference(token.match)
+
+        if token.token_type == TokenType.OPENPARENTHESIS:
+            expression = self.parse_expression(0)
+
+            if (self.token_pointer >= len(self.tokens)
+                or self.tokens[self.token_pointer].token_type != TokenType.CLOSINGPARENTHESIS):
+                self.handle_syntax_error(token, "parenthesis error")
+
+            self.token_pointer += 1
+            expression.parentheses += 1
+            return expression
+
+        self.handle_syntax_error(token, "invalid operand")
+
+    def handle_syntax_error(self, token: Token, message):
+        """ Raise syntax error
+        Args:
+            token: token that caused the error
+            message: error message
+        Returns:
+            None
+        Raises:
+            SyntaxError
+        """
+
+        raise SyntaxError(message, token)
@@ -0,0 +1,101 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Token Buffer Library
+
+Lookahead buffer over tokens that are yielded by the lexer, the parser reads
+tokens by their index like a list of tokens. Tokens are read from the lexer
+when the parser reaches them, and tokens of parsed statements are released, so
+the buffer only holds tokens of the statement being parsed.
+
+"""
+
+
+class TokenBuffer:
+    """ Token Buffer Class
+
+    Class Attributes:
+        tokens: iterator of tokens
+        buffer: tokens read and not released yet
+        offset: index of first token in buffer
+        exhausted: True if all tokens were read
+    """
+
+    def __init__(self, tokens) -> None:
+        """ Token Buffer Class Constructor
+        Args:
+            tokens: iterable of tokens, like tokens generator of EnhancedLexer.tokenize_stream()
+        """
+
+        self.tokens = iter(tokens)
+        self.buffer = []
+        self.offset = 0
+        self.exhausted = False
+
+    def fill(self, index: int):
+        """ Read tokens until buffer contains token of index, or all tokens are read
+        Args:
+            index: token index
+        Returns:
+            None
+        """
+
+        buffer = self.buffer
+        missing = index - self.offset - len(buffer) + 1
+
+        while missing > 0 and not self.exhausted:
+            try:
+                buffer.append(next(self.tokens))
+            except StopIteration:
+                self.exhausted = True
+            missing -= 1
+
+    def has_token(self, index: int) -> bool:
+        """ Checks if there is a token at index
+        Args:
+            index: token index
+        Returns:
+            True if token exists
+        """
+
+        if index - self.offset < len(self.buffer):
+            return True
+
+        self.fill(index)
+        return index < self.offset + len(self.buffer)
+
+    def release(self, index: int):
+        """ Release tokens before index, they can't be read anymore
+        Args:
+            index: index of first token to keep
+        Returns:
+            None
+        """
+
+        if index > self.offset:
+            del self.buffer[:index - self.offset]
+            self.offset = index
+
+    def __getitem__(self, index):
+        """ Get token by index, or list of tokens by slice
+        Args:
+            index: token index or slice of indexes
+        Raises:
+            IndexError if token doesn't exist or was released
+        Returns:
+            token, or list of tokens
+        """
+
+        if index.__class__ is int:
+            position = index - self.offset
+            if position >= len(self.buffer):
+                self.fill(index)
+            if position < 0:
+                raise IndexError(f"token {index} was released")
+            return self.buffer[position]
+
+        if index.start < self.offset:
+            raise IndexError(f"token {index.start} was released")
+        self.fill(index.stop - 1)
+        return self.buffer[index.start - self.offset:index.stop - self.offset]
@@ -3,7 +3,8 @@
 """
 
 Asl Runner:
-    Contains class that runs Asl Language code
+    Contains class that runs Asl Language code, code can be compiled once
+    into a CompiledProgram and executed many times
 
 """
 
@@ -11,7 +12,11 @@ from compiler.compiler import Compiler
 from lexer.enhanced_lexer import EnhancedLexer
 from parser.enhanced_parser import EnhancedParser
 from executors.executor import Executor
+from exceptions.language_exception import TranspileError
 from instruction_generators.instructions_generator import InstructionsGenerator
+from instruction_generators.python_transpiler import PythonTranspiler
+from runners.compiled_program import CompiledProgram
+from runners.source_reader import DEFAULT_CHUNK_SIZE, read_source_chunks
 
 
 class AslRunner:
@@ -22,14 +27,32 @@ class AslRunner:
                 parser = None,
                 compiler = None,
                 generator = None,
-                executor = None) -> None:
+                executor = None,
+                optimizer = None,
+                tree_optimizers = None,
+                cache = None,
+                transpile = False,
+                timings = None) -> None:
         """ AslRunner Class Constructor
         Args:
             lexer: lexer class to tokenize code
             parser: parser class to parse code
             compiler: compiler class to compile code
             generator: generator class to generate instructions for code
-            executor: executor class to execute generated instructions for code
+            executor: executor class to execute generated instructions for code,
+                      like Executor or ClosureExecutor that executes execution tree
+            optimizer: Optional, optimizer class to optimize generated instructions,
+                       like PeepholeOptimizer, instructions are not optimized if None
+            tree_optimizers: Optional, list of optimizers that optimize execution tree
+                             after compiling it, like ConstantFolder
+            cache: Optional, BytecodeCache to load compiled programs from and store
+                   them in, programs are always compiled if None
+            transpile: Optional, if True, execution tree is transpiled into a python
+                       function by PythonTranspiler instead of generating instructions,
+                       that writes echoed lines to the executor output, programs
+                       that python can't compile are executed by the executor
+            timings: Optional, StageTimings to measure stages of running programs in,
+                     stages are not measured if None
         Returns:
             None
         """
@@ -59,6 +82,13 @@ class AslRunner:
         else:
             self.executor = Executor()
 
+        self.optimizer = optimizer
+        self.tree_optimizers = tree_optimizers or []
+        self.cache = cache
+        self.transpile = transpile
+        self.transpiler = PythonTranspiler() if transpile else None
+        self.timings = timings
+
     def run(self, code):
         """ Asl Language Code Runner
         Args:
@@ -67,20 +97,214 @@ class AslRunner:
             None
         """
 
+        self.execute(self.compile(code))
+
+    def run_file(self, filename, chunk_size=DEFAULT_CHUNK_SIZE):
+        """ Asl Language Source File Runner
+        Args:
+            filename: source file name
+            chunk_size: number of characters read at once
+        Returns:
+            None
+        """
+
+        self.execute(self.compile_file(filename, chunk_size))
+
+    def compile(self, code):
+        """ Compiles code into program that can be executed many times by execute()
+        Args:
+            code: code text to be compiled
+        Returns:
+            CompiledProgram, or None if code doesn't have tokens
+        """
+
+        program = None
+        cache_key = None
+
+        if self.cache:
+            # Load compiled program if code was compiled before
+            cache_key = self.cache.cache_key(code, self.components())
+            program = self.measure("cache load", lambda: self.cache.load(cache_key))
+
+        if program:
+            return CompiledProgram(*program)
+
         # Tokenize Text file into list of meaningful tokens
-        tokens = self.lexer.tokenize_text(code)
+        tokens = self.measure("lex", lambda: self.lexer.tokenize_text(code), len, "tokens")
 
         if not tokens:
-            return
+            return None
 
         # Parses list of tokens into list of statements
-        statements = self.parser.parse(tokens)
+        statements = self.measure("parse", lambda: self.parser.parse(tokens), len, "statements")
+
+        return self.build_program(statements, cache_key)
+
+    def compile_file(self, filename, chunk_size=DEFAULT_CHUNK_SIZE):
+        """ Compiles source file into program that can be executed many times by
+            execute(), file is read in chunks and tokens are parsed while they are
+            tokenized, the whole text and its tokens are not kept in memory. If
+            stages are measured, the whole file is read and it is compiled by
+            compile(), so each stage ends before the next one starts
+        Args:
+            filename: source file name
+            chunk_size: number of characters read at once
+        Returns:
+            CompiledProgram
+        """
+
+        if self.timings:
+            code = self.measure("read", lambda: "".join(read_source_chunks(filename, chunk_size)),
+                                len, "characters")
+            return self.compile(code)
+
+        cache_key = None
+
+        if self.cache:
+            # Load compiled program if code was compiled before
+            cache_key = self.cache.cache_key(read_source_chunks(filename, chunk_size),
+                                             self.components())
+            program = self.cache.load(cache_key)
+            if program:
+                return CompiledProgram(*program)
+
+        chunks = read_source_chunks(filename, chunk_size)
+
+        # Tokens are yielded by the lexer while file is read
+        if hasattr(self.lexer, "tokenize_stream"):
+            tokens = self.lexer.tokenize_stream(chunks)
+        else:
+            tokens = self.lexer.tokenize_text("".join(chunks))
+
+        # Statements are yielded by the parser while tokens are yielded
+        if hasattr(self.parser, "parse_statements"):
+            statements = self.parser.parse_statements(tokens)
+        else:
+            statements = self.parser.parse(list(tokens))
+
+        return self.build_program(statements, cache_key)
+
+    def execute(self, program):
+        """ Executes compiled program, variables of the program are restored to
+            their compiled values before it is executed again
+        Args:
+            program: CompiledProgram returned by compile() or compile_file(),
+                     nothing is executed if None
+        Returns:
+            None
+        """
+
+        if not program:
+            return
+
+        if program.runs:
+            program.reset()
+        program.runs += 1
+
+        self.execute_program(program)
+
+    def measure(self, stage, function, size=None, size_name=None):
+        """ Calls function of a stage, and measures it if stages are measured
+        Args:
+            stage: stage name
+            function: function without arguments that runs the stage
+            size: Optional, function that gets size of stage result, like len
+            size_name: Optional, name of size unit, like tokens
+        Returns:
+            function result
+        """
+
+        if not self.timings:
+            return function()
+
+        return self.timings.measure(stage, function, size, size_name)
+
+    def components(self):
+        """ Get objects that compile programs, they are part of cache key
+        Args:
+            None
+        Returns:
+            list of components
+        """
+
+        return [self.lexer, self.parser, self.compiler, self.generator,
+                self.optimizer, self.transpiler] + self.tree_optimizers
+
+    def build_program(self, statements, cache_key=None):
+        """ Compiles statements into program and stores it in cache
+        Args:
+            statements: list or iterable of statements
+            cache_key: cache key of program code, program is not stored if None
+        Returns:
+            CompiledProgram, its instructions are None if program is transpiled
+        """
 
         # Compiles list of statements into execution tree
-        execution_tree = self.compiler.compile(statements)
+        execution_tree = self.measure("compile", lambda: self.compiler.compile(statements))
+
+        for tree_optimizer in self.tree_optimizers:
+            # Optimize execution tree statements
+            execution_tree = self.measure(type(tree_optimizer).__name__,
+                                          lambda: tree_optimizer.optimize(execution_tree))
+
+        instructions = None
+        if not self.transpile:
+            instructions = self.measure("generate", lambda: self.generate(execution_tree),
+                                        len, "instructions")
+
+        if self.cache and cache_key:
+            # Store program before executing it modifies symbols tables
+            self.measure("cache store",
+                         lambda: self.cache.store(cache_key, instructions, execution_tree))
+
+        return CompiledProgram(instructions, execution_tree)
+
+    def execute_program(self, program):
+        """ Executes compiled program, transpiled function or instructions that
+            are generated the first time program is executed are kept in program
+        Args:
+            program: CompiledProgram
+        Returns:
+            None
+        """
+
+        execution_tree = program.execution_tree
+
+        if self.transpile and not program.function and program.instructions is None:
+            try:
+                # Transpiles execution tree into python function
+                program.function = self.measure(
+                    "transpile", lambda: self.transpiler.transpile(
+                        execution_tree, getattr(self.executor, "output", None)))
+            except TranspileError:
+                program.function = None
+
+            if not program.function:
+                program.instructions = self.measure(
+                    "generate", lambda: self.generate(execution_tree), len, "instructions")
+
+        if program.function:
+            # Executes program function
+            self.measure("execute", program.function)
+            return
+
+        # Executes Instructions list into meaningful program
+        self.measure("execute",
+                     lambda: self.executor.execute(program.instructions, execution_tree))
+
+    def generate(self, execution_tree):
+        """ Generates instructions list of execution tree
+        Args:
+            execution_tree: execution tree
+        Returns:
+            instructions list
+        """
 
         # Generates Instructions list
         instructions = self.generator.generate_instructions(execution_tree)
 
-        # Executes Instructions list into meaningful program
-        self.executor.execute(instructions, execution_tree)
+        if self.optimizer:
+            # Optimize Instructions list
+            instructions = self.optimizer.optimize(instructions)
+
+        return instructions
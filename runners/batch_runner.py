@@ -0,0 +1,269 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Batch Runner:
+    Runs many Asl source files in parallel worker processes. Each worker
+    imports the interpreter and builds its AslRunner once, then runs scripts
+    one after another. Output of each script is captured separately, and
+    status and timings of all scripts are summarized in a JSON report.
+
+    Scripts read keyboard input from the same input text, input() fails with
+    end of file error when a script reads more lines than the text has.
+
+Usage:
+    summary = BatchRunner(workers=4).run(find_scripts(["asl_files/*.asl"]))
+    write_summary(summary, "summary.json")
+
+    python3 asl.py --batch "asl_files/*.asl" --workers 4 --summary summary.json
+
+"""
+
+import contextlib
+import glob
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from executors.closure_executor import ClosureExecutor
+from executors.executor import Executor
+from executors.output_writer import DEFAULT_BUFFER_SIZE, OutputWriter
+from optimizers.constant_folder import ConstantFolder
+from optimizers.dead_code_eliminator import DeadCodeEliminator
+from runners.asl_runner import AslRunner
+from runners.bytecode_cache import BytecodeCache
+
+# Runner options, like asl.py command line options
+DEFAULT_OPTIONS = {
+    'engine': 'instructions',
+    'transpile': False,
+    'fold_constants': False,
+    'eliminate_dead_code': False,
+    'cache': False,
+    'cache_dir': None,
+    'output_buffer_size': DEFAULT_BUFFER_SIZE,
+    'input': "",
+}
+
+# Runner of worker process, built once by init_worker()
+worker_runner = None
+worker_options = None
+
+
+def find_scripts(patterns: list) -> list:
+    """ Find source files of file names, glob patterns and folders, .asl files
+        in folders and their sub folders are found
+    Args:
+        patterns: list of file names, glob patterns like asl_files/*.asl, or folders
+    Returns:
+        list of file names, each file is listed once, in the order found
+    """
+
+    scripts = {}
+
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            filenames = sorted(glob.glob(os.path.join(pattern, "**", "*.asl"), recursive=True))
+        else:
+            filenames = sorted(glob.glob(pattern, recursive=True))
+            if not filenames and os.path.isfile(pattern):
+                filenames = [pattern]
+
+        for filename in filenames:
+            scripts.setdefault(filename, None)
+
+    return list(scripts)
+
+
+def build_runner(options: dict) -> AslRunner:
+    """ Build runner of options
+    Args:
+        options: runner options, see DEFAULT_OPTIONS
+    Returns:
+        AslRunner
+    """
+
+    output = OutputWriter(buffer_size=options['output_buffer_size'])
+    if options['engine'] == 'closures':
+        executor = ClosureExecutor(output=output)
+    else:
+        executor = Executor(output=output)
+
+    tree_optimizers = []
+    if options['fold_constants'] or options['eliminate_dead_code']:
+        tree_optimizers.append(ConstantFolder())
+    if options['eliminate_dead_code']:
+        tree_optimizers.append(DeadCodeEliminator())
+
+    cache = None
+    if options['cache']:
+        cache = BytecodeCache(options['cache_dir'])
+
+    return AslRunner(executor=executor,
+                     tree_optimizers=tree_optimizers,
+                     cache=cache,
+                     transpile=options['transpile'])
+
+
+def init_worker(options: dict):
+    """ Worker process initializer, builds runner of the worker
+    Args:
+        options: runner options
+    Returns:
+        None
+    """
+
+    global worker_runner, worker_options
+    worker_options = options
+    worker_runner = build_runner(options)
+
+
+def run_script(filename: str) -> dict:
+    """ Run source file with runner of the worker, program output is captured
+    Args:
+        filename: source file name
+    Returns:
+        result dictionary with file, status, exit_code, output, error, wall and cpu
+    """
+
+    runner = worker_runner
+    options = worker_options
+
+    output = io.StringIO()
+    error = None
+
+    old_stdin = sys.stdin
+    sys.stdin = io.StringIO(options['input'])
+    start_wall = time.perf_counter()
+    start_cpu = time.process_time()
+
+    try:
+        with contextlib.redirect_stdout(output):
+            runner.run_file(filename)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        wall = time.perf_counter() - start_wall
+        cpu = time.process_time() - start_cpu
+        sys.stdin = old_stdin
+
+    return {
+        'file': filename,
+        'status': "error" if error else "ok",
+        'exit_code': 1 if error else 0,
+        'output': output.getvalue(),
+        'error': error,
+        'wall': wall,
+        'cpu': cpu,
+    }
+
+
+class BatchRunner:
+    """ Batch Runner Class
+
+    Class Attributes:
+        workers: number of worker processes
+        options: runner options of workers
+    """
+
+    def __init__(self, workers: int = None, **options) -> None:
+        """ Batch Runner Class Constructor
+        Args:
+            workers: Optional, number of worker processes, number of CPUs if None
+            options: Optional, runner options, like transpile=True, see DEFAULT_OPTIONS
+        Returns:
+            None
+        """
+
+        unknown_options = set(options) - set(DEFAULT_OPTIONS)
+        if unknown_options:
+            raise ValueError(f"unknown batch runner options {sorted(unknown_options)}")
+
+        self.workers = workers or os.cpu_count() or 1
+        self.options = dict(DEFAULT_OPTIONS, **options)
+
+    def run(self, filenames: list, output_dir: str = None) -> dict:
+        """ Run source files in worker processes
+        Args:
+            filenames: list of source file names
+            output_dir: Optional, folder to write output of each script to, in a
+                        .out file named after the script, output is kept in
+                        results if None
+        Returns:
+            summary dictionary with workers, files, passed, failed, wall and
+            results of scripts in the order of filenames
+        """
+
+        start = time.perf_counter()
+        results = []
+
+        if filenames:
+            workers = min(self.workers, len(filenames))
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=init_worker,
+                                     initargs=(self.options,)) as pool:
+                futures = [pool.submit(run_script, filename) for filename in filenames]
+
+                for filename, future in zip(filenames, futures):
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        # worker process failed, like when it was killed
+                        results.append({'file': filename, 'status': "crashed", 'exit_code': 1,
+                                        'output': "", 'error': f"{type(e).__name__}: {e}",
+                                        'wall': None, 'cpu': None})
+
+        if output_dir:
+            self.write_outputs(results, output_dir)
+
+        failed = sum(1 for result in results if result['exit_code'])
+        return {
+            'workers': self.workers,
+            'files': len(results),
+            'passed': len(results) - failed,
+            'failed': failed,
+            'wall': time.perf_counter() - start,
+            'results': results,
+        }
+
+    def write_outputs(self, results: list, output_dir: str):
+        """ Write output of each script to a .out file in output folder, output
+            is replaced by the file name in results
+        Args:
+            results: list of script results
+            output_dir: output folder
+        Returns:
+            None
+        """
+
+        os.makedirs(output_dir, exist_ok=True)
+
+        for index, result in enumerate(results):
+            name = os.path.splitext(os.path.basename(result['file']))[0]
+            output_file = os.path.join(output_dir, f"{index:04d}_{name}.out")
+            with open(output_file, "w") as file:
+                file.write(result['output'])
+
+            del result['output']
+            result['output_file'] = output_file
+
+
+def write_summary(summary: dict, filename: str = None):
+    """ Write JSON summary to file, or print it if file is not set
+    Args:
+        summary: summary dictionary
+        filename: Optional, JSON file name
+    Returns:
+        None
+    """
+
+    text = json.dumps(summary, indent=2)
+
+    if filename:
+        with open(filename, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
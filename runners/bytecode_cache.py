@@ -0,0 +1,199 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Bytecode Cache:
+    Stores compiled programs (instructions list and execution tree) in .aslc
+    files, so running unchanged code again skips lexing, parsing, compiling
+    and generating instructions.
+
+    A cache file starts with a header line:
+
+        ASLC <format version> <interpreter version> <key>
+
+    followed by the pickled program. The key is a hash of the code and of the
+    components that compiled it, their classes and configurations. Files with
+    a different header are ignored and replaced. Like .pyc files, cache files
+    are trusted, so the default cache folder is a folder of the user that runs
+    programs, not a folder next to source files.
+
+"""
+
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+import tempfile
+
+from instructions import __version__ as INSTRUCTIONS_VERSION
+
+CACHE_MAGIC = "ASLC"
+CACHE_FORMAT_VERSION = 1
+CACHE_EXTENSION = ".aslc"
+CACHE_FOLDER_NAME = "asl"
+
+# Cache files are only valid for the same instructions version and python version
+INTERPRETER_VERSION = (f"{INSTRUCTIONS_VERSION}-"
+                       f"py{sys.version_info.major}.{sys.version_info.minor}")
+
+
+def default_cache_folder() -> str:
+    """ Get default cache folder of the user, $XDG_CACHE_HOME/asl or ~/.cache/asl
+    Args:
+        None
+    Returns:
+        folder path
+    """
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, CACHE_FOLDER_NAME)
+
+
+def component_signature(component) -> str:
+    """ Get signature of component that compiles programs, the class name and
+        values of its constructor arguments that it keeps as attributes, like
+        InstructionsGenerator(counted_loops=False). A component that keeps its
+        configuration differently defines cache_signature() that returns it.
+    Args:
+        component: component object, or None
+    Returns:
+        signature text
+    """
+
+    cache_signature = getattr(component, "cache_signature", None)
+    if cache_signature:
+        return cache_signature()
+
+    component_class = type(component)
+    arguments = []
+
+    if component is not None:
+        parameters = inspect.signature(component_class.__init__).parameters
+        for name, parameter in parameters.items():
+            if name != "self" and parameter.kind not in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
+                arguments.append(f"{name}={getattr(component, name, None)!r}")
+
+    return f"{component_class.__module__}.{component_class.__qualname__}({', '.join(arguments)})"
+
+
+class BytecodeCache:
+    """ Bytecode Cache Class
+
+    Class Attributes:
+        cache_folder: folder that contains .aslc files
+        hits: number of programs loaded from cache
+        misses: number of programs that were not found in cache
+    """
+
+    def __init__(self, cache_folder: str = None) -> None:
+        """ Bytecode Cache Class Constructor
+        Args:
+            cache_folder: Optional, folder to store .aslc files in, it is created
+                          when the first program is stored, default_cache_folder()
+                          if None
+        Returns:
+            None
+        """
+
+        self.cache_folder = cache_folder or default_cache_folder()
+        self.hits = 0
+        self.misses = 0
+
+    def cache_key(self, code, components: list) -> str:
+        """ Calculates cache key of code
+        Args:
+            code: code text, or iterable of code text chunks, like chunks of
+                  read_source_chunks(), key is the same for the same text
+            components: objects that compile code, like lexer and parser, their
+                        signatures are part of the key
+        Returns:
+            hex digest key
+        """
+
+        digest = hashlib.sha256()
+        digest.update(INTERPRETER_VERSION.encode())
+        for component in components:
+            digest.update(f"|{component_signature(component)}".encode())
+        digest.update(b"|")
+
+        if isinstance(code, str):
+            code = [code]
+        for chunk in code:
+            digest.update(chunk.encode())
+
+        return digest.hexdigest()
+
+    def cache_path(self, key: str) -> str:
+        """ Get .aslc file path of key
+        Args:
+            key: cache key
+        Returns:
+            file path
+        """
+
+        return os.path.join(self.cache_folder, key + CACHE_EXTENSION)
+
+    def header(self, key: str) -> bytes:
+        """ Builds cache file header line
+        Args:
+            key: cache key
+        Returns:
+            header bytes
+        """
+
+        return f"{CACHE_MAGIC} {CACHE_FORMAT_VERSION} {INTERPRETER_VERSION} {key}\n".encode()
+
+    def load(self, key: str):
+        """ Loads compiled program from cache
+        Args:
+            key: cache key
+        Returns:
+            (instructions, execution tree), or None if program is not cached
+            or cache file is not valid
+        """
+
+        try:
+            with open(self.cache_path(key), "rb") as file:
+                header = file.readline()
+                if header != self.header(key):
+                    self.misses += 1
+                    return None
+                program = pickle.load(file)
+        except Exception:
+            # missing, corrupted or incompatible cache file
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return program
+
+    def store(self, key: str, instructions: list, execution_tree) -> None:
+        """ Stores compiled program in cache, it must be stored before it is
+            executed, since executing it modifies symbols tables values
+        Args:
+            key: cache key
+            instructions: instructions list
+            execution_tree: execution tree of the instructions
+        Returns:
+            None
+        """
+
+        temporary_path = None
+
+        try:
+            os.makedirs(self.cache_folder, exist_ok=True)
+
+            # write to temporary file first so that a cache file is never
+            # read while it is partially written
+            descriptor, temporary_path = tempfile.mkstemp(
+                dir=self.cache_folder, suffix=CACHE_EXTENSION + ".tmp")
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(self.header(key))
+                pickle.dump((instructions, execution_tree), file,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, self.cache_path(key))
+        except Exception:
+            # caching is an optimization, failing to store doesn't stop the program
+            if temporary_path and os.path.exists(temporary_path):
+                os.remove(temporary_path)
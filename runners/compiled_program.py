@@ -0,0 +1,96 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Compiled Program:
+    Program compiled once by AslRunner.compile() that can be executed many
+    times by AslRunner.execute(). Executing a program modifies values and
+    types in symbols tables of its execution tree, they are copied when the
+    program is compiled and restored before each run, so each run starts with
+    fresh variables, without lexing, parsing and compiling the code again.
+
+Usage:
+    runner = AslRunner()
+    program = runner.compile(code)
+    for _ in range(runs):
+        runner.execute(program)
+
+"""
+
+
+class CompiledProgram:
+    """ Compiled Program Class
+
+    Class Attributes:
+        instructions: instructions list, None if program is transpiled
+        execution_tree: execution tree of the program
+        function: python function of transpiled program, set the first time
+                  the program is executed, None if it is not transpiled
+        snapshots: list of symbols table and copy of its values and types
+        runs: number of times the program was executed
+    """
+
+    def __init__(self, instructions, execution_tree) -> None:
+        """ Compiled Program Class Constructor, symbols tables are copied, the
+            program must not be executed before
+        Args:
+            instructions: instructions list, None if program is transpiled
+            execution_tree: execution tree of the program
+        Returns:
+            None
+        """
+
+        self.instructions = instructions
+        self.execution_tree = execution_tree
+        self.function = None
+        self.snapshots = [(symbols_table, symbols_table.snapshot())
+                          for symbols_table in self.symbols_tables()]
+        self.runs = 0
+
+    def symbols_tables(self) -> list:
+        """ Find symbols tables of execution tree and of its statements, statements
+            are visited with a stack to support deeply nested programs
+        Args:
+            None
+        Returns:
+            list of symbols tables, each table is listed once
+        """
+
+        if not self.execution_tree:
+            return []
+
+        symbols_tables = {}
+        statements = [self.execution_tree]
+
+        while statements:
+            statement = statements.pop()
+
+            symbols_table = getattr(statement, "symbols_table", None)
+            if symbols_table is not None:
+                symbols_tables[id(symbols_table)] = symbols_table
+
+            # execution tree statements, or children statements of blocks
+            children = getattr(statement, "tree", None) or getattr(statement, "statements", None)
+            if children:
+                statements.extend(children)
+
+            # branches of condition statement
+            if getattr(statement, "if_statement", None):
+                statements.append(statement.if_statement)
+            if getattr(statement, "elseif_statements", None):
+                statements.extend(statement.elseif_statements)
+            if getattr(statement, "else_statement", None):
+                statements.append(statement.else_statement)
+
+        return list(symbols_tables.values())
+
+    def reset(self):
+        """ Restore symbols tables values and types of compiled program
+        Args:
+            None
+        Returns:
+            None
+        """
+
+        for symbols_table, snapshot in self.snapshots:
+            symbols_table.restore(snapshot)
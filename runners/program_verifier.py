@@ -0,0 +1,78 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Program Verifier:
+    Runs sample programs with the default AslRunner and with other runner
+    options, like another executor, transpiling or execution tree optimizers,
+    and verifies that programs produce identical output, errors are part of
+    the output.
+
+Usage:
+    differences = verify_programs(executor=ClosureExecutor())
+    differences = verify_programs(tree_optimizers=[ConstantFolder()])
+
+"""
+
+import contextlib
+import glob
+import io
+import sys
+
+from runners.asl_runner import AslRunner
+
+DEFAULT_INPUT = "5\nplus\n3\n1\n8\n2\n4\n2\n"
+
+
+def run_program(code: str, program_input: str, optimizer=None, **runner_options) -> str:
+    """ Runs code and returns its output
+    Args:
+        code: asl code
+        program_input: text used as keyboard input
+        optimizer: Optional, optimizer to be used by the runner
+        runner_options: Optional, other AslRunner arguments
+    Returns:
+        program output followed by error, if the program fails
+    """
+
+    output = io.StringIO()
+    old_stdin = sys.stdin
+    sys.stdin = io.StringIO(program_input)
+
+    try:
+        with contextlib.redirect_stdout(output):
+            AslRunner(optimizer=optimizer, **runner_options).run(code)
+    except Exception as e:
+        output.write(f"{type(e).__name__}: {e}\n")
+    finally:
+        sys.stdin = old_stdin
+
+    return output.getvalue()
+
+
+def verify_programs(folder="asl_files", program_input=DEFAULT_INPUT, **runner_options) -> dict:
+    """ Verifies that output of programs run with runner options is identical
+        to output of programs run by the default runner
+    Args:
+        folder: folder that contains .asl files
+        program_input: text used as keyboard input
+        runner_options: AslRunner arguments, like optimizer, executor,
+                        transpile or tree_optimizers
+    Returns:
+        dictionary of file name to (expected output, output with runner options)
+        of programs that produce different output, empty if all are identical
+    """
+
+    differences = {}
+
+    for filename in sorted(glob.glob(f"{folder}/*.asl")):
+        with open(filename) as file:
+            code = file.read()
+
+        expected_output = run_program(code, program_input)
+        output = run_program(code, program_input, **runner_options)
+
+        if expected_output != output:
+            differences[filename] = (expected_output, output)
+
+    return differences
@@ -0,0 +1,29 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Source Reader:
+    Reads source code files in chunks, so lexer tokenizes large files without
+    reading the whole text into memory.
+
+"""
+
+# Number of characters read at once
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def read_source_chunks(filename: str, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """ Reads source file in chunks
+    Args:
+        filename: source file name
+        chunk_size: number of characters of each chunk
+    Returns:
+        generator of text chunks
+    """
+
+    with open(filename) as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
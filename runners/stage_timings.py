@@ -0,0 +1,148 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Stage Timings:
+    Measures stages of running a program, like lexing, parsing, compiling,
+    generating instructions and executing them. Wall time, CPU time, peak
+    memory traced by tracemalloc and size of stage result, like number of
+    tokens, statements or instructions, are recorded for each stage.
+
+    Memory is traced from the start of each stage, peak of a stage is the
+    peak of memory allocated while it runs, results of earlier stages are not
+    counted. Tracing memory allocations slows stages down several times, wall
+    and CPU times are measured without tracing when trace_memory is False.
+
+Usage:
+    timings = StageTimings()
+    AslRunner(timings=timings).run(code)
+    print(timings.report())
+
+"""
+
+import json
+import time
+import tracemalloc
+
+MEGABYTE = 1024 * 1024
+
+
+class StageTimings:
+    """ Stage Timings Class
+
+    Class Attributes:
+        stages: list of stage dictionaries with name, wall, cpu, peak, size
+                and size_name, in the order stages were measured
+        trace_memory: True if peak memory of stages is traced
+    """
+
+    def __init__(self, trace_memory: bool = True) -> None:
+        """ Stage Timings Class Constructor
+        Args:
+            trace_memory: Optional, if False, peak memory of stages is not traced
+        Returns:
+            None
+        """
+
+        self.stages = []
+        self.trace_memory = trace_memory
+
+    def measure(self, name: str, function, size=None, size_name: str = None):
+        """ Calls function and records its stage
+        Args:
+            name: stage name, like lex or execute
+            function: function without arguments that runs the stage
+            size: Optional, function that gets size of stage result, like len
+            size_name: Optional, name of size unit, like tokens
+        Returns:
+            function result
+        """
+
+        tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        elif self.trace_memory:
+            tracemalloc.reset_peak()
+
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+
+        try:
+            result = function()
+        finally:
+            wall = time.perf_counter() - start_wall
+            cpu = time.process_time() - start_cpu
+
+            peak = None
+            if self.trace_memory:
+                _, peak = tracemalloc.get_traced_memory()
+            if tracing:
+                tracemalloc.stop()
+
+            self.stages.append({
+                'name': name,
+                'wall': wall,
+                'cpu': cpu,
+                'peak': peak,
+                'size': None,
+                'size_name': size_name,
+            })
+
+        if size:
+            self.stages[-1]['size'] = size(result)
+
+        return result
+
+    def total(self) -> dict:
+        """ Get total of all stages, peak is the highest peak of stages
+        Args:
+            None
+        Returns:
+            dictionary with wall, cpu and peak
+        """
+
+        peaks = [stage['peak'] for stage in self.stages if stage['peak'] is not None]
+        return {
+            'wall': sum(stage['wall'] for stage in self.stages),
+            'cpu': sum(stage['cpu'] for stage in self.stages),
+            'peak': max(peaks) if peaks else None,
+        }
+
+    def to_dict(self) -> dict:
+        """ Get stages and their total
+        Args:
+            None
+        Returns:
+            dictionary with stages list and total
+        """
+
+        return {'stages': self.stages, 'total': self.total()}
+
+    def to_json(self) -> str:
+        """ Get stages and their total as JSON text
+        Args:
+            None
+        Returns:
+            JSON text
+        """
+
+        return json.dumps(self.to_dict(), indent=2)
+
+    def report(self) -> str:
+        """ Build human readable report of stages, one row per stage
+        Args:
+            None
+        Returns:
+            report text
+        """
+
+        rows = [f"{'stage':<20} {'wall (ms)':>10} {'cpu (ms)':>10} {'peak (MB)':>10}  size"]
+
+        total = dict(self.total(), name='total', size=None, size_name=None)
+        for stage in self.stages + [total]:
+            peak = f"{stage['peak'] / MEGABYTE:.2f}" if stage['peak'] is not None else "-"
+            size = f"{stage['size']} {stage['size_name'] or ''}" if stage['size'] is not None else ""
+            rows.append(f"{stage['name']:<20} {stage['wall'] * 1000:>10.3f} "
+                        f"{stage['cpu'] * 1000:>10.3f} {peak:>10}  {size.strip()}")
+
+        return "\n".join(rows)
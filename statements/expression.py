@@ -0,0 +1,188 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Expressions Library
+
+Contains expression tree nodes, statements store the expression tree of their
+condition or value so it doesn't have to be tokenized again. Nodes remember the
+parenthesis around them, expression_parts() gives the expression in source code
+order for values that are concatenated rather than calculated
+
+    (i + 1) * 2 < n
+
+    Operation(<)
+      |-- Operation(*)
+      |     |-- Operation(+)
+      |     |     |-- VariableReference(i)
+      |     |     |-- Constant(1)
+      |     |-- Constant(2)
+      |-- VariableReference(n)
+
+"""
+
+from enum import Enum
+
+from lexer.lexer import TokenType
+
+
+class ExpressionType(Enum):
+    """ Expression Type Enum """
+
+    CONSTANT = 1
+    VARIABLE = 2
+    OPERATION = 3
+
+
+class Expression(object):
+    """ Expression Class
+
+    Class Attributes:
+        type: expression type of enum ExpressionType
+        parentheses: number of parenthesis pairs around the expression in source code
+        source: expression replaced by this node when it was folded by ConstantFolder,
+                None if it is not folded
+    """
+
+    def __init__(self, type: ExpressionType) -> None:
+        """ Expression Class Constructor
+        Args:
+            type: expression type of enum ExpressionType
+        Returns:
+            None
+        """
+
+        self.type = type
+        self.parentheses = 0
+        self.source = None
+
+
+class Constant(Expression):
+    """ Constant Expression Class """
+
+    def __init__(self, token_type, value: str) -> None:
+        """ Constant Expression Class Constructor
+        Args:
+            token_type: token type of the constant, NUMBER, REAL or STRING, or
+                        TRUE and FALSE for conditions folded by ConstantFolder
+            value: constant text, like 10, 4.5 or "text"
+        Returns:
+            None
+        """
+
+        super().__init__(ExpressionType.CONSTANT)
+        self.token_type = token_type
+        self.value = value
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+    def __repr__(self) -> str:
+        return f"Constant: {self.value}"
+
+
+class VariableReference(Expression):
+    """ Variable Reference Expression Class """
+
+    def __init__(self, name: str) -> None:
+        """ Variable Reference Expression Class Constructor
+        Args:
+            name: variable name
+        Returns:
+            None
+        """
+
+        super().__init__(ExpressionType.VARIABLE)
+        self.name = name
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __repr__(self) -> str:
+        return f"Variable Reference: {self.name}"
+
+
+class Operation(Expression):
+    """ Operation Expression Class """
+
+    def __init__(self, operator: str, left: Expression, right: Expression) -> None:
+        """ Operation Expression Class Constructor
+        Args:
+            operator: operator, like + or <
+            left: left operand expression
+            right: right operand expression
+        Returns:
+            None
+        """
+
+        super().__init__(ExpressionType.OPERATION)
+        self.operator = operator
+        self.left = left
+        self.right = right
+
+    def __str__(self) -> str:
+        return f"({self.left} {self.operator} {self.right})"
+
+    def __repr__(self) -> str:
+        return f"Operation: {self}"
+
+
+def expression_parts(expression_tree) -> list:
+    """ Get parts of expression in source code order, folded nodes are replaced
+        by the expressions they were folded from, so parts are the same as the
+        tokens of the source code
+            (i + 1) * "a"   -->   ["(", i, "+", "1", ")", "*", "\"a\""]
+    Args:
+        expression_tree: expression tree
+    Returns:
+        list of text parts and VariableReference nodes of variables
+    """
+
+    parts = []
+    # stack of expression nodes and closing text pushed after them
+    stack = [expression_tree]
+
+    while stack:
+        expression = stack.pop()
+
+        if expression.__class__ is str:
+            parts.append(expression)
+            continue
+
+        while expression.source is not None:
+            expression = expression.source
+
+        if expression.parentheses:
+            parts.append("(" * expression.parentheses)
+            stack.append(")" * expression.parentheses)
+
+        if expression.type == ExpressionType.OPERATION:
+            stack.extend((expression.right, expression.operator, expression.left))
+        elif expression.type == ExpressionType.VARIABLE:
+            parts.append(expression)
+        else:
+            parts.append(str(expression.value))
+
+    return parts
+
+
+def constant_condition(expression_tree):
+    """ Get value of condition expression tree if it is constant
+    Args:
+        expression_tree: expression tree of condition, can be None
+    Returns:
+        True or False if condition is always true or false, None otherwise
+    """
+
+    if expression_tree is None or expression_tree.type != ExpressionType.CONSTANT:
+        return None
+
+    if expression_tree.token_type == TokenType.FALSE:
+        return False
+
+    if expression_tree.token_type == TokenType.STRING:
+        # evaluated without quotes, it can be empty
+        return None
+
+    # folded true condition, or one number token which is never empty text
+    return True
@@ -45,6 +45,17 @@ class Statement(object):
         self.type = type
         self.parent = None
 
+        # Variables referenced by this statement resolved to their symbol slots,
+        # variable name ---> SymbolSlot
+        self.symbol_slots = {}
+
+        # Parsed expression of statement condition or variable value, None if
+        # the statement doesn't have one or it is not a valid expression
+        self.expression_tree = None
+
+        # Source line of the first token of statement, None if unknown
+        self.line_number = None
+
 
 class VariableType(Enum):
     NUMERIC = 0
@@ -166,6 +177,10 @@ class For(Statement):
         self.condition = None
         self.symbols_table = SymbolTable()
 
+        # CountedLoop found by the compiler if loop counts a variable up to a bound,
+        # None otherwise
+        self.counted_loop = None
+
     def __str__(self) -> str:
         return f"For Loop: {self.loop_initial_variable}; {self.loop_condition}; {self.loop_increment}"
 
@@ -173,6 +188,44 @@ class For(Statement):
         return self.__str__()
 
 
+class CountedLoop(object):
+    """ Counted Loop Class
+
+    For loop that changes its variable by a constant step and compares it to
+    a bound that the loop statements don't change:
+
+        for (i = 0; i < n; i += 1)
+
+    Class Attributes:
+        variable: loop variable name
+        operator: comparison operator of loop condition, <, <=, > or >=
+        bound: Constant or VariableReference expression compared to loop variable
+        step: number added to loop variable by loop increment, negative if it's subtracted
+    """
+
+    def __init__(self, variable: str, operator: str, bound, step: float) -> None:
+        """ Counted Loop Class Constructor
+        Args:
+            variable: loop variable name
+            operator: comparison operator of loop condition
+            bound: bound expression of loop condition
+            step: loop increment step
+        Returns:
+            None
+        """
+
+        self.variable = variable
+        self.operator = operator
+        self.bound = bound
+        self.step = step
+
+    def __repr__(self) -> str:
+        return f"Counted Loop: {self.variable} {self.operator} {self.bound} step {self.step}"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+
 class Fi(Statement):
     """ Fi Statement Class (EndIf)"""
 
@@ -280,7 +333,16 @@ class Else(Statement):
 
 
 class Echo(Statement):
-    """ Echo Statement Class """
+    """ Echo Statement Class
+
+    Class Attributes:
+        echo_string: echo string
+        echo_parts: literal parts of echo string, set by the parser, None if
+                    echo string is not parsed
+        echo_variables: list of (part index, variable name) pairs of variables
+                        in echo string, set by the parser, None if echo string
+                        is not parsed
+    """
 
     def __init__(self, echo_string: str) -> None:
         """ Echo Statement Class Constructor
@@ -292,6 +354,8 @@ class Echo(Statement):
 
         super().__init__(StatementType.ECHO)
         self.echo_string = echo_string
+        self.echo_parts = None
+        self.echo_variables = None
 
     def __str__(self) -> str:
         return f"Echo Statement: {self.echo_string}"
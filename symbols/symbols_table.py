@@ -20,10 +20,80 @@ class SymbolsType(Enum):
     ANY = 4
 
 
+class ValueType(Enum):
+    """ Runtime value types enum, type tag of a value stored in symbols table """
+
+    NONE = 1
+    INTEGER = 2
+    REAL = 3
+    STRING = 4
+    BOOLEAN = 5
+    ARRAY = 6
+
+
+VALUE_TYPES = {
+    int: ValueType.INTEGER,
+    float: ValueType.REAL,
+    str: ValueType.STRING,
+    bool: ValueType.BOOLEAN,
+    list: ValueType.ARRAY,
+}
+
+
+def value_type(value) -> ValueType:
+    """ Get type tag of a value
+    Args:
+        value: native value
+    Returns:
+        ValueType of value
+    """
+
+    return VALUE_TYPES.get(value.__class__, ValueType.NONE)
+
+
+def native_value(text):
+    """ Convert number text to int or float, values are stored natively so that
+        arithmetic doesn't parse them again. The text is kept as is if the number
+        would be printed differently than the text, like 4.50 or 007
+    Args:
+        text: value text
+    Returns:
+        int, float or the same text
+    """
+
+    if text.__class__ is not str:
+        return text
+
+    try:
+        value = int(text)
+    except ValueError:
+        try:
+            value = float(text)
+        except ValueError:
+            return text
+
+    if str(value) != text:
+        return text
+    return value
+
+
 class SymbolTableEntry:
-    """ Symbol Table Entry Class"""
+    """ Symbol Table Entry Class
+
+    Class Attributes:
+        name: name of entry
+        symbols_table: symbols table that stores entry value and type, None for an
+                       entry that is not added to a symbols table
+        index: index of entry value and type in symbols table arrays
+        value_type: type tag of the current value, values are stored natively as
+                    int, float, bool, str or list, the tag is stored when the
+                    value is written
+    """
+
+    __slots__ = ('name', 'symbols_table', 'index', '_value', '_type', '_value_type')
 
-    def __init__(self, name: str, value: str, type=None) -> None:
+    def __init__(self, name: str, value: str, type=None,
+                 symbols_table=None, index=None) -> None:
         """ Symbol Table Entry Class Constructor
         Desc:
             Initialize Symbol Table Entry (Constructor)
@@ -31,11 +101,18 @@ class SymbolTableEntry:
             name: name of entry
             value: value of entry
             type: type of entry
+            symbols_table: Optional, symbols table that stores entry value and type
+            index: Optional, index of entry in symbols table arrays
         Returns:
             None
         """
 
         self.name = name
+        self.symbols_table = symbols_table
+        self.index = index
+        self._value = None
+        self._type = None
+        self._value_type = ValueType.NONE
         self.value = value
 
         if not type:
@@ -43,25 +120,187 @@ class SymbolTableEntry:
         else:
             self.type = type
 
+    @property
+    def value(self):
+        """ Entry value, stored in symbols table values array """
+        if self.symbols_table is None:
+            return self._value
+        return self.symbols_table.values[self.index]
+
+    @value.setter
+    def value(self, value):
+        if self.symbols_table is None:
+            self._value = value
+            self._value_type = value_type(value)
+        else:
+            self.symbols_table.values[self.index] = value
+            self.symbols_table.value_types[self.index] = value_type(value)
+
+    @property
+    def value_type(self):
+        """ Type tag of entry value, stored in symbols table value types array """
+        if self.symbols_table is None:
+            return self._value_type
+        return self.symbols_table.value_types[self.index]
+
+    @property
+    def type(self):
+        """ Entry type, stored in symbols table types array """
+        if self.symbols_table is None:
+            return self._type
+        return self.symbols_table.types[self.index]
+
+    @type.setter
+    def type(self, type):
+        if self.symbols_table is None:
+            self._type = type
+        else:
+            self.symbols_table.types[self.index] = type
+
+
+class SymbolSlot:
+    """ Symbol Slot Class
+
+    Location of a variable resolved at compile time, the symbols table (scope)
+    that contains the variable and the index of its value in the table values
+    array, reading and writing the variable is then an indexed access, the
+    type tag of a written value is stored at the same index:
+
+        slot.values[slot.index] = value
+        slot.value_types[slot.index] = value_type(value)
+
+    Class Attributes:
+        name: variable name
+        symbols_table: symbols table that contains the variable
+        entry: symbols table entry of the variable
+        values: values array of the symbols table
+        value_types: value types array of the symbols table
+        index: index of the variable value in values array
+    """
+
+    __slots__ = ('name', 'symbols_table', 'entry', 'values', 'value_types', 'index')
+
+    def __init__(self, symbols_table, entry: SymbolTableEntry) -> None:
+        """ Symbol Slot Class Constructor
+        Args:
+            symbols_table: symbols table that contains the variable
+            entry: symbols table entry of the variable
+        Returns:
+            None
+        """
+
+        self.name = entry.name
+        self.symbols_table = symbols_table
+        self.entry = entry
+        self.values = symbols_table.values
+        self.value_types = symbols_table.value_types
+        self.index = entry.index
+
+    def __repr__(self) -> str:
+        return f"slot {self.name} ---> {self.index}"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
 
 class SymbolTable:
-    """ Symbol Table Class """
+    """ Symbol Table Class
+
+    Values and types of symbols are stored in flat arrays, indexes maps symbol
+    name to its index in the arrays.
+
+    By default an entry object is kept for each symbol in symbol_table dictionary.
+    In array backed mode entry objects are not kept, get_entry_value() returns a
+    new entry that reads and writes the arrays, this saves memory for scopes that
+    contain thousands of variables.
 
-    def __init__(self) -> None:
-        """ Initializes Symbol table to empty dictionary """
+    Class Attributes:
+        array_backed: True if entry objects are not kept
+        indexes: dictionary of symbol name to index in values and types arrays
+        values: flat array of symbols values. It is modified in place only,
+                slots keep a reference to it.
+        value_types: flat array of type tags of symbols values, a tag is stored
+                     when a value is written. It is modified in place only.
+        types: flat array of symbols types
+        symbol_table: dictionary of symbol name to symbol table entry, empty in
+                      array backed mode
+    """
+
+    def __init__(self, array_backed=False) -> None:
+        """ Initializes Symbol table to empty dictionary
+        Args:
+            array_backed: Optional, if True, entry objects are not kept
+        Returns:
+            None
+        """
+        self.array_backed = array_backed
+        self.indexes = {}
+        self.values = []
+        self.value_types = []
+        self.types = []
         self.symbol_table = {}
 
     def add_entry(self, name: str, value: str, type=None):
         """
         Desc:
-            Adds entry to symbols table
+            Adds entry to symbols table, if entry already exists, its value and
+            type are replaced and it keeps the same index.
         Args:
             name: name of symbol
             value: value of symbol
+            type: type of symbol
         Returns:
             None
         """
-        self.symbol_table[name] = SymbolTableEntry(name, value, type)
+
+        if not type:
+            type = SymbolsType.ANY
+
+        index = self.indexes.get(name)
+
+        if index is not None:
+            self.values[index] = value
+            self.value_types[index] = value_type(value)
+            self.types[index] = type
+            return
+
+        index = len(self.values)
+        self.indexes[name] = index
+        self.values.append(value)
+        self.value_types.append(value_type(value))
+        self.types.append(type)
+
+        if not self.array_backed:
+            self.symbol_table[name] = SymbolTableEntry(name, value, type, self, index)
+
+    def snapshot(self):
+        """
+        Desc:
+            Copy symbols values and types, so they can be restored after a
+            program modifies them
+        Args:
+            None
+        Returns:
+            tuple of values list, value types list and types list
+        """
+
+        return list(self.values), list(self.value_types), list(self.types)
+
+    def restore(self, snapshot):
+        """
+        Desc:
+            Restore symbols values and types copied by snapshot(), arrays are
+            modified in place, slots keep a reference to them
+        Args:
+            snapshot: tuple of values list, value types list and types list
+        Returns:
+            None
+        """
+
+        values, value_types, types = snapshot
+        self.values[:] = values
+        self.value_types[:] = value_types
+        self.types[:] = types
 
     def get_entry_value(self, name: str):
         """
@@ -72,7 +311,29 @@ class SymbolTable:
         Returns:
             Symbol value in table
         """
-        return self.symbol_table.get(name)
+
+        if not self.array_backed:
+            return self.symbol_table.get(name)
+
+        index = self.indexes.get(name)
+        if index is None:
+            return None
+        return SymbolTableEntry(name, self.values[index], self.types[index], self, index)
+
+    def get_slot(self, name: str):
+        """
+        Desc:
+            Get slot of symbol by name
+        Args:
+            name: name of symbol
+        Returns:
+            SymbolSlot, or None if symbol does not exist
+        """
+
+        entry = self.get_entry_value(name)
+        if not entry:
+            return None
+        return SymbolSlot(self, entry)
 
     def modify_entry(self, name, value):
         """
@@ -87,9 +348,8 @@ class SymbolTable:
             None
         """
 
-        # Check each entry in the table if it contains name
-        for entry in self.symbol_table:
-            if entry == name:
-                self.symbol_table[name].value = value
-                return
-        raise Exception(f"Unknown Variable name {name}")
+        index = self.indexes.get(name)
+        if index is None:
+            raise Exception(f"Unknown Variable name {name}")
+        self.values[index] = value
+        self.value_types[index] = value_type(value)
@@ -0,0 +1,80 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Closure Executor Unit Test
+
+"""
+
+import unittest
+
+from executors.closure_executor import ClosureExecutor
+from runners.program_verifier import run_program, verify_programs
+
+
+class ClosureExecutorUnitTest(unittest.TestCase):
+
+    def setUp(self):
+        super(ClosureExecutorUnitTest, self).setUp()
+
+    def test_closure_executor_loops(self):
+        code = """
+sum = 0
+for (i = 0; i < 6; i += 1)
+    if (i == 2)
+        continue
+    elif (i == 4)
+        break
+    endif
+    sum += i
+    echo "{i} {sum}"
+endfor
+x = 3
+while (x > 0)
+    x -= 1
+    echo "x = {x}"
+endwhile
+"""
+        expected_output = "0 0.0\n1.0 1.0\n3.0 4.0\nx = 2.0\nx = 1.0\nx = 0.0\n"
+
+        self.assertEqual(run_program(code, ""), expected_output)
+        self.assertEqual(run_program(code, "", executor=ClosureExecutor()), expected_output)
+
+    def test_closure_executor_values(self):
+        code = """
+name = "asl"
+greeting = "hello " + name
+count = 0
+input count
+count *= 2
+text = "007"
+if (count > 4)
+    echo "{greeting} {count} {text}"
+endif
+"""
+        expected_output = '"hello "+"asl" 8.0 "007"\n'
+
+        self.assertEqual(run_program(code, "4\n"), run_program(code, "4\n", executor=ClosureExecutor()))
+        self.assertEqual(run_program(code, "4\n", executor=ClosureExecutor()), expected_output)
+
+    def test_closure_executor_errors(self):
+        code = """
+x = 1
+echo "before"
+echo "{y}"
+"""
+        self.assertEqual(run_program(code, ""), run_program(code, "", executor=ClosureExecutor()))
+        self.assertEqual(run_program(code, "", executor=ClosureExecutor()),
+                         "before\nUnknownVariable: Variable Not Found y\n")
+
+    def test_closure_executor_asl_files(self):
+        """ Closure executor should produce identical output for asl files """
+
+        self.assertEqual(verify_programs(executor=ClosureExecutor()), {})
+
+    def tearDown(self):
+        super(ClosureExecutorUnitTest, self).tearDown()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -137,8 +137,153 @@ echo "after for loop"
         self.assertTrue(execution_tree.tree[3].echo_string == '"after for loop"')
 
     def test_compile_parents(self):
-        """test_compile_parents"""
-        pass
+        """ test parents and symbols tables are set while statements are compiled """
+
+        code = """
+x = 1
+if (x < 2)
+    y = 1
+    x = 2
+elif (x > 3)
+    y = 2
+else
+    z = 3
+endif
+for (i = 0; i < 2; i += 1)
+    while (x < 5)
+        x += 1
+        i = 0
+        w = 1
+    endwhile
+endfor
+        """
+        tokens = EnhancedLexer().tokenize_text(code)
+        execution_tree = Compiler().compile(EnhancedParser().parse(tokens))
+
+        condition_statement, for_loop = execution_tree.tree[1], execution_tree.tree[3]
+        if_statement = condition_statement.if_statement
+        elseif_statement = condition_statement.elseif_statements[0]
+        else_statement = condition_statement.else_statement
+        while_loop = for_loop.statements[0]
+
+        self.assertTrue(condition_statement.parent is execution_tree)
+        self.assertTrue(if_statement.parent is condition_statement)
+        self.assertTrue(elseif_statement.parent is condition_statement)
+        self.assertTrue(else_statement.parent is condition_statement)
+        self.assertTrue(if_statement.statements[0].parent is if_statement)
+        self.assertTrue(for_loop.parent is execution_tree)
+        self.assertTrue(while_loop.parent is for_loop)
+        self.assertTrue(while_loop.statements[0].parent is while_loop)
+        self.assertTrue(for_loop.statements[-1].parent is for_loop)
+
+        # variables are stored in the first scope that contains them,
+        # branches don't see variables of other branches
+        self.assertEqual(list(execution_tree.symbols_table.indexes), ["x", "i"])
+        self.assertEqual(list(if_statement.symbols_table.indexes), ["y"])
+        self.assertEqual(list(elseif_statement.symbols_table.indexes), ["y"])
+        self.assertEqual(list(else_statement.symbols_table.indexes), ["z"])
+        self.assertEqual(list(for_loop.symbols_table.indexes), [])
+        self.assertEqual(list(while_loop.symbols_table.indexes), ["w"])
+
+        # loop variable is assigned in loop body
+        self.assertIsNone(for_loop.counted_loop)
+
+    def test_compile_symbol_slots(self):
+        """ test variables references are resolved to symbol slots """
+
+        code = """
+x = 10
+while (x < 20)
+    y = x + 1
+    x = y
+    echo "{x} {y}"
+endwhile
+        """
+        tokens = EnhancedLexer().tokenize_text(code)
+        statements = EnhancedParser().parse(tokens)
+        execution_tree = Compiler().compile(statements)
+
+        while_statement = execution_tree.tree[1]
+        y_assignment, x_assignment, echo = while_statement.statements
+
+        self.assertTrue(while_statement.symbol_slots["x"].symbols_table is execution_tree.symbols_table)
+        self.assertTrue(y_assignment.symbol_slots["y"].symbols_table is while_statement.symbols_table)
+        self.assertTrue(y_assignment.symbol_slots["x"].symbols_table is execution_tree.symbols_table)
+        self.assertTrue(x_assignment.symbol_slots["x"].symbols_table is execution_tree.symbols_table)
+        self.assertEqual(echo.symbol_slots["x"].index, 0)
+        self.assertEqual(echo.symbol_slots["y"].index, 0)
+        self.assertTrue(echo.symbol_slots["y"].values is while_statement.symbols_table.values)
+
+    def test_compile_symbol_slots_scopes(self):
+        """ test variables are resolved to slots of innermost open scopes while
+            statements are added, echo variables are taken from the parser """
+
+        code = """
+while (w < 3)
+    w = 1
+    if (w > 0)
+        z = w
+    fi
+    echo "{z} and {w}"
+endwhile
+z = 5
+echo "{z}"
+        """
+        tokens = EnhancedLexer().tokenize_text(code)
+        execution_tree = Compiler().compile(EnhancedParser().parse(tokens))
+
+        while_statement, z_assignment, echo = execution_tree.tree
+        _, condition, loop_echo = while_statement.statements
+        z_branch_assignment = condition.if_statement.statements[0]
+
+        self.assertEqual(loop_echo.echo_parts, ["", " and ", ""])
+        self.assertEqual(loop_echo.echo_variables, [(0, "z"), (2, "w")])
+
+        # loop condition variable is assigned only inside the loop
+        self.assertTrue(while_statement.symbol_slots["w"].symbols_table is while_statement.symbols_table)
+        self.assertTrue(condition.if_statement.symbol_slots["w"].symbols_table is while_statement.symbols_table)
+        self.assertTrue(z_branch_assignment.symbol_slots["z"].symbols_table is condition.if_statement.symbols_table)
+
+        # branch variables are not visible after the branch is closed
+        self.assertNotIn("z", loop_echo.symbol_slots)
+        self.assertTrue(loop_echo.symbol_slots["w"].symbols_table is while_statement.symbols_table)
+        self.assertTrue(z_assignment.symbol_slots["z"].symbols_table is execution_tree.symbols_table)
+        self.assertTrue(echo.symbol_slots["z"].symbols_table is execution_tree.symbols_table)
+
+    def test_compile_counted_loops(self):
+        """ for loops that count a variable up to a bound should be found """
+
+        code = """
+n = 10
+for (i = 0; i < n; i += 1)
+    echo "{i}"
+endfor
+for (j = 10; j >= 0; j = j - 2)
+    echo "{j}"
+endfor
+for (k = 0; k < n; k += 1)
+    n = n - 1
+endfor
+for (m = 0; m < 10; m = m * 2)
+    echo "{m}"
+endfor
+for (p = 0; p < 10; p += 1)
+    input p
+endfor
+        """
+        tokens = EnhancedLexer().tokenize_text(code)
+        execution_tree = Compiler().compile(EnhancedParser().parse(tokens))
+        loops = [statement for statement in execution_tree.tree if isinstance(statement, For)]
+
+        self.assertEqual((loops[0].counted_loop.variable, loops[0].counted_loop.operator,
+                          loops[0].counted_loop.bound.name, loops[0].counted_loop.step),
+                         ("i", "<", "n", 1.0))
+        self.assertEqual((loops[1].counted_loop.operator, loops[1].counted_loop.bound.value,
+                          loops[1].counted_loop.step),
+                         (">=", "0", -2.0))
+
+        # bound changes, step is not a number and loop variable changes
+        self.assertEqual([loop.counted_loop for loop in loops[2:]], [None, None, None])
 
     def tearDown(self):
         """ Tear Down Phase"""
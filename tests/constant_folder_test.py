@@ -0,0 +1,111 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Constant Folder Unit Test
+
+"""
+
+import unittest
+
+from compiler.compiler import Compiler
+from instruction_generators.instructions_generator import InstructionsGenerator
+from instructions.instruction import InstructionType
+from lexer.enhanced_lexer import EnhancedLexer
+from lexer.lexer import TokenType
+from optimizers.constant_folder import ConstantFolder
+from parser.enhanced_parser import EnhancedParser
+from runners.program_verifier import run_program, verify_programs
+
+
+class ConstantFolderUnitTest(unittest.TestCase):
+
+    def setUp(self):
+        super(ConstantFolderUnitTest, self).setUp()
+
+    def fold(self, code):
+        folder = ConstantFolder()
+        tokens = EnhancedLexer().tokenize_text(code)
+        execution_tree = folder.optimize(Compiler().compile(EnhancedParser().parse(tokens)))
+        return folder, execution_tree
+
+    def test_fold_constants(self):
+        code = """
+x = 10 * 3 + 2
+y = x * 2 * 1
+z = 0 + x * 2
+v = x * 2 - 0
+w = x * 1
+d = 1 / 0
+"""
+        folder, execution_tree = self.fold(code)
+        values = [str(statement.expression_tree) for statement in execution_tree.tree]
+
+        # identities are only removed from numeric operations, not from variables,
+        # adding 0 is not removed, it changes -0.0 to 0.0
+        self.assertEqual(values, ["32.0", "(x * 2)", "(0 + (x * 2))", "(x * 2)", "(x * 1)", "(1 / 0)"])
+        self.assertEqual(folder.stats, {"expressions": 6,
+                                        "folded_constants": 2,
+                                        "simplified_identities": 2,
+                                        "constant_conditions": 0})
+
+    def test_fold_negative_zero(self):
+        """ adding 0 to negative zero is not simplified """
+
+        code = """
+a = 0
+b = 0 - 1
+x = 0 + a * b
+y = a * b + 0
+echo "{x} {y}"
+"""
+        output = "0.0 0.0\n"
+        self.assertEqual(run_program(code, ""), output)
+        self.assertEqual(run_program(code, "", tree_optimizers=[ConstantFolder()]), output)
+        self.assertEqual(run_program(code, "", tree_optimizers=[ConstantFolder()], transpile=True),
+                         output)
+
+    def test_fold_conditions(self):
+        code = """
+i = 0
+if (2 > 3)
+    echo "never"
+elif (1 < 2)
+    echo "always"
+endif
+while (i < 2 * 3)
+    i += 1
+endwhile
+"""
+        folder, execution_tree = self.fold(code)
+        condition_statement = execution_tree.tree[1]
+
+        self.assertEqual(condition_statement.if_statement.expression_tree.token_type, TokenType.FALSE)
+        self.assertEqual(condition_statement.elseif_statements[0].expression_tree.token_type,
+                         TokenType.TRUE)
+        self.assertEqual(str(execution_tree.tree[2].expression_tree), "(i < 6.0)")
+        self.assertEqual(folder.stats["constant_conditions"], 2)
+
+        # constant conditions are not evaluated, false condition jumps by goto
+        instructions = InstructionsGenerator().generate_instructions(execution_tree)
+        jumps = [instruction.type for instruction in instructions
+                 if instruction.type in (InstructionType.GOTO, InstructionType.JUMP_IF_NOT)]
+        self.assertEqual(jumps, [InstructionType.GOTO, InstructionType.GOTO,
+                                 InstructionType.GOTO, InstructionType.JUMP_IF_NOT,
+                                 InstructionType.GOTO])
+
+        output = "always\n"
+        self.assertEqual(run_program(code, ""), output)
+        self.assertEqual(run_program(code, "", tree_optimizers=[ConstantFolder()]), output)
+
+    def test_constant_folder_asl_files(self):
+        """ Folded asl files should produce identical output """
+
+        self.assertEqual(verify_programs(tree_optimizers=[ConstantFolder()]), {})
+
+    def tearDown(self):
+        super(ConstantFolderUnitTest, self).tearDown()
+
+
+if __name__ == '__main__':
+    unittest.main()
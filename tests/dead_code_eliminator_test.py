@@ -0,0 +1,125 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Dead Code Eliminator Unit Test
+
+"""
+
+import unittest
+
+from compiler.compiler import Compiler
+from instruction_generators.instructions_generator import InstructionsGenerator
+from lexer.enhanced_lexer import EnhancedLexer
+from optimizers.constant_folder import ConstantFolder
+from optimizers.dead_code_eliminator import DeadCodeEliminator
+from parser.enhanced_parser import EnhancedParser
+from runners.program_verifier import run_program, verify_programs
+from statements.statement import ConditionStatement, Echo
+
+
+class DeadCodeEliminatorUnitTest(unittest.TestCase):
+
+    def setUp(self):
+        super(DeadCodeEliminatorUnitTest, self).setUp()
+
+    def compile(self, code):
+        tokens = EnhancedLexer().tokenize_text(code)
+        return Compiler().compile(EnhancedParser().parse(tokens))
+
+    def eliminate(self, code):
+        eliminator = DeadCodeEliminator()
+        execution_tree = eliminator.optimize(ConstantFolder().optimize(self.compile(code)))
+        return eliminator, execution_tree
+
+    def test_eliminate_dead_branches(self):
+        code = """
+if (2 > 3)
+    echo "never"
+elif (1 < 2)
+    echo "always"
+else
+    echo "else"
+endif
+if (1 > 2)
+    echo "no"
+endif
+while (1 > 2)
+    echo "loop never"
+endwhile
+"""
+        eliminator, execution_tree = self.eliminate(code)
+
+        self.assertEqual(len(execution_tree.tree), 1)
+        condition_statement = execution_tree.tree[0]
+        self.assertIsInstance(condition_statement, ConditionStatement)
+        self.assertEqual(condition_statement.elseif_statements, [])
+        self.assertIsNone(condition_statement.else_statement)
+        self.assertEqual(condition_statement.if_statement.statements[0].echo_string, '"always"')
+        self.assertEqual(eliminator.stats["dead_branches"], 3)
+        self.assertEqual(eliminator.stats["dead_loops"], 1)
+
+        optimized = InstructionsGenerator().generate_instructions(execution_tree)
+        instructions = InstructionsGenerator().generate_instructions(self.compile(code))
+        self.assertLess(len(optimized), len(instructions))
+
+    def test_eliminate_unreachable_statements(self):
+        code = """
+i = 0
+while (i < 3)
+    i += 1
+    continue
+    echo "while"
+endwhile
+for (j = 0; j < 2; j += 1)
+    break
+    echo "for"
+endfor
+echo "{i}"
+"""
+        eliminator, execution_tree = self.eliminate(code)
+
+        while_loop, for_loop = execution_tree.tree[1], execution_tree.tree[3]
+        self.assertEqual(len(while_loop.statements), 2)
+        # loop increment is kept
+        self.assertEqual([str(statement) for statement in for_loop.statements[1:]],
+                         [str(for_loop.loop_increment)])
+        self.assertEqual(eliminator.stats["unreachable_statements"], 2)
+        self.assertFalse(any(isinstance(statement, Echo) for statement in while_loop.statements))
+
+        self.assertEqual(run_program(code, "", tree_optimizers=[ConstantFolder(), DeadCodeEliminator()]),
+                         "3.0\n")
+
+    def test_remove_unused_variables(self):
+        code = """
+unused = 5
+name = "asl"
+count = 1
+total = count + 1
+count += 1
+x = y + 1
+echo "{total}"
+"""
+        eliminator, execution_tree = self.eliminate(code)
+
+        # x = y + 1 fails, it is not removed
+        self.assertEqual([statement.variable_name for statement in execution_tree.tree[:-1]],
+                         ["count", "total", "count", "x"])
+        self.assertEqual(eliminator.stats["unused_variables"], 2)
+        self.assertEqual(eliminator.stats["removed_symbols"], 2)
+        self.assertEqual(list(execution_tree.symbols_table.indexes), ["count", "total", "x"])
+
+        self.assertEqual(run_program(code, "", tree_optimizers=[ConstantFolder(), DeadCodeEliminator()]),
+                         run_program(code, ""))
+
+    def test_dead_code_eliminator_asl_files(self):
+        """ Asl files without dead code should produce identical output """
+
+        self.assertEqual(verify_programs(tree_optimizers=[ConstantFolder(), DeadCodeEliminator()]), {})
+
+    def tearDown(self):
+        super(DeadCodeEliminatorUnitTest, self).tearDown()
+
+
+if __name__ == '__main__':
+    unittest.main()
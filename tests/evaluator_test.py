@@ -10,6 +10,8 @@ import unittest
 
 from exceptions.language_exception import ExpressionEvaluationError
 from expression_evaluators.expression_evaluator import Evaluator
+from lexer.enhanced_lexer import EnhancedLexer
+from parser.expression_parser import ExpressionParser
 
 
 class ExpressionEvaluatorUnitTest(unittest.TestCase):
@@ -202,6 +204,99 @@ class ExpressionEvaluatorUnitTest(unittest.TestCase):
         with self.assertRaises(ExpressionEvaluationError):
             Evaluator().calculate(1,2,'@')
 
+    def test_compiled_expression_1(self):
+        evaluator = Evaluator()
+        compiled = evaluator.compile("((i < num) & (flag == 0))")
+        self.assertEqual([name for _, name in compiled.variables], ["i", "num", "flag"])
+        self.assertEqual(evaluator.evaluate_compiled(compiled, ["2.0", "5.0", "0"]), True)
+        self.assertEqual(evaluator.evaluate_compiled(compiled, ["2.0", "5.0", "1"]), False)
+
+    def test_compiled_expression_2(self):
+        evaluator = Evaluator()
+        compiled = evaluator.compile("(x -1 > 0)")
+        self.assertEqual(evaluator.evaluate_compiled(compiled, ["1.0"]), False)
+        self.assertEqual(evaluator.evaluate_compiled(compiled, ["2.0"]), True)
+
+    def test_compiled_expression_3(self):
+        evaluator = Evaluator()
+        self.assertEqual(evaluator.evaluate_compiled(evaluator.compile("1"), []), "1")
+        with self.assertRaises(ExpressionEvaluationError):
+            evaluator.evaluate_compiled(evaluator.compile("(x)"), ["1"])
+
+    def test_compiled_expression_native_values(self):
+        evaluator = Evaluator()
+        compiled = evaluator.compile("x * 2 + y")
+        self.assertEqual(compiled.registers[1], 2.0)
+        self.assertEqual(evaluator.evaluate_compiled(compiled, [3, 0.5]), 6.5)
+        self.assertEqual(evaluator.evaluate_compiled(compiled, ["3", "0.5"]), 6.5)
+        self.assertEqual(evaluator.evaluate_compiled(evaluator.compile("x == 7"), [7]), True)
+        self.assertEqual(evaluator.evaluate_compiled(evaluator.compile("x"), [0]), "0")
+        self.assertEqual(evaluator.evaluate_compiled(evaluator.compile("x"), [""]), False)
+
+    def test_expression_precedence(self):
+        evaluator = Evaluator()
+        self.assertEqual(evaluator.evaluate("2 * 3 + 1"), 7)
+        self.assertEqual(evaluator.evaluate("10 - 2 - 3"), 5)
+        self.assertEqual(evaluator.evaluate("1 + 2 * 3 == 7"), True)
+        self.assertEqual(evaluator.evaluate("(1 + 2) * 3"), 9)
+
+    def test_compile_expression_tree(self):
+        evaluator = Evaluator()
+        tokens = EnhancedLexer().tokenize_text("x - 1 - y * 2")
+        compiled = evaluator.compile("x-1-y*2", ExpressionParser().parse(tokens))
+        self.assertEqual([name for _, name in compiled.variables], ["x", "y"])
+        self.assertEqual(evaluator.evaluate_compiled(compiled, [10, 3]), 3)
+
+    def test_rpn_evaluator(self):
+        evaluator = Evaluator()
+        expressions = ["2 * 3 + 1", "10 - 2 - 3", "(1 + 2) * 3", "((7 + 2) > 4) & ((11 % 2) == 1)",
+                       "\"hafizx\" > \"hafiz\"", "(30 * 2.5) - 2", "x -1", "- 1 + x", "2"]
+        for expression in expressions:
+            # evaluating text and evaluating compiled text are the same
+            compiled = evaluator.compile(expression)
+            self.assertEqual(evaluator.evaluate(expression, {"x": 5}),
+                             evaluator.evaluate_compiled(compiled, [5] * len(compiled.variables)),
+                             expression)
+
+        self.assertEqual(evaluator.evaluate("x -1", {"x": 5}), 4)
+        self.assertEqual(evaluator.evaluate("(x) - 1", {"x": 5}), 4)
+        self.assertEqual(evaluator.evaluate("- 1 + x", {"x": 5}), 4)
+
+        for expression in ["1 == ", "10 } 20", "(1 + 2", "\"string\" + 10 / 2", "(1)"]:
+            with self.assertRaises(ExpressionEvaluationError):
+                evaluator.evaluate(expression)
+            with self.assertRaises(ExpressionEvaluationError):
+                evaluator.evaluate_compiled(evaluator.compile(expression), [])
+
+    def test_rpn_evaluator_cache(self):
+        evaluator = Evaluator(rpn_cache_size=2)
+
+        # same shape, different operands
+        self.assertEqual(evaluator.evaluate("i < n", {"i": 1, "n": 3}), True)
+        self.assertEqual(evaluator.evaluate("i < n", {"i": 5, "n": 3}), False)
+        self.assertEqual(evaluator.evaluate("5 < 1"), False)
+        self.assertEqual(evaluator.rpn_cache_info(),
+                         {"program_hits": 1, "program_misses": 1, "programs": 1,
+                          "text_hits": 1, "text_misses": 2, "texts": 2, "max_size": 2})
+
+        # compiled expression of the same text is reused
+        self.assertIs(evaluator.compile("5 < 1"), evaluator.compile("5 < 1"))
+
+        evaluator.evaluate("1 + 2 * 3")
+        evaluator.evaluate("(1 + 2) * 3")
+        # least recently used program and text are removed
+        self.assertEqual(evaluator.rpn_cache_info()["programs"], 2)
+        self.assertEqual(len(evaluator.compiled_expressions), 2)
+        self.assertEqual(evaluator.evaluate("i < 2", {"i": 1}), True)
+        self.assertEqual(evaluator.rpn_cache_misses, 4)
+
+        # expression trees are compiled without caches
+        info = evaluator.rpn_cache_info()
+        tokens = EnhancedLexer().tokenize_text("i < n")
+        compiled = evaluator.compile("i<n", ExpressionParser().parse(tokens))
+        self.assertEqual(evaluator.evaluate_compiled(compiled, [1, 3]), True)
+        self.assertEqual(evaluator.rpn_cache_info(), info)
+
     def tearDown(self):
         super(ExpressionEvaluatorUnitTest, self).tearDown()
 
@@ -10,7 +10,14 @@ from io import StringIO
 import unittest
 import sys
 
+from executors.executor import Executor
+from executors.closure_executor import ClosureExecutor
+from executors.instruction_profiler import InstructionProfiler
+from executors.output_writer import OutputWriter
+from exceptions.language_exception import ExpressionEvaluationError
+from optimizers.constant_folder import ConstantFolder
 from runners.asl_runner import AslRunner
+from symbols.symbols_table import ValueType
 
 class ExecutorUnitTest(unittest.TestCase):
     def setUp(self):
@@ -145,6 +152,86 @@ echo "user input is {var}"
 
         pass
 
+    def test_executor_native_values(self):
+        code = """
+a = 10
+b = 4.50
+c = a
+c += 1
+d = a * 2
+e = 0
+input e
+f = e + 1
+echo "{a} {b} {c} {d} {e} {f}"
+"""
+        old_stdout = sys.stdout
+        old_stdin = sys.stdin
+        sys.stdin = StringIO("7\n")
+        string_out = StringIO()
+        sys.stdout = string_out
+        AslRunner().run(code)
+        sys.stdout = old_stdout
+        sys.stdin = old_stdin
+        expected_output = """10 4.50 11.0 20.0 7 8.0
+"""
+        actual_output = string_out.getvalue()
+        self.assertEqual(actual_output, expected_output)
+
+    def test_executor_assignment_operations(self):
+        code = """
+a = 10
+a += 1
+b = 4.50
+b *= 2
+c = a
+c /= 4
+d = "text"
+echo "{a} {b} {c} {d}"
+"""
+        for executor in (Executor, ClosureExecutor):
+            output = OutputWriter(StringIO())
+            runner = AslRunner(executor=executor(output=output))
+            program = runner.compile(code)
+            runner.execute(program)
+
+            self.assertEqual(output.sink.getvalue(), "11.0 9.0 2.75 \"text\"\n")
+
+            table = program.execution_tree.symbols_table
+            self.assertEqual(table.get_entry_value("a").value_type, ValueType.REAL)
+            self.assertEqual(table.get_entry_value("b").value_type, ValueType.REAL)
+            self.assertEqual(table.get_entry_value("c").value_type, ValueType.REAL)
+            self.assertEqual(table.get_entry_value("d").value_type, ValueType.STRING)
+
+            with self.assertRaises(ValueError):
+                runner.run('s = "text"\ns += 1\n')
+
+    def test_executor_concatenation_parts(self):
+        """ concatenated values are the parts of their expression trees, folded
+            constants are concatenated as they are written """
+
+        code = """
+s = "x"
+t = s + 2 * 3
+echo "{t}"
+n = 0
+for (i = 0; n < 2; i = s + (i * (2 + 1)))
+    echo "{i}"
+    n += 1
+endfor
+"""
+        expected_output = '"x"+2*3\n0\n"x"+(0*(2+1))\n'
+
+        for executor in (Executor, ClosureExecutor):
+            for tree_optimizers in ([], [ConstantFolder()]):
+                output = OutputWriter(StringIO())
+                AslRunner(executor=executor(output=output), tree_optimizers=tree_optimizers).run(code)
+                self.assertEqual(output.sink.getvalue(), expected_output)
+
+        # values that are not expressions fail when they run, text is only used in the error
+        with self.assertRaises(ExpressionEvaluationError) as context:
+            AslRunner().run("i = 1\nfor (;i < 3; i = -(i + 1))\nendfor\n")
+        self.assertIn("-(i+1)", str(context.exception))
+
     def test_all_asl_files(self):
 
         files = [
@@ -186,6 +273,100 @@ echo "user input is {var}"
                 self.fail(f"Failed {e} in file {file_name}")
 
         pass
+
+    def test_executor_profiler(self):
+        """ profiler should count executions and time of instructions and source lines """
+
+        code = """x = 0
+while (x < 5)
+    x = x + 1
+endwhile
+echo "{x}"
+"""
+        old_stdout = sys.stdout
+        sys.stdout = StringIO()
+        try:
+            profiler = InstructionProfiler()
+            AslRunner(executor=Executor(profiler=profiler)).run(code)
+            AslRunner(executor=Executor()).run(code)
+            output = sys.stdout.getvalue()
+        finally:
+            sys.stdout = old_stdout
+
+        self.assertEqual(output, "5.0\n5.0\n")
+
+        lines = {stat['line_number']: stat for stat in profiler.line_stats()}
+        self.assertEqual(sorted(lines), [1, 2, 3, 5])
+        self.assertEqual(lines[1]['hits'], 1)
+        self.assertEqual(lines[2]['hits'], 6)
+        self.assertEqual(lines[3]['hits'], 5)
+        self.assertEqual(lines[5]['hits'], 1)
+
+        times = [stat['time'] for stat in profiler.line_stats()]
+        self.assertEqual(times, sorted(times, reverse=True))
+        self.assertEqual(sum(times), profiler.total_time())
+        self.assertEqual(sum(stat['count'] for stat in profiler.instruction_stats()),
+                         sum(profiler.counts))
+
+        report = profiler.report(limit=2).splitlines()
+        self.assertEqual(len(report), 1 + 2 + 1 + 1 + 2)
+        self.assertEqual(report[0].split(), ["line", "hits", "instructions", "time", "(ms)", "%", "code"])
+
+    def test_executor_output_writer(self):
+        """ echoed lines should be written to output sink, and before input is read """
+
+        code = """
+for (i = 0; i < 3; i += 1)
+    echo "line {i}"
+endfor
+name = 0
+echo "enter name"
+input name
+echo "hello {name}"
+"""
+
+        class PromptInput:
+            """ stdin that records output written before each line is read """
+
+            def __init__(self, sink):
+                self.sink = sink
+                self.prompts = []
+
+            def readline(self):
+                self.prompts.append(self.sink.getvalue())
+                return "asl\n"
+
+        expected_output = "line 0\nline 1.0\nline 2.0\nenter name\nhello asl\n"
+
+        for executor_class in (Executor, ClosureExecutor):
+            for buffer_size in (0, 8, 4096):
+                sink = StringIO()
+                old_stdin = sys.stdin
+                sys.stdin = PromptInput(sink)
+                try:
+                    output = OutputWriter(sink, buffer_size)
+                    AslRunner(executor=executor_class(output=output)).run(code)
+                    prompts = sys.stdin.prompts
+                finally:
+                    sys.stdin = old_stdin
+
+                self.assertEqual(sink.getvalue(), expected_output)
+                self.assertEqual(prompts, ["line 0\nline 1.0\nline 2.0\nenter name\n"])
+
+        # lines are written when buffer is full, and when program fails
+        sink = StringIO()
+        output = OutputWriter(sink, 14)
+        output.write_line("line 1")
+        self.assertEqual(sink.getvalue(), "")
+        output.write_line("line 2")
+        self.assertEqual(sink.getvalue(), "line 1\nline 2\n")
+
+        sink = StringIO()
+        with self.assertRaises(Exception):
+            AslRunner(executor=Executor(output=OutputWriter(sink))).run(
+                'echo "before error"\nx = y + 1\n')
+        self.assertEqual(sink.getvalue(), "before error\n")
+
     def tearDown(self):
         super(ExecutorUnitTest, self).tearDown()
 
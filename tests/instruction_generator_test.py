@@ -8,6 +8,14 @@ Instructions Generator Unit Test
 
 import unittest
 
+from compiler.compiler import Compiler
+from instruction_generators.instructions_generator import InstructionsGenerator
+from instructions.instruction import InstructionType
+from lexer.enhanced_lexer import EnhancedLexer
+from optimizers.peephole_optimizer import PeepholeOptimizer
+from parser.enhanced_parser import EnhancedParser
+from runners.program_verifier import run_program
+
 
 class InstructionsGeneratorUnitTest(unittest.TestCase):
 
@@ -17,6 +25,127 @@ class InstructionsGeneratorUnitTest(unittest.TestCase):
     def test_instruction_generator(self):
         pass
 
+    def test_compile_echo_string(self):
+        """ Echo string should be compiled into literal parts and variable slots """
+
+        echo_parts, echo_variables = InstructionsGenerator().compile_echo_string(
+            '"{i} is 007 and {j}"')
+
+        self.assertEqual(echo_parts, ["", " is 7 and ", ""])
+        self.assertEqual([(v.index, v.name) for v in echo_variables], [(0, "i"), (2, "j")])
+
+    def test_link_instructions(self):
+        """ Jump instructions should point to the index of their labels """
+
+        code = """
+i = 0
+while (i < 3)
+    i += 1
+    if (i == 2)
+        break
+    endif
+endwhile
+"""
+        tokens = EnhancedLexer().tokenize_text(code)
+        execution_tree = Compiler().compile(EnhancedParser().parse(tokens))
+        instructions = InstructionsGenerator().generate_instructions(execution_tree)
+
+        jumps = [instruction for instruction in instructions
+                 if instruction.type in (InstructionType.GOTO,
+                                         InstructionType.JUMP_IF,
+                                         InstructionType.JUMP_IF_NOT)]
+        self.assertTrue(jumps)
+        for jump in jumps:
+            label = instructions[jump.goto_index]
+            self.assertEqual(label.type, InstructionType.LABEL)
+            self.assertEqual(label.label_name, jump.goto_label)
+
+    def test_counted_loop_instruction(self):
+        """ Counted for loops should be generated with one counted loop instruction
+            and produce the same output as other for loops
+        """
+
+        code = """
+n = 4
+for (i = 0; i < n; i += 1)
+    if (i == 1)
+        continue
+    endif
+    echo "{i}"
+endfor
+for (j = 3; j > 0; j = j - 1.5)
+    echo "{j}"
+endfor
+s = 0
+input s
+for (k = s; k < 3; k += 1)
+    echo "{k}"
+endfor
+echo "{i} {j} {k}"
+"""
+        tokens = EnhancedLexer().tokenize_text(code)
+        execution_tree = Compiler().compile(EnhancedParser().parse(tokens))
+        instructions = InstructionsGenerator().generate_instructions(execution_tree)
+
+        counted_loops = [instruction for instruction in instructions
+                         if instruction.type == InstructionType.COUNTED_LOOP]
+        self.assertEqual(len(counted_loops), 3)
+        for instruction in counted_loops:
+            label = instructions[instruction.goto_index]
+            self.assertEqual(label.label_name, instruction.goto_label)
+
+        # input value is text, it is not counted natively
+        output = "0\n2.0\n3.0\n3\n1.5\n1\n2.0\n4.0 0.0 3.0\n"
+        self.assertEqual(run_program(code, "1\n", generator=InstructionsGenerator(counted_loops=False)),
+                         output)
+        self.assertEqual(run_program(code, "1\n"), output)
+        self.assertEqual(run_program(code, "1\n", PeepholeOptimizer()), output)
+
+    def test_instruction_line_numbers(self):
+        """ instructions should have source line of statement that generated them """
+
+        code = """x = 1
+if (x < 2)
+    echo "a"
+elif (x > 3)
+    x = 2
+fi
+for (i = 0; i < x; i += 1)
+    x = x - 1
+endfor
+"""
+        tokens = EnhancedLexer().tokenize_text(code)
+        statements = EnhancedParser().parse(tokens)
+        self.assertEqual([statement.line_number for statement in statements],
+                         [1, 2, 3, 4, 5, 6, 7, 8, 9])
+        self.assertEqual(statements[6].loop_increment.line_number, 7)
+
+        execution_tree = Compiler().compile(statements)
+        instructions = InstructionsGenerator().generate_instructions(execution_tree)
+        lines = [(instruction.line_number, instruction.type) for instruction in instructions]
+
+        self.assertEqual(lines, [
+            (1, InstructionType.VARIABLE),
+            (2, InstructionType.LABEL),
+            (2, InstructionType.JUMP_IF_NOT),
+            (3, InstructionType.ECHO),
+            (2, InstructionType.GOTO),
+            (2, InstructionType.LABEL),
+            (4, InstructionType.JUMP_IF_NOT),
+            (5, InstructionType.VARIABLE),
+            (4, InstructionType.GOTO),
+            (4, InstructionType.LABEL),
+            (2, InstructionType.LABEL),
+            (7, InstructionType.VARIABLE),
+            (7, InstructionType.LABEL),
+            (7, InstructionType.JUMP_IF_NOT),
+            (8, InstructionType.VARIABLE),
+            (7, InstructionType.LABEL),
+            (7, InstructionType.VARIABLE),
+            (7, InstructionType.GOTO),
+            (7, InstructionType.LABEL),
+        ])
+
     def tearDown(self):
         super(InstructionsGeneratorUnitTest, self).tearDown()
 
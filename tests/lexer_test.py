@@ -590,6 +590,123 @@ dd = -1 + 2 + -22 - 3 + -1
 
         self.assertEqual(expected_tokens, actual_tokens)
 
+    def test_runs_of_spaces_identifiers_and_numbers(self):
+        """
+        Test characters runs scanned at once are tokenized one token per space
+        """
+
+        code = "var_1   >= 10.5\n"
+        expected_tokens = [
+            Token(TokenType.IDENTIFICATION, 'var_1', 1),
+            Token(TokenType.SPACE, ' ', 1),
+            Token(TokenType.SPACE, ' ', 1),
+            Token(TokenType.SPACE, ' ', 1),
+            Token(TokenType.GREATERTHANOREQUAL, '>=', 1),
+            Token(TokenType.SPACE, ' ', 1),
+            Token(TokenType.REAL, '10.5', 1),
+            Token(TokenType.NEWLINE, '\n', 2)
+        ]
+        actual_tokens = EnhancedLexer().tokenize_text(
+            code, keep_spaces=True, ignore_new_lines=False)
+
+        self.assertEqual(expected_tokens, actual_tokens)
+
+    def test_regex_lexer_keeps_unknown_and_spaces(self):
+        """
+        Test regex lexer modes used to tokenize echo strings
+        """
+
+        code = "{x} is ok?\nendfor"
+        expected_tokens = [
+            Token(TokenType.IDENTIFICATIONBETWEENBRSCKETS, '{x}', 1),
+            Token(TokenType.SPACE, ' ', 1),
+            Token(TokenType.IDENTIFICATION, 'is', 1),
+            Token(TokenType.SPACE, ' ', 1),
+            Token(TokenType.IDENTIFICATION, 'ok', 1),
+            Token(TokenType.UNKNOWN, '?', 1),
+            Token(TokenType.NEWLINE, '\n', 1),
+            Token(TokenType.ENDFOR, 'endfor', 2)
+        ]
+        actual_tokens = Lexer().tokenize_text(
+            code, keep_unknown=True, keep_spaces=True, ignore_new_lines=False)
+
+        self.assertEqual(expected_tokens, actual_tokens)
+
+        with self.assertRaises(SyntaxError):
+            Lexer().tokenize_text(code)
+
+    def test_master_regex_is_shared(self):
+        """
+        Test master regex is compiled once and shared by all lexers
+        """
+
+        lexer = Lexer()
+
+        self.assertIs(lexer.build_master_regex(), Lexer().build_master_regex())
+        self.assertIs(lexer.build_master_regex(), EnhancedLexer().master_regex)
+
+        lexer.regex_list = [{'type': TokenType.NUMBER, 'regex': '^\\d+'},
+                            {'type': TokenType.SPACE, 'regex': '\\s'}]
+        lexer.master_regex = None
+
+        self.assertEqual(lexer.tokenize_text("1 2"),
+                         [Token(TokenType.NUMBER, '1', 1), Token(TokenType.NUMBER, '2', 1)])
+        self.assertIsNot(lexer.master_regex, Lexer().master_regex)
+
+    def test_tokenize_stream(self):
+        """
+        Test text read in chunks has the same tokens as the whole text, strings and
+        comments continue in next chunks
+        """
+
+        code = 'x = "multi\nline" + 1\n/* comment\n   lines */\ny = 10 -3\necho "{y}"'
+        expected_tokens = EnhancedLexer().tokenize_text(code)
+
+        for chunk_size in (1, 2, 5, 100):
+            chunks = [code[index:index + chunk_size] for index in range(0, len(code), chunk_size)]
+            self.assertEqual(expected_tokens, list(EnhancedLexer().tokenize_stream(chunks)))
+
+        self.assertEqual(expected_tokens[-1], Token(TokenType.STRING, '"{y}"', 5))
+        self.assertEqual(list(EnhancedLexer().tokenize_stream([])), [])
+
+        with self.assertRaises(SyntaxError):
+            list(EnhancedLexer().tokenize_stream(["x = 1\n", "y = ?\n"]))
+
+    def test_tokenize_stream_long_lexemes(self):
+        """
+        Test strings and comments that continue in many chunks are tokenized
+        again only after a character that can terminate them is read
+        """
+
+        code = 'x = 1\n/* ' + 'comment line\n' * 1000 + '*/\ns = "' + 'text line\n' * 1000 + '"\n'
+        chunks = [code[index:index + 8] for index in range(0, len(code), 8)]
+
+        lexer = EnhancedLexer()
+        tokenized_texts = []
+        tokenize_lines = lexer.tokenize_lines
+
+        def count_tokenize_lines(text, tokens, more_text):
+            tokenized_texts.append(text)
+            return tokenize_lines(text, tokens, more_text)
+
+        lexer.tokenize_lines = count_tokenize_lines
+
+        self.assertEqual(EnhancedLexer().tokenize_text(code), list(lexer.tokenize_stream(chunks)))
+        self.assertLess(sum(len(text) for text in tokenized_texts), 3 * len(code))
+
+    def test_compact_tokens(self):
+        """
+        Test tokens don't have __dict__ and tokens of the same lexeme share one string
+        """
+
+        tokens = EnhancedLexer().tokenize_text("total = total + 100\ntotal += 100\n")
+
+        self.assertFalse(hasattr(tokens[0], "__dict__"))
+        self.assertIs(tokens[0].match, tokens[2].match)
+        self.assertIs(tokens[0].match, tokens[5].match)
+        self.assertIs(tokens[4].match, tokens[7].match)
+        self.assertEqual(tokens[6], Token(TokenType.PLUSEQUAL, '+=', 2))
+
     def tearDown(self):
         """tearDown"""
         super(LexerUnitTest, self).tearDown()
@@ -0,0 +1,94 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Peephole Optimizer Unit Test
+
+"""
+
+import unittest
+
+from compiler.compiler import Compiler
+from executors.closure_executor import ClosureExecutor
+from instruction_generators.instructions_generator import InstructionsGenerator
+from instructions.instruction import (EchoInstruction, GotoInstruction,
+                                      InstructionType, LabelInstruction)
+from lexer.enhanced_lexer import EnhancedLexer
+from optimizers.optimizer_verifier import verify_optimizer
+from optimizers.peephole_optimizer import PeepholeOptimizer
+from parser.enhanced_parser import EnhancedParser
+from runners.program_verifier import run_program
+
+
+class PeepholeOptimizerUnitTest(unittest.TestCase):
+
+    def setUp(self):
+        super(PeepholeOptimizerUnitTest, self).setUp()
+
+    def generate_instructions(self, code):
+        tokens = EnhancedLexer().tokenize_text(code)
+        execution_tree = Compiler().compile(EnhancedParser().parse(tokens))
+        return InstructionsGenerator().generate_instructions(execution_tree)
+
+    def test_optimize_jumps(self):
+        """ Labels, gotos to gotos, unreachable code and gotos to next
+            instruction should be removed
+        """
+
+        echo_1 = EchoInstruction('"1"')
+        echo_2 = EchoInstruction('"2"')
+        goto_1 = GotoInstruction("Label_1")
+        goto_2 = GotoInstruction("Label_2")
+        instructions = [goto_1,
+                        echo_1,
+                        LabelInstruction("Label_1"),
+                        goto_2,
+                        LabelInstruction("Label_2"),
+                        echo_2]
+
+        optimizer = PeepholeOptimizer()
+        optimized = optimizer.optimize(instructions)
+
+        self.assertEqual(optimized, [echo_2])
+        self.assertEqual(optimizer.stats["labels"], 0)
+        self.assertEqual(optimizer.stats["unreachable"], 4)
+        self.assertEqual(optimizer.stats["redundant_gotos"], 1)
+
+    def test_optimize_loop(self):
+        """ Jumps should point to indexes in the optimized list """
+
+        code = """
+i = 0
+while (i < 3)
+    i += 1
+    if (i == 2)
+        continue
+    endif
+    echo "{i}"
+endwhile
+"""
+        instructions = self.generate_instructions(code)
+        optimized = PeepholeOptimizer().optimize(instructions)
+
+        self.assertLess(len(optimized), len(instructions))
+        for instruction in optimized:
+            self.assertNotEqual(instruction.type, InstructionType.LABEL)
+            if instruction.type in (InstructionType.GOTO,
+                                    InstructionType.JUMP_IF,
+                                    InstructionType.JUMP_IF_NOT):
+                self.assertTrue(0 <= instruction.goto_index <= len(optimized))
+
+        self.assertEqual(run_program(code, "", PeepholeOptimizer()), "1.0\n3.0\n")
+
+    def test_verify_asl_files(self):
+        """ Optimized asl files should produce identical output """
+
+        self.assertEqual(verify_optimizer(), {})
+        self.assertEqual(verify_optimizer(executor=ClosureExecutor()), {})
+
+    def tearDown(self):
+        super(PeepholeOptimizerUnitTest, self).tearDown()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,7 +10,10 @@ import unittest
 from lexer.enhanced_lexer import EnhancedLexer
 
 from parser.enhanced_parser import EnhancedParser
+from parser.expression_parser import ExpressionParser
+from parser.token_buffer import TokenBuffer
 from lexer.lexer import Lexer, Token, TokenType
+from statements.expression import VariableReference, expression_parts
 from statements.statement import Break, Continue, Echo, ElseIf, EndFor, EndWhile, Fi, For, If, Statement, StatementType, Variable, VariableType, While
 from exceptions.language_exception import SyntaxError
 
@@ -408,6 +411,86 @@ input var
         with self.assertRaises(SyntaxError):
             EnhancedParser().handle_syntax_error(Token(TokenType.UNKNOWN, '@', '1'), "unknown token")
 
+    def test_parse_expression_trees(self):
+        """ Test that conditions and variable values are parsed into expression
+            trees with operators precedence """
+
+        code = """
+x = 10 - 2 - 3 * a
+if ((x > 1) & (a + 2 * 3 == 7))
+    y = x
+endif
+for (i = 0; i < 2 * n; i += 1)
+endfor
+while (count)
+endwhile
+"""
+        statements = EnhancedParser().parse(EnhancedLexer().tokenize_text(code))
+
+        self.assertEqual(str(statements[0].expression_tree), "((10 - 2) - (3 * a))")
+        self.assertEqual(str(statements[1].expression_tree), "((x > 1) & ((a + (2 * 3)) == 7))")
+        self.assertEqual(str(statements[2].expression_tree), "x")
+        self.assertEqual(str(statements[4].expression_tree), "(i < (2 * n))")
+        self.assertEqual(str(statements[4].loop_initial_variable.expression_tree), "0")
+
+        # one value between parenthesis is not an expression
+        self.assertIsNone(statements[6].expression_tree)
+
+    def test_expression_parts(self):
+        """ Test that variable values keep parenthesis, their parts are in source code order """
+
+        code = """
+for (i = 0; i < 3; i = (s + (i * 2)))
+endfor
+"""
+        statements = EnhancedParser().parse(EnhancedLexer().tokenize_text(code))
+        increment = statements[0].loop_increment
+
+        self.assertEqual(str(increment.expression_tree), "(s + (i * 2))")
+        self.assertEqual(increment.expression_tree.parentheses, 1)
+
+        parts = expression_parts(increment.expression_tree)
+        self.assertEqual([part.name if isinstance(part, VariableReference) else part for part in parts],
+                         ["(", "s", "+", "(", "i", "*", "2", ")", ")"])
+
+    def test_expression_parser_errors(self):
+        """ Test that expression parser raises SyntaxError for invalid expressions """
+
+        for expression in ["1 +", "(1 + 2", "1 + 2)", "* 2"]:
+            with self.assertRaises(SyntaxError):
+                ExpressionParser().parse(EnhancedLexer().tokenize_text(expression))
+
+    def test_parse_statements_stream(self):
+        """ test tokens generator is parsed through token buffer """
+
+        code = """
+x = 1 + 2
+while (x < 10)
+    x += 1
+endwhile
+echo "{x}"
+"""
+        parser = EnhancedParser()
+        buffers = []
+
+        def tokens():
+            for token in EnhancedLexer().tokenize_text(code):
+                yield token
+            buffers.append(len(lexes.buffer))
+
+        lexes = TokenBuffer(tokens())
+        statements = list(parser.parse_statements(lexes))
+        expected_statements = EnhancedParser().parse(EnhancedLexer().tokenize_text(code))
+
+        self.assertEqual([str(statement) for statement in statements],
+                         [str(statement) for statement in expected_statements])
+        self.assertEqual(str(statements[0].expression_tree), "(1 + 2)")
+
+        # tokens of parsed statements are released, buffer holds last statement tokens
+        self.assertEqual(buffers, [2])
+        with self.assertRaises(IndexError):
+            lexes[0]
+
     def tearDown(self):
         """tearDown"""
         super(ParserUnitTest, self).tearDown()
@@ -0,0 +1,158 @@
+# Author: Hafez Irshaid <hafezkm.irshaid@wmich.edu>.
+
+"""
+
+Python Transpiler Unit Test
+
+"""
+
+from io import StringIO
+import sys
+import unittest
+
+from compiler.compiler import Compiler
+from executors.closure_executor import ClosureExecutor
+from executors.executor import Executor
+from executors.output_writer import OutputWriter
+from instruction_generators.python_transpiler import PythonTranspiler
+from lexer.enhanced_lexer import EnhancedLexer
+from parser.enhanced_parser import EnhancedParser
+from runners.asl_runner import AslRunner
+from runners.program_verifier import run_program, verify_programs
+
+
+class PythonTranspilerUnitTest(unittest.TestCase):
+
+    def setUp(self):
+        super(PythonTranspilerUnitTest, self).setUp()
+
+    def test_transpile_loops(self):
+        code = """
+sum = 0
+for (i = 0; i < 6; i += 1)
+    if (i == 2)
+        continue
+    elif (i == 4)
+        break
+    endif
+    sum += i
+    echo "{i} {sum}"
+endfor
+x = 3
+while (x > 0)
+    x -= 1
+    echo "x = {x}"
+endwhile
+"""
+        expected_output = "0 0.0\n1.0 1.0\n3.0 4.0\nx = 2.0\nx = 1.0\nx = 0.0\n"
+
+        self.assertEqual(run_program(code, ""), expected_output)
+        self.assertEqual(run_program(code, "", transpile=True), expected_output)
+
+    def test_transpile_source(self):
+        code = """
+x = 0
+while (x < 3)
+    x += 1
+endwhile
+"""
+        tokens = EnhancedLexer().tokenize_text(code)
+        execution_tree = Compiler().compile(EnhancedParser().parse(tokens))
+        transpiler = PythonTranspiler()
+        program = transpiler.transpile(execution_tree)
+        program()
+
+        self.assertIn("while True:", transpiler.source)
+        self.assertIn("v0 = (v0 if v0.__class__ is float else float(v0)) + 1", transpiler.source)
+
+        # state of previous program is reset, operands that are not number
+        # constants are converted
+        code = """
+y = 2
+s = 1.5
+y *= s
+echo "{y}"
+"""
+        tokens = EnhancedLexer().tokenize_text(code)
+        output = OutputWriter(StringIO())
+        program = transpiler.transpile(Compiler().compile(EnhancedParser().parse(tokens)), output)
+        program()
+
+        self.assertEqual(output.sink.getvalue(), "3.0\n")
+        self.assertNotIn("while True:", transpiler.source)
+        self.assertEqual(len(transpiler.initial_values), 2)
+        self.assertIn("v0 = (v0 if v0.__class__ is float else float(v0)) * "
+                      "(v1 if v1.__class__ is float else float(v1))", transpiler.source)
+
+    def test_transpile_errors(self):
+        code = """
+x = 1
+echo "before"
+echo "{y}"
+"""
+        self.assertEqual(run_program(code, ""), run_program(code, "", transpile=True))
+        self.assertEqual(run_program(code, "", transpile=True),
+                         "before\nUnknownVariable: Variable Not Found y\n")
+
+    def test_transpile_output_writer(self):
+        """ Transpiled program writes echoed lines to executor output, and before
+            input is read """
+
+        code = """
+for (i = 0; i < 3; i += 1)
+    echo "line {i}"
+endfor
+name = 0
+echo "enter name"
+input name
+echo "hello {name}"
+"""
+
+        class PromptInput:
+            """ stdin that records output written before each line is read """
+
+            def __init__(self, sink):
+                self.sink = sink
+                self.prompts = []
+
+            def readline(self):
+                self.prompts.append(self.sink.getvalue())
+                return "asl\n"
+
+        for executor_class in (Executor, ClosureExecutor):
+            for buffer_size in (0, 4096):
+                sink = StringIO()
+                old_stdin = sys.stdin
+                sys.stdin = PromptInput(sink)
+                try:
+                    output = OutputWriter(sink, buffer_size)
+                    runner = AslRunner(executor=executor_class(output=output), transpile=True)
+                    program = runner.compile(code)
+                    runner.execute(program)
+                    prompts = sys.stdin.prompts
+                finally:
+                    sys.stdin = old_stdin
+
+                self.assertIsNotNone(program.function)
+                self.assertNotIn("print", runner.transpiler.source)
+                self.assertEqual(sink.getvalue(), "line 0\nline 1.0\nline 2.0\nenter name\nhello asl\n")
+                self.assertEqual(prompts, ["line 0\nline 1.0\nline 2.0\nenter name\n"])
+
+        # buffered lines are written when program fails
+        sink = StringIO()
+        with self.assertRaises(Exception):
+            AslRunner(executor=Executor(output=OutputWriter(sink)), transpile=True).run(
+                'echo "before error"\necho "{y}"\n')
+        self.assertEqual(sink.getvalue(), "before error\n")
+
+    def test_transpile_asl_files(self):
+        """ Transpiled asl files should produce identical output """
+
+        self.assertEqual(verify_programs(transpile=True), {})
+
+    def tearDown(self):
+        super(PythonTranspilerUnitTest, self).tearDown()
+
+
+if __name__ == '__main__':
+    unittest.main()
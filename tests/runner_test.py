@@ -6,8 +6,22 @@ Executor Unit Test
 
 """
 
+from io import StringIO
+import json
+import os
+import sys
+import tempfile
 import unittest
 
+from executors.closure_executor import ClosureExecutor
+from expression_evaluators.expression_evaluator import Evaluator
+from instruction_generators.instructions_generator import InstructionsGenerator
+from lexer.enhanced_lexer import EnhancedLexer
+from runners.asl_runner import AslRunner
+from runners.batch_runner import BatchRunner, find_scripts
+from runners.bytecode_cache import BytecodeCache
+from runners.stage_timings import StageTimings
+
 class RunnerUnitTest(unittest.TestCase):
     def setUp(self):
         super(RunnerUnitTest, self).setUp()
@@ -16,6 +30,229 @@ class RunnerUnitTest(unittest.TestCase):
         
         pass
 
+    def run_code(self, runner, code):
+        old_stdout = sys.stdout
+        sys.stdout = StringIO()
+        try:
+            runner.run(code)
+            return sys.stdout.getvalue()
+        finally:
+            sys.stdout = old_stdout
+
+    def test_runner_bytecode_cache(self):
+        code = """
+sum = 0
+for (i = 0; i < 5; i += 1)
+    sum += i
+endfor
+echo "sum {sum}"
+"""
+        with tempfile.TemporaryDirectory() as cache_folder:
+            cache = BytecodeCache(cache_folder)
+
+            # first run compiles and stores program, next runs load it
+            self.assertEqual(self.run_code(AslRunner(cache=cache), code), "sum 10.0\n")
+            self.assertEqual((cache.hits, cache.misses), (0, 1))
+            self.assertEqual(self.run_code(AslRunner(cache=cache), code), "sum 10.0\n")
+            self.assertEqual(self.run_code(AslRunner(cache=cache), code), "sum 10.0\n")
+            self.assertEqual((cache.hits, cache.misses), (2, 1))
+            self.assertEqual(len(os.listdir(cache_folder)), 1)
+
+            # corrupted cache file is ignored and replaced
+            cache_path = os.path.join(cache_folder, os.listdir(cache_folder)[0])
+            with open(cache_path, "wb") as file:
+                file.write(b"ASLC corrupted")
+            self.assertEqual(self.run_code(AslRunner(cache=cache), code), "sum 10.0\n")
+            self.assertEqual((cache.hits, cache.misses), (2, 2))
+            self.assertEqual(self.run_code(AslRunner(cache=cache), code), "sum 10.0\n")
+            self.assertEqual((cache.hits, cache.misses), (3, 2))
+
+            # changed code has a different key
+            self.assertEqual(self.run_code(AslRunner(cache=cache), code.replace("5", "3")),
+                             "sum 3.0\n")
+            self.assertEqual(len(os.listdir(cache_folder)), 2)
+
+            # components configured differently compile to a different key
+            generator = InstructionsGenerator(counted_loops=False)
+            self.assertEqual(self.run_code(AslRunner(cache=cache, generator=generator), code),
+                             "sum 10.0\n")
+            self.assertEqual((cache.hits, cache.misses), (3, 4))
+            self.assertNotEqual(cache.cache_key(code, [InstructionsGenerator()]),
+                                cache.cache_key(code, [generator]))
+            self.assertNotEqual(cache.cache_key(code, [Evaluator()]),
+                                cache.cache_key(code, [Evaluator(rpn_cache_size=16)]))
+            self.assertEqual(cache.cache_key(code, [InstructionsGenerator(), None]),
+                             cache.cache_key(code, [InstructionsGenerator(), None]))
+
+        # default cache folder is a folder of the user
+        old_cache_home = os.environ.get("XDG_CACHE_HOME")
+        os.environ["XDG_CACHE_HOME"] = os.path.join("home", "user", ".cache")
+        try:
+            self.assertEqual(BytecodeCache().cache_folder, os.path.join("home", "user", ".cache", "asl"))
+        finally:
+            if old_cache_home is None:
+                del os.environ["XDG_CACHE_HOME"]
+            else:
+                os.environ["XDG_CACHE_HOME"] = old_cache_home
+
+    def test_runner_run_file(self):
+        code = """
+count = 0
+while (count < 3)
+    count += 1
+    echo "line {count}"
+endwhile
+"""
+        with tempfile.TemporaryDirectory() as folder:
+            filename = os.path.join(folder, "program.asl")
+            with open(filename, "w") as file:
+                file.write(code)
+
+            output = self.run_code(AslRunner(), code)
+            self.assertEqual(output, "line 1.0\nline 2.0\nline 3.0\n")
+
+            old_stdout = sys.stdout
+            sys.stdout = StringIO()
+            try:
+                AslRunner().run_file(filename, chunk_size=7)
+                cache = BytecodeCache(os.path.join(folder, "cache"))
+                AslRunner(cache=cache).run_file(filename, chunk_size=7)
+                AslRunner(cache=cache).run_file(filename)
+                file_output = sys.stdout.getvalue()
+            finally:
+                sys.stdout = old_stdout
+
+            self.assertEqual(file_output, output * 3)
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+            # file text chunks have the same key as the text
+            self.assertEqual(self.run_code(AslRunner(cache=cache), code), output)
+            self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    def test_runner_timings(self):
+        code = """
+x = 0
+for (i = 0; i < 3; i += 1)
+    x += i
+endfor
+echo "{x}"
+"""
+        timings = StageTimings()
+        self.assertEqual(self.run_code(AslRunner(timings=timings), code), "3.0\n")
+
+        stages = {stage['name']: stage for stage in timings.stages}
+        self.assertEqual(list(stages), ["lex", "parse", "compile", "generate", "execute"])
+        self.assertEqual((stages["lex"]['size'], stages["lex"]['size_name']),
+                         (len(EnhancedLexer().tokenize_text(code)), "tokens"))
+        self.assertEqual(stages["parse"]['size'], 5)
+        self.assertEqual(stages["generate"]['size_name'], "instructions")
+        for stage in timings.stages:
+            self.assertGreaterEqual(stage['wall'], 0)
+            self.assertGreater(stage['peak'], 0)
+
+        report = json.loads(timings.to_json())
+        self.assertEqual([stage['name'] for stage in report['stages']], list(stages))
+        self.assertAlmostEqual(report['total']['wall'],
+                               sum(stage['wall'] for stage in timings.stages))
+        self.assertEqual(len(timings.report().splitlines()), len(stages) + 2)
+
+        # stages of cached programs, memory is not traced
+        with tempfile.TemporaryDirectory() as folder:
+            filename = os.path.join(folder, "program.asl")
+            with open(filename, "w") as file:
+                file.write(code)
+
+            cache = BytecodeCache(os.path.join(folder, "cache"))
+            old_stdout = sys.stdout
+            sys.stdout = StringIO()
+            try:
+                AslRunner(cache=cache).run_file(filename)
+                timings = StageTimings(trace_memory=False)
+                AslRunner(cache=cache, timings=timings).run_file(filename)
+                output = sys.stdout.getvalue()
+            finally:
+                sys.stdout = old_stdout
+
+            self.assertEqual(output, "3.0\n" * 2)
+            self.assertEqual([stage['name'] for stage in timings.stages],
+                             ["read", "cache load", "execute"])
+            self.assertEqual([stage['peak'] for stage in timings.stages], [None] * 3)
+
+    def test_runner_compile_once_run_many(self):
+        code = """
+x = 0
+s = "a"
+for (i = 0; i < 3; i += 1)
+    x += i
+    s = s + "b"
+endfor
+echo "{x} {s}"
+"""
+        output = '3.0 "a"+"b"+"b"+"b"\n'
+
+        for runner in (AslRunner(), AslRunner(transpile=True),
+                       AslRunner(executor=ClosureExecutor())):
+            program = runner.compile(code)
+
+            old_stdout = sys.stdout
+            sys.stdout = StringIO()
+            try:
+                # variables are restored before each run
+                for _ in range(3):
+                    runner.execute(program)
+                runs_output = sys.stdout.getvalue()
+            finally:
+                sys.stdout = old_stdout
+
+            self.assertEqual(runs_output, output * 3)
+            self.assertEqual(program.runs, 3)
+
+            # the same runner runs other programs
+            self.assertEqual(self.run_code(runner, 'echo "short"\n'), "short\n")
+            self.assertEqual(self.run_code(runner, code), output)
+
+        self.assertIsNone(AslRunner().compile(""))
+
+    def test_batch_runner(self):
+        scripts = {
+            "count.asl": 'for (i = 0; i < 3; i += 1)\n    echo "{i}"\nendfor\n',
+            "hello.asl": 'echo "hello"\n',
+            "nested/unknown.asl": 'echo "before"\nx = y + 1\n',
+            "nested/input.asl": 'x = 0\ninput x\necho "{x}"\n',
+        }
+
+        with tempfile.TemporaryDirectory() as folder:
+            for name, code in scripts.items():
+                filename = os.path.join(folder, name)
+                os.makedirs(os.path.dirname(filename), exist_ok=True)
+                with open(filename, "w") as file:
+                    file.write(code)
+
+            filenames = find_scripts([os.path.join(folder, "*.asl"), folder])
+            self.assertEqual([os.path.relpath(filename, folder) for filename in filenames],
+                             ["count.asl", "hello.asl", "nested/input.asl", "nested/unknown.asl"])
+
+            summary = BatchRunner(workers=2, cache=False, input="7\n").run(filenames)
+            results = summary['results']
+
+            self.assertEqual((summary['files'], summary['passed'], summary['failed']), (4, 3, 1))
+            self.assertEqual([result['status'] for result in results], ["ok", "ok", "ok", "error"])
+            self.assertEqual([result['output'] for result in results],
+                             ["0\n1.0\n2.0\n", "hello\n", "7\n", "before\n"])
+            self.assertEqual(results[3]['exit_code'], 1)
+            self.assertTrue(results[3]['error'].startswith("UnknownVariable"))
+            self.assertTrue(all(result['wall'] >= 0 for result in results))
+
+            # output of each script is written to its own file
+            output_dir = os.path.join(folder, "output")
+            summary = BatchRunner(workers=1, cache=False).run(filenames[:2], output_dir)
+            with open(summary['results'][1]['output_file']) as file:
+                self.assertEqual(file.read(), "hello\n")
+            json.dumps(summary)
+
+        with self.assertRaises(ValueError):
+            BatchRunner(transpiled=True)
+
     def tearDown(self):
         super(RunnerUnitTest, self).tearDown()
 
@@ -8,7 +8,7 @@ Symbols Table Unit Testing
 
 import unittest
 
-from symbols.symbols_table import SymbolTable, SymbolsType
+from symbols.symbols_table import SymbolTable, SymbolsType, ValueType, native_value
 
 
 class SymbolsTableUnitTest(unittest.TestCase):
@@ -55,6 +55,87 @@ class SymbolsTableUnitTest(unittest.TestCase):
         with self.assertRaises(Exception):
             table.modify_entry("var", "1")
 
+    def test_symbols_table_slot(self):
+        """ test_symbols_table_slot:
+                slot reads and writes entry value through values array by index
+        """
+
+        table = SymbolTable()
+        table.add_entry("var1", "1", SymbolsType.NUMBER)
+        table.add_entry("var2", "2", SymbolsType.NUMBER)
+
+        slot = table.get_slot("var2")
+        self.assertEqual(slot.index, 1)
+        self.assertEqual(slot.values[slot.index], "2")
+
+        slot.values[slot.index] = "3"
+        self.assertEqual(table.get_entry_value("var2").value, "3")
+        self.assertEqual(table.get_slot("var3"), None)
+
+    def test_symbols_table_array_backed(self):
+        """ test_symbols_table_array_backed:
+                array backed table doesn't keep entry objects, entries read
+                and write values array.
+        """
+
+        table = SymbolTable(array_backed=True)
+        table.add_entry("var1", "1", SymbolsType.NUMBER)
+        table.modify_entry("var1", "2")
+
+        self.assertEqual(table.symbol_table, {})
+        self.assertEqual(table.indexes, {"var1": 0})
+        self.assertEqual(table.values, ["2"])
+
+        entry = table.get_entry_value("var1")
+        self.assertEqual(entry.name, "var1")
+        self.assertEqual(entry.value, "2")
+        self.assertEqual(entry.type, SymbolsType.NUMBER)
+
+        entry.value = "3"
+        self.assertEqual(table.values, ["3"])
+        self.assertEqual(table.get_entry_value("var2"), None)
+        with self.assertRaises(Exception):
+            table.modify_entry("var2", "1")
+
+    def test_symbols_table_native_values(self):
+        """ test_symbols_table_native_values:
+                numbers are stored natively as int and float unless they would be
+                printed differently, entries have value type tags.
+        """
+
+        self.assertEqual(native_value("10"), 10)
+        self.assertEqual(native_value("-10"), -10)
+        self.assertEqual(native_value("3.5"), 3.5)
+        self.assertEqual(native_value("4.50"), "4.50")
+        self.assertEqual(native_value("007"), "007")
+        self.assertEqual(native_value('"hello"'), '"hello"')
+
+        table = SymbolTable()
+        table.add_entry("var1", native_value("10"))
+        table.add_entry("var2", native_value("2.5"))
+        table.add_entry("var3", '"hello"')
+        table.add_entry("var4", ["1", "2"])
+        table.add_entry("var5", True)
+        table.add_entry("var6", None)
+
+        self.assertEqual(table.get_entry_value("var1").value_type, ValueType.INTEGER)
+        self.assertEqual(table.get_entry_value("var2").value_type, ValueType.REAL)
+        self.assertEqual(table.get_entry_value("var3").value_type, ValueType.STRING)
+        self.assertEqual(table.get_entry_value("var4").value_type, ValueType.ARRAY)
+        self.assertEqual(table.get_entry_value("var5").value_type, ValueType.BOOLEAN)
+        self.assertEqual(table.get_entry_value("var6").value_type, ValueType.NONE)
+
+        # tags are stored when values are written
+        snapshot = table.snapshot()
+        table.modify_entry("var1", "text")
+        table.get_entry_value("var2").value = False
+        self.assertEqual(table.value_types[0], ValueType.STRING)
+        self.assertEqual(table.get_entry_value("var2").value_type, ValueType.BOOLEAN)
+
+        table.restore(snapshot)
+        self.assertEqual(table.get_entry_value("var1").value_type, ValueType.INTEGER)
+        self.assertEqual(table.get_entry_value("var2").value_type, ValueType.REAL)
+
     def tearDown(self):
         """ tearDown """
         super(SymbolsTableUnitTest, self).tearDown()